@@ -0,0 +1,25 @@
+#include <stdint.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include "prove_region.h"
+#include "prove_input_output.h"
+#include "prove_runtime.h"
+#include "prove_string.h"
+
+
+static struct { Prove_Header header; int64_t length; char data[18]; } _str_lit_0 = { { INT32_MAX }, 17, "Hello from Prove!" };
+
+const char *__prove_binary_path = NULL;
+
+int main(int argc, char **argv) {
+    __prove_binary_path = argv[0];
+    prove_runtime_init();
+    prove_io_init_args(argc, argv);
+    prove_println((Prove_String*)&_str_lit_0);
+
+    prove_runtime_cleanup();
+    return 0;
+}
+
@@ -0,0 +1,5 @@
+/* No Python FFI — empty bundle. */
+#pragma once
+#include <stddef.h>
+static const unsigned char prove_bundle_zip[] = {};
+static const size_t prove_bundle_zip_len = 0;
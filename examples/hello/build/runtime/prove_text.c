@@ -0,0 +1,369 @@
+#define _GNU_SOURCE  /* memmem */
+#include "prove_text.h"
+#include <ctype.h>
+#include <string.h>
+
+/* ── String queries ──────────────────────────────────────────── */
+
+int64_t prove_text_length(Prove_String *s) {
+    return s->length;
+}
+
+Prove_String *prove_text_slice(Prove_String *s, int64_t start, int64_t end) {
+    if (start < 0) start = 0;
+    if (end > s->length) end = s->length;
+    if (start >= end) return prove_string_new("", 0);
+    return prove_string_new(s->data + start, end - start);
+}
+
+bool prove_text_starts_with(Prove_String *s, Prove_String *prefix) {
+    if (prefix->length > s->length) return false;
+    return memcmp(s->data, prefix->data, (size_t)prefix->length) == 0;
+}
+
+bool prove_text_ends_with(Prove_String *s, Prove_String *suffix) {
+    if (suffix->length > s->length) return false;
+    int64_t offset = s->length - suffix->length;
+    return memcmp(s->data + offset, suffix->data, (size_t)suffix->length) == 0;
+}
+
+bool prove_text_contains(Prove_String *s, Prove_String *sub) {
+    if (sub->length == 0) return true;
+    if (sub->length > s->length) return false;
+    return memmem(s->data, (size_t)s->length,
+                  sub->data, (size_t)sub->length) != NULL;
+}
+
+Prove_Option prove_text_index_of(Prove_String *s, Prove_String *sub) {
+    if (sub->length == 0) return prove_option_some((Prove_Value*)(intptr_t)0);
+    if (sub->length > s->length) return prove_option_none();
+    const char *found = (const char *)memmem(s->data, (size_t)s->length,
+                                              sub->data, (size_t)sub->length);
+    if (!found) return prove_option_none();
+    return prove_option_some((Prove_Value*)(intptr_t)(found - s->data));
+}
+
+/* ── String transformations ──────────────────────────────────── */
+
+Prove_List *prove_text_split(Prove_String *s, Prove_String *sep) {
+    Prove_List *list = prove_list_new(8);
+    if (s->length == 0) {
+        return list;
+    }
+    if (sep->length == 0) {
+        /* Empty separator: return list with the original string */
+        Prove_String *copy = prove_string_new(s->data, s->length);
+        prove_list_push(list, copy);
+        return list;
+    }
+
+    const char *start = s->data;
+    const char *end = s->data + s->length;
+    size_t sep_len = (size_t)sep->length;
+
+    if (sep_len == 1) {
+        /* Fast path: single-char separator uses memchr */
+        char sc = sep->data[0];
+        while (start <= end) {
+            const char *found = (start < end)
+                ? (const char *)memchr(start, sc, (size_t)(end - start))
+                : NULL;
+            if (found) {
+                prove_list_push(list, prove_string_new(start, (int64_t)(found - start)));
+                start = found + 1;
+            } else {
+                prove_list_push(list, prove_string_new(start, (int64_t)(end - start)));
+                break;
+            }
+        }
+    } else {
+        while (start <= end) {
+            const char *found = NULL;
+            if (start < end) {
+                found = (const char *)memmem(start, (size_t)(end - start),
+                                             sep->data, sep_len);
+            }
+            if (found) {
+                prove_list_push(list, prove_string_new(start, (int64_t)(found - start)));
+                start = found + sep_len;
+            } else {
+                prove_list_push(list, prove_string_new(start, (int64_t)(end - start)));
+                break;
+            }
+        }
+    }
+
+    return list;
+}
+
+Prove_String *prove_text_join(Prove_List *parts, Prove_String *sep) {
+    if (parts->length == 0) return prove_string_new("", 0);
+
+    /* Calculate total length */
+    int64_t total = 0;
+    for (int64_t i = 0; i < parts->length; i++) {
+        Prove_String *sp = (Prove_String *)prove_list_get(parts, i);
+        if (sp) total += sp->length;
+        if (i > 0) total += sep->length;
+    }
+
+    Prove_String *result = (Prove_String *)prove_alloc(
+        sizeof(Prove_String) + (size_t)total + 1
+    );
+    result->length = total;
+
+    char *dst = result->data;
+    for (int64_t i = 0; i < parts->length; i++) {
+        if (i > 0 && sep->length > 0) {
+            memcpy(dst, sep->data, (size_t)sep->length);
+            dst += sep->length;
+        }
+        Prove_String *sp = (Prove_String *)prove_list_get(parts, i);
+        if (sp && sp->length > 0) {
+            memcpy(dst, sp->data, (size_t)sp->length);
+            dst += sp->length;
+        }
+    }
+    result->data[total] = '\0';
+
+    return result;
+}
+
+Prove_String *prove_text_trim(Prove_String *s) {
+    if (s->length == 0) return prove_string_new("", 0);
+
+    int64_t start = 0;
+    int64_t end = s->length;
+    while (start < end && isspace((unsigned char)s->data[start])) start++;
+    while (end > start && isspace((unsigned char)s->data[end - 1])) end--;
+
+    return prove_string_new(s->data + start, end - start);
+}
+
+Prove_String *prove_text_to_lower(Prove_String *s) {
+    Prove_String *result = (Prove_String *)prove_alloc(
+        sizeof(Prove_String) + (size_t)s->length + 1
+    );
+    result->length = s->length;
+    for (int64_t i = 0; i < s->length; i++) {
+        result->data[i] = (char)tolower((unsigned char)s->data[i]);
+    }
+    result->data[s->length] = '\0';
+    return result;
+}
+
+Prove_String *prove_text_to_upper(Prove_String *s) {
+    Prove_String *result = (Prove_String *)prove_alloc(
+        sizeof(Prove_String) + (size_t)s->length + 1
+    );
+    result->length = s->length;
+    for (int64_t i = 0; i < s->length; i++) {
+        result->data[i] = (char)toupper((unsigned char)s->data[i]);
+    }
+    result->data[s->length] = '\0';
+    return result;
+}
+
+/* Forward declaration */
+static Prove_Builder *_builder_grow(Prove_Builder *b, int64_t needed);
+
+/* Write raw bytes to a builder (no null-terminator required) */
+static Prove_Builder *_builder_write_raw(Prove_Builder *b, const char *data, int64_t len) {
+    if (len <= 0) return b;
+    if (b->length + len > b->capacity) {
+        b = _builder_grow(b, len);
+    }
+    memcpy(b->data + b->length, data, (size_t)len);
+    b->length += len;
+    return b;
+}
+
+Prove_String *prove_text_replace(Prove_String *s, Prove_String *old_s, Prove_String *new_s) {
+    if (old_s->length == 0) {
+        return prove_string_new(s->data, s->length);
+    }
+
+    /* Single-pass replace using a builder */
+    const char *src = s->data;
+    const char *end = s->data + s->length;
+    Prove_Builder *b = NULL;
+
+    while (src + old_s->length <= end) {
+        const char *found = (const char *)memmem(
+            src, (size_t)(end - src), old_s->data, (size_t)old_s->length);
+        if (!found) break;
+
+        /* Lazily create builder on first match */
+        if (!b) b = prove_text_builder();
+
+        /* Write segment before the match, then the replacement */
+        b = _builder_write_raw(b, src, (int64_t)(found - src));
+        b = _builder_write_raw(b, new_s->data, new_s->length);
+        src = found + old_s->length;
+    }
+
+    /* No matches found — return a copy of the original */
+    if (!b) return prove_string_new(s->data, s->length);
+
+    /* Write remaining tail */
+    b = _builder_write_raw(b, src, (int64_t)(end - src));
+    return prove_text_build(b);
+}
+
+Prove_String *prove_text_replace_map(Prove_String *s, Prove_List *old_list, Prove_List *new_list) {
+#ifndef PROVE_RELEASE
+    if (old_list->length != new_list->length) {
+        return prove_string_new(s->data, s->length);
+    }
+#endif
+    if (old_list->length == 0) {
+        return prove_string_new(s->data, s->length);
+    }
+
+    /* Apply replacements sequentially: result of one feeds the next */
+    Prove_String *current = prove_string_new(s->data, s->length);
+    for (int64_t i = 0; i < old_list->length; i++) {
+        Prove_String *old_s = (Prove_String *)old_list->data[i];
+        Prove_String *new_s = (Prove_String *)new_list->data[i];
+        Prove_String *next = prove_text_replace(current, old_s, new_s);
+        prove_release(&current->header);
+        current = next;
+    }
+    return current;
+}
+
+Prove_String *prove_text_replace_many_to_one(Prove_String *s, Prove_List *old_list, Prove_String *new_s) {
+    if (old_list->length == 0) {
+        return prove_string_new(s->data, s->length);
+    }
+    Prove_String *current = prove_string_new(s->data, s->length);
+    for (int64_t i = 0; i < old_list->length; i++) {
+        Prove_String *old_s = (Prove_String *)old_list->data[i];
+        Prove_String *next = prove_text_replace(current, old_s, new_s);
+        prove_release(&current->header);
+        current = next;
+    }
+    return current;
+}
+
+Prove_String *prove_text_replace_one_to_many(Prove_String *s, Prove_String *old_s, Prove_List *new_list) {
+    if (old_s->length == 0 || new_list->length == 0) {
+        return prove_string_new(s->data, s->length);
+    }
+    Prove_Builder *b = NULL;
+    const char *src = s->data;
+    const char *end = s->data + s->length;
+    int64_t idx = 0;
+
+    while (src + old_s->length <= end) {
+        const char *found = (const char *)memmem(
+            src, (size_t)(end - src), old_s->data, (size_t)old_s->length);
+        if (!found) break;
+
+        if (!b) b = prove_text_builder();
+        b = _builder_write_raw(b, src, (int64_t)(found - src));
+
+        if (idx < new_list->length) {
+            Prove_String *rep = (Prove_String *)new_list->data[idx];
+            b = _builder_write_raw(b, rep->data, rep->length);
+            idx++;
+        }
+        src = found + old_s->length;
+    }
+
+    if (!b) return prove_string_new(s->data, s->length);
+    b = _builder_write_raw(b, src, (int64_t)(end - src));
+    return prove_text_build(b);
+}
+
+Prove_String *prove_text_repeat(Prove_String *s, int64_t n) {
+    if (n <= 0) return prove_string_new("", 0);
+    if (s->length > 0 && n > INT64_MAX / s->length) {
+        prove_panic("Text.repeat: length overflow");
+    }
+    int64_t new_len = s->length * n;
+    Prove_String *result = (Prove_String *)prove_alloc(
+        sizeof(Prove_String) + (size_t)new_len + 1
+    );
+    result->length = new_len;
+    char *dst = result->data;
+    for (int64_t i = 0; i < n; i++) {
+        memcpy(dst, s->data, (size_t)s->length);
+        dst += s->length;
+    }
+    result->data[new_len] = '\0';
+    return result;
+}
+
+/* ── Builder ─────────────────────────────────────────────────── */
+
+#define BUILDER_INITIAL_CAP 256
+
+Prove_Builder *prove_text_builder(void) {
+    Prove_Builder *b = (Prove_Builder *)prove_alloc(
+        sizeof(Prove_Builder) + BUILDER_INITIAL_CAP
+    );
+    b->length = 0;
+    b->capacity = BUILDER_INITIAL_CAP;
+    return b;
+}
+
+static Prove_Builder *_builder_grow(Prove_Builder *b, int64_t needed) {
+    int64_t new_cap = b->capacity;
+    while (new_cap < b->length + needed) {
+        new_cap *= 2;
+    }
+    Prove_Builder *new_b = (Prove_Builder *)realloc(b, sizeof(Prove_Builder) + (size_t)new_cap);
+    if (!new_b) prove_panic("Builder realloc failed");
+    new_b->capacity = new_cap;
+    return new_b;
+}
+
+Prove_Builder *prove_text_write(Prove_Builder *b, Prove_String *s) {
+    if (s->length == 0) return b;
+    if (b->length + s->length > b->capacity) {
+        b = _builder_grow(b, s->length);
+    }
+    memcpy(b->data + b->length, s->data, (size_t)s->length);
+    b->length += s->length;
+    return b;
+}
+
+Prove_Builder *prove_text_write_char(Prove_Builder *b, char c) {
+    if (b->length + 1 > b->capacity) {
+        b = _builder_grow(b, 1);
+    }
+    b->data[b->length] = c;
+    b->length++;
+    return b;
+}
+
+Prove_Builder *prove_text_write_cstr(Prove_Builder *b, const char *cstr) {
+    if (!cstr) return b;
+    int64_t len = (int64_t)strlen(cstr);
+    if (len == 0) return b;
+    if (b->length + len > b->capacity) {
+        b = _builder_grow(b, len);
+    }
+    memcpy(b->data + b->length, cstr, (size_t)len);
+    b->length += len;
+    return b;
+}
+
+Prove_Builder *prove_text_write_bytes(Prove_Builder *b, const char *src, int64_t len) {
+    if (len <= 0) return b;
+    if (b->length + len > b->capacity) {
+        b = _builder_grow(b, len);
+    }
+    memcpy(b->data + b->length, src, (size_t)len);
+    b->length += len;
+    return b;
+}
+
+Prove_String *prove_text_build(Prove_Builder *b) {
+    return prove_string_new(b->data, b->length);
+}
+
+int64_t prove_text_builder_length(Prove_Builder *b) {
+    return b->length;
+}
@@ -0,0 +1,2 @@
+/* All functions inlined in prove_math.h */
+#include "prove_math.h"
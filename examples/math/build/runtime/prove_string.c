@@ -0,0 +1,143 @@
+#include "prove_string.h"
+#include <stdio.h>
+#include <string.h>
+#include <inttypes.h>
+
+Prove_String *prove_string_new(const char *src, int64_t len) {
+    Prove_String *s = (Prove_String *)prove_alloc(sizeof(Prove_String) + (size_t)len + 1);
+    s->length = len;
+    if (src && len > 0) {
+        memcpy(s->data, src, (size_t)len);
+    }
+    s->data[len] = '\0';
+    return s;
+}
+
+Prove_String *prove_string_new_region(ProveRegion *r, const char *src, int64_t len) {
+    Prove_String *s = (Prove_String *)prove_region_alloc(r, sizeof(Prove_String) + (size_t)len + 1);
+    if (!s) prove_panic("region alloc failed for string");
+    s->length = len;
+    if (src && len > 0) {
+        memcpy(s->data, src, (size_t)len);
+    }
+    s->data[len] = '\0';
+    return s;
+}
+
+Prove_String *prove_string_from_cstr(const char *src) {
+    if (!src) return prove_string_new("", 0);
+    int64_t len = (int64_t)strlen(src);
+    return prove_string_new(src, len);
+}
+
+Prove_String *prove_string_from_cstr_region(ProveRegion *r, const char *src) {
+    if (!src) return prove_string_new_region(r, "", 0);
+    int64_t len = (int64_t)strlen(src);
+    return prove_string_new_region(r, src, len);
+}
+
+Prove_String *prove_string_concat(Prove_String *a, Prove_String *b) {
+#ifndef PROVE_RELEASE
+    if (!a) { if (b) prove_retain(b); return b; }
+    if (!b) { prove_retain(a); return a; }
+#endif
+    if (a->length == 0) { prove_retain(b); return b; }
+    if (b->length == 0) { prove_retain(a); return a; }
+    int64_t new_len = a->length + b->length;
+    Prove_String *s = (Prove_String *)prove_alloc(sizeof(Prove_String) + (size_t)new_len + 1);
+    s->length = new_len;
+    memcpy(s->data, a->data, (size_t)a->length);
+    memcpy(s->data + a->length, b->data, (size_t)b->length);
+    s->data[new_len] = '\0';
+    return s;
+}
+
+bool prove_string_eq(Prove_String *a, Prove_String *b) {
+    if (a == b) return true;
+#ifndef PROVE_RELEASE
+    if (!a || !b) return false;
+#endif
+    if (a->length != b->length) return false;
+    return memcmp(a->data, b->data, (size_t)a->length) == 0;
+}
+
+int64_t prove_string_len(Prove_String *s) {
+#ifndef PROVE_RELEASE
+    if (!s) return 0;
+#endif
+    return s->length;
+}
+
+Prove_String *prove_string_from_int(int64_t val) {
+    /* Fast path: hand-rolled conversion avoids snprintf overhead */
+    char buf[22]; /* max: -9223372036854775808 = 20 digits + sign + NUL */
+    char *end = buf + sizeof(buf) - 1;
+    *end = '\0';
+    char *p = end;
+    bool neg = val < 0;
+    /* Handle INT64_MIN safely: -(INT64_MIN) overflows, use unsigned */
+    uint64_t uval = neg ? (val == INT64_MIN ? ((uint64_t)INT64_MAX + 1u)
+                                            : (uint64_t)(-val))
+                        : (uint64_t)val;
+    do {
+        *--p = '0' + (int)(uval % 10);
+        uval /= 10;
+    } while (uval);
+    if (neg) *--p = '-';
+    return prove_string_new(p, (int64_t)(end - p));
+}
+
+Prove_String *prove_string_from_double(double val) {
+    char buf[64];
+    int n = snprintf(buf, sizeof(buf), "%g", val);
+    return prove_string_new(buf, (int64_t)n);
+}
+
+static Prove_String *_str_true = NULL;
+static Prove_String *_str_false = NULL;
+
+void prove_string_init_statics(void) {
+    _str_true = prove_string_from_cstr("true");
+    _str_true->header.refcount = INT32_MAX;
+    _str_false = prove_string_from_cstr("false");
+    _str_false->header.refcount = INT32_MAX;
+}
+
+Prove_String *prove_string_from_bool(bool val) {
+    if (__builtin_expect(_str_true == NULL, 0)) prove_string_init_statics();
+    return val ? _str_true : _str_false;
+}
+
+Prove_String *prove_string_from_char(char val) {
+    char buf[2] = {val, '\0'};
+    return prove_string_new(buf, 1);
+}
+
+void prove_println(Prove_String *s) {
+    if (s) {
+        fwrite(s->data, 1, (size_t)s->length, stdout);
+    }
+    fputc('\n', stdout);
+}
+
+void prove_print(Prove_String *s) {
+    if (s) {
+        fwrite(s->data, 1, (size_t)s->length, stdout);
+    }
+}
+
+Prove_String *prove_readln(void) {
+    char buf[4096];
+    if (!fgets(buf, sizeof(buf), stdin)) {
+        return NULL;
+    }
+    /* Strip trailing newline */
+    size_t len = strlen(buf);
+    if (len > 0 && buf[len - 1] == '\n') {
+        buf[--len] = '\0';
+    }
+    if (len > 0 && buf[len - 1] == '\r') {
+        buf[--len] = '\0';
+    }
+    return prove_string_new(buf, (int64_t)len);
+}
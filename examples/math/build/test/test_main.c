@@ -0,0 +1,168 @@
+#include <stdint.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include "prove_region.h"
+#include "prove_convert.h"
+#include "prove_input_output.h"
+#include "prove_runtime.h"
+#include "prove_string.h"
+
+
+__attribute__((const)) int64_t prv_derives_add_Integer_Integer(int64_t a, int64_t b);
+__attribute__((const)) int64_t prv_derives_double_Integer(int64_t n);
+__attribute__((const)) int64_t prv_derives_abs_Integer(int64_t n);
+
+__attribute__((const)) int64_t prv_derives_add_Integer_Integer(int64_t a, int64_t b) {
+    int64_t _tmp1 = (a + b);
+    return _tmp1;
+}
+
+__attribute__((const)) int64_t prv_derives_double_Integer(int64_t n) {
+    if (__builtin_expect(!(((n > 0L))), 0)) prove_panic("requires violated: <test>:17");
+    int64_t _tmp2 = (n * 2L);
+    return _tmp2;
+}
+
+__attribute__((const)) int64_t prv_derives_abs_Integer(int64_t n) {
+    if (__builtin_expect(!(((n > 0L))), 0)) prove_panic("requires violated: <test>:23");
+    int64_t _tmp3 = n;
+    return _tmp3;
+}
+
+const char *__prove_binary_path = NULL;
+
+
+
+
+/* ── Test infrastructure ──── */
+
+static int _tests_run = 0;
+static int _tests_passed = 0;
+static int _tests_failed = 0;
+
+static void _test_pass(const char *name) {
+    _tests_run++;
+    _tests_passed++;
+}
+
+static void _test_fail(const char *name, const char *msg) {
+    _tests_run++;
+    _tests_failed++;
+    fprintf(stderr, "FAIL %s: %s\n", name, msg);
+}
+
+static uint64_t _rng_state = 0x12345678DEADBEEF;
+
+static uint64_t _rng_next(void) {
+    _rng_state ^= _rng_state << 13;
+    _rng_state ^= _rng_state >> 7;
+    _rng_state ^= _rng_state << 17;
+    return _rng_state;
+}
+
+static int64_t _rng_int(void) {
+    return (int64_t)_rng_next();
+}
+
+static int64_t _rng_int_range(int64_t lo, int64_t hi) {
+    if (lo >= hi) return lo;
+    uint64_t range = (uint64_t)(hi - lo + 1);
+    return lo + (int64_t)(_rng_next() % range);
+}
+
+static double _rng_double(void) {
+    return (double)_rng_next() / (double)UINT64_MAX * 200.0 - 100.0;
+}
+
+static void _test_prop_add_1(void) {
+    for (int _i = 0; _i < 50; _i++) {
+        int64_t a = _rng_int_range(-1000, 1000);
+        int64_t b = _rng_int_range(-1000, 1000);
+        int64_t _result = prv_derives_add_Integer_Integer(a, b);
+        if (!((_result == (a + b)))) {
+            _test_fail("_test_prop_add_1", "ensures[0] violated");
+            return;
+        }
+    }
+    _test_pass("_test_prop_add_1");
+}
+
+static void _test_boundary_add_2(void) {
+    (void)prv_derives_add_Integer_Integer(0L, 0L);
+    (void)prv_derives_add_Integer_Integer(1L, 1L);
+    (void)prv_derives_add_Integer_Integer(-1L, -1L);
+    (void)prv_derives_add_Integer_Integer(1000L, 1000L);
+    (void)prv_derives_add_Integer_Integer(-1000L, -1000L);
+    _test_pass("_test_boundary_add_2");
+}
+
+static void _test_prop_double_3(void) {
+    for (int _i = 0; _i < 50; _i++) {
+        int64_t n = _rng_int_range(-1000, 1000);
+        if (!((n > 0L))) continue;
+        int64_t _result = prv_derives_double_Integer(n);
+        if (!((_result == (n * 2L)))) {
+            _test_fail("_test_prop_double_3", "ensures[0] violated");
+            return;
+        }
+    }
+    _test_pass("_test_prop_double_3");
+}
+
+static void _test_boundary_double_4(void) {
+    if (((0L) > 0L))
+        (void)prv_derives_double_Integer(0L);
+    if (((1L) > 0L))
+        (void)prv_derives_double_Integer(1L);
+    if (((-1L) > 0L))
+        (void)prv_derives_double_Integer(-1L);
+    if (((1000L) > 0L))
+        (void)prv_derives_double_Integer(1000L);
+    if (((-1000L) > 0L))
+        (void)prv_derives_double_Integer(-1000L);
+    _test_pass("_test_boundary_double_4");
+}
+
+static void _test_prop_abs_5(void) {
+    for (int _i = 0; _i < 50; _i++) {
+        int64_t n = _rng_int_range(-1000, 1000);
+        if (!((n > 0L))) continue;
+        int64_t _result = prv_derives_abs_Integer(n);
+        if (!((_result > 0L))) {
+            _test_fail("_test_prop_abs_5", "ensures[0] violated");
+            return;
+        }
+    }
+    _test_pass("_test_prop_abs_5");
+}
+
+static void _test_boundary_abs_6(void) {
+    if (((0L) > 0L))
+        (void)prv_derives_abs_Integer(0L);
+    if (((1L) > 0L))
+        (void)prv_derives_abs_Integer(1L);
+    if (((-1L) > 0L))
+        (void)prv_derives_abs_Integer(-1L);
+    if (((1000L) > 0L))
+        (void)prv_derives_abs_Integer(1000L);
+    if (((-1000L) > 0L))
+        (void)prv_derives_abs_Integer(-1000L);
+    _test_pass("_test_boundary_abs_6");
+}
+
+int main(int argc, char **argv) {
+    (void)argc; (void)argv;
+    prove_runtime_init();
+    _test_prop_add_1();
+    _test_boundary_add_2();
+    _test_prop_double_3();
+    _test_boundary_double_4();
+    _test_prop_abs_5();
+    _test_boundary_abs_6();
+
+    fprintf(stdout, "\n%d tests, %d passed, %d failed\n", _tests_run, _tests_passed, _tests_failed);
+    prove_runtime_cleanup();
+    return _tests_failed > 0 ? 1 : 0;
+}
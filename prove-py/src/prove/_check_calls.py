@@ -27,7 +27,6 @@ from prove.types import (
     AlgebraicType,
     ArrayType,
     BorrowType,
-    ErrorType,
     FunctionType,
     GenericInstance,
     ListType,
@@ -127,12 +126,10 @@ class CallCheckMixin:
             cb_type = arg_types[-1] if arg_types else None
             # If callback didn't resolve as a symbol (ErrorType), try as function sig
             cb_fn = expr.args[-1]
-            if isinstance(cb_fn, IdentifierExpr) and (
-                cb_type is None or isinstance(cb_type, ErrorType)
-            ):
+            if isinstance(cb_fn, IdentifierExpr) and (cb_type is None or cb_type is ERROR_TY):
                 fn_sig = self.symbols.resolve_function_any(cb_fn.name, arity=1)
                 if fn_sig:
-                    cb_type = FunctionType(list(fn_sig.param_types), fn_sig.return_type)
+                    cb_type = FunctionType(tuple(fn_sig.param_types), fn_sig.return_type)
             elem_type = None
             if isinstance(coll_type, ListType):
                 elem_type = coll_type.element
@@ -199,7 +196,7 @@ class CallCheckMixin:
             # If not found or types don't match, or if multiple overloads might exist, try any
             if (
                 sig is None
-                or len(sig.param_types) != arg_count
+                or sig.arity != arg_count
                 or not all(types_compatible(p, a) for p, a in zip(sig.param_types, arg_types))
                 or expected_type is not None  # ALWAYS check any if we have an expected return type
             ):
@@ -272,7 +269,7 @@ class CallCheckMixin:
                 and isinstance(self._current_function, FunctionDef)
                 and sig.name == self._current_function.name
                 and sig.verb == self._current_function.verb
-                and len(sig.param_types) == len(self._current_function.params)
+                and sig.arity == len(self._current_function.params)
             ):
                 self._is_recursive = True
 
@@ -325,12 +322,12 @@ class CallCheckMixin:
                             )
 
             # Skip strict checks for imported functions (ErrorType return = unknown sig)
-            if isinstance(sig.return_type, ErrorType):
+            if sig.return_type is ERROR_TY:
                 return sig.return_type
 
             # Check argument count
-            if len(sig.param_types) != arg_count:
-                expected_n = len(sig.param_types)
+            if sig.arity != arg_count:
+                expected_n = sig.arity
                 sig_str = ", ".join(
                     f"{n}: {type_name(t)}" for n, t in zip(sig.param_names, sig.param_types)
                 )
@@ -341,7 +338,7 @@ class CallCheckMixin:
                     labels=[DiagnosticLabel(span=expr.span, message="")],
                     notes=[f"function signature: {name}({sig_str})"],
                 )
-                self.diagnostics.append(diag)
+                self._emit(diag)
                 return sig.return_type
 
             # Before checking argument types, see if a non-serializable arg
@@ -352,7 +349,8 @@ class CallCheckMixin:
                     if (
                         isinstance(expected, TypeVariable)
                         and expected.name == "Value"
-                        and not isinstance(actual, (ErrorType, TypeVariable))
+                        and actual is not ERROR_TY
+                        and not isinstance(actual, TypeVariable)
                         and not is_json_serializable(actual)
                     ):
                         unwrapped = list(arg_types)
@@ -398,7 +396,8 @@ class CallCheckMixin:
                 if (
                     isinstance(expected, TypeVariable)
                     and expected.name == "Value"
-                    and not isinstance(actual, (ErrorType, TypeVariable))
+                    and actual is not ERROR_TY
+                    and not isinstance(actual, TypeVariable)
                     and not is_json_serializable(actual)
                     # Sequence operations (set, get, extend, etc.) use Value as
                     # a pseudo-generic — they work for any element type at the
@@ -498,7 +497,7 @@ class CallCheckMixin:
                             ],
                             notes=[f"function signature: {name}({sig_str})"],
                         )
-                    self.diagnostics.append(diag)
+                    self._emit(diag)
 
             # Ownership tracking: mark variables as moved if passed to Own parameters
             self._track_moved_args(expr.args, sig.param_types)
@@ -524,9 +523,9 @@ class CallCheckMixin:
             if sig is None:
                 sig = self.symbols.resolve_function_any(name, arg_types)
             if sig is not None:
-                if not isinstance(sig.return_type, ErrorType):
-                    if len(sig.param_types) != arg_count:
-                        expected_n = len(sig.param_types)
+                if sig.return_type is not ERROR_TY:
+                    if sig.arity != arg_count:
+                        expected_n = sig.arity
                         self._error(
                             "E330",
                             f"wrong number of arguments: expected {expected_n}, got {arg_count}",
@@ -636,7 +635,7 @@ class CallCheckMixin:
             if sig.can_fail and not (
                 isinstance(ret, GenericInstance) and ret.base_name == "Result"
             ):
-                ret = GenericInstance("Result", [ret, PrimitiveType("Error")])
+                ret = GenericInstance("Result", (ret, PrimitiveType("Error")))
             # Resolve generic type variables in return type
             if arg_types:
                 bindings = resolve_type_vars(
@@ -714,7 +713,7 @@ class CallCheckMixin:
                         and isinstance(lam_type, FunctionType)
                         and len(lam_type.param_types) == 2
                     ):
-                        lam_type = FunctionType([lam_type.param_types[0]], lam_type.return_type)
+                        lam_type = FunctionType((lam_type.param_types[0],), lam_type.return_type)
                     return [list_type, lam_type]
         # Clear _expected_type so the outer context (e.g. `as String`)
         # doesn't leak into argument inference — the function hasn't been
@@ -755,7 +754,7 @@ class CallCheckMixin:
                             elem.span,
                         )
                     elif sig.event_type is not None and isinstance(sig.event_type, AlgebraicType):
-                        variant_names = {v.name for v in sig.event_type.variants}
+                        variant_names = sig.event_type.variant_names
                         ret_name = type_name(elem_sig.return_type)
                         if ret_name not in variant_names and ret_name != type_name(sig.event_type):
                             self._error(
@@ -783,7 +782,7 @@ class CallCheckMixin:
 
         ret = sig.return_type
         if sig.can_fail and not (isinstance(ret, GenericInstance) and ret.base_name == "Result"):
-            ret = GenericInstance("Result", [ret, PrimitiveType("Error")])
+            ret = GenericInstance("Result", (ret, PrimitiveType("Error")))
         _HOF_ALL = _HOF_BUILTINS_1 | _HOF_BUILTINS_2
         if arg_types and (name not in _HOF_ALL or name == "filter"):
             bindings = resolve_type_vars(
@@ -854,7 +853,7 @@ class CallCheckMixin:
     def _infer_field(self, expr: FieldExpr) -> Type:
         obj_type = self._infer_expr(expr.obj)
 
-        if isinstance(obj_type, ErrorType):
+        if obj_type is ERROR_TY:
             return ERROR_TY
 
         # Unwrap borrowed types to get inner type for field access
@@ -952,7 +951,7 @@ class CallCheckMixin:
 
         # Variant access on algebraic types: Severity.Error → Severity
         if isinstance(obj_type, AlgebraicType):
-            variant_names = {v.name for v in obj_type.variants}
+            variant_names = obj_type.variant_names
             if expr.field not in variant_names:
                 self._error(
                     "E340",
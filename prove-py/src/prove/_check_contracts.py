@@ -35,9 +35,9 @@ from prove.source import Span
 from prove.symbols import Symbol, SymbolKind
 from prove.types import (
     BOOLEAN,
+    ERROR_TY,
     AlgebraicType,
     BorrowType,
-    ErrorType,
     GenericInstance,
     PrimitiveType,
     StructType,
@@ -212,7 +212,7 @@ class ContractCheckMixin:
                 )
             )
             ens_type = self._infer_expr(ens_expr)
-            if not isinstance(ens_type, ErrorType) and not types_compatible(BOOLEAN, ens_type):
+            if ens_type is not ERROR_TY and not types_compatible(BOOLEAN, ens_type):
                 self._error(
                     "E380",
                     f"ensures expression must be Boolean, got '{type_name(ens_type)}'",
@@ -260,7 +260,7 @@ class ContractCheckMixin:
                 for arg in req_expr.args:
                     self._infer_expr(arg)
             req_type = self._infer_expr(req_expr)
-            if not isinstance(req_type, ErrorType) and not types_compatible(BOOLEAN, req_type):
+            if req_type is not ERROR_TY and not types_compatible(BOOLEAN, req_type):
                 self._error(
                     "E381",
                     f"requires expression must be Boolean, got '{type_name(req_type)}'",
@@ -308,9 +308,7 @@ class ContractCheckMixin:
                     )
             try:
                 know_type = self._infer_expr(know_expr)
-                if not isinstance(know_type, ErrorType) and not types_compatible(
-                    BOOLEAN, know_type
-                ):
+                if know_type is not ERROR_TY and not types_compatible(BOOLEAN, know_type):
                     self._error(
                         "E384",
                         f"know expression must be Boolean, got '{type_name(know_type)}'",
@@ -334,7 +332,7 @@ class ContractCheckMixin:
                             if uses_arm_var
                             else "cannot prove know claim; treating as runtime assertion"
                         )
-                        self.diagnostics.append(
+                        self._emit(
                             make_diagnostic(
                                 Severity.WARNING,
                                 code,
@@ -352,9 +350,7 @@ class ContractCheckMixin:
         # Type-check `assume`
         for assume_expr in fd.assume:
             assume_type = self._infer_expr(assume_expr)
-            if not isinstance(assume_type, ErrorType) and not types_compatible(
-                BOOLEAN, assume_type
-            ):
+            if assume_type is not ERROR_TY and not types_compatible(BOOLEAN, assume_type):
                 self._error(
                     "E385",
                     f"assume expression must be Boolean, got '{type_name(assume_type)}'",
@@ -373,9 +369,7 @@ class ContractCheckMixin:
                 )
             )
             believe_type = self._infer_expr(believe_expr)
-            if not isinstance(believe_type, ErrorType) and not types_compatible(
-                BOOLEAN, believe_type
-            ):
+            if believe_type is not ERROR_TY and not types_compatible(BOOLEAN, believe_type):
                 self._error(
                     "E386",
                     f"believe expression must be Boolean, got '{type_name(believe_type)}'",
@@ -417,7 +411,7 @@ class ContractCheckMixin:
                 )
             )
             expected_type = self._infer_expr(nm.expected)
-            if not isinstance(expected_type, ErrorType) and not types_compatible(
+            if expected_type is not ERROR_TY and not types_compatible(
                 nm_return_type, expected_type
             ):
                 self._error(
@@ -439,7 +433,7 @@ class ContractCheckMixin:
                     "Add `ensures` or `requires` clauses so the compiler can verify the intent.",
                 ],
             )
-            self.diagnostics.append(diag)
+            self._emit(diag)
 
     def _check_intent_prose(self, fd: FunctionDef) -> None:
         """W313: intent: prose has no vocabulary overlap with the function body."""
@@ -449,7 +443,7 @@ class ContractCheckMixin:
 
         tokens = body_tokens(fd)
         if tokens and not prose_overlaps(fd.intent, tokens):
-            self.diagnostics.append(
+            self._emit(
                 make_diagnostic(
                     Severity.WARNING,
                     "W313",
@@ -567,7 +561,8 @@ class ContractCheckMixin:
             if fd.params:
                 first_type = self._resolve_type_expr(fd.params[0].type_expr)
                 is_matchable = (
-                    isinstance(first_type, (AlgebraicType, ErrorType))
+                    first_type is ERROR_TY
+                    or isinstance(first_type, AlgebraicType)
                     or (
                         isinstance(first_type, PrimitiveType)
                         and first_type.name in ("String", "Integer", "Boolean")
@@ -598,10 +593,10 @@ class ContractCheckMixin:
 
     def _has_pure_overload(self, name: str) -> bool:
         """Check if a function name has at least one pure verb overload."""
-        for verb, fname in self.symbols.all_functions():
-            if fname == name and verb in _PURE_VERBS:
-                return True
-        return False
+        # Functions are keyed by (verb, name): probe each pure verb directly
+        # instead of scanning every registered function.
+        functions = self.symbols.all_functions()
+        return any((verb, name) in functions for verb in _PURE_VERBS)
 
     def _check_pure_body(self, body: list[Stmt | MatchExpr], span: Span) -> None:
         """Check that a body doesn't contain IO calls."""
@@ -846,7 +841,7 @@ class ContractCheckMixin:
                     if sig is not None:
                         continue  # Known function reference — accepted
                 constraint_type = self._infer_expr(constraint)
-                if not isinstance(constraint_type, ErrorType) and not types_compatible(
+                if constraint_type is not ERROR_TY and not types_compatible(
                     BOOLEAN, constraint_type
                 ):
                     self._error(
@@ -871,7 +866,7 @@ class ContractCheckMixin:
                         f"be automatically verified without postconditions."
                     ],
                 )
-                self.diagnostics.append(diag)
+                self._emit(diag)
 
     # ── Temporal ordering enforcement ────────────────────────────
 
@@ -961,7 +956,7 @@ class ContractCheckMixin:
                     labels=[DiagnosticLabel(span=fd.span, message="")],
                     notes=["Reorder the calls to match the declared temporal sequence."],
                 )
-                self.diagnostics.append(diag)
+                self._emit(diag)
                 return  # Report first violation only
             prev_pos = step_pos
             prev_name = name
@@ -981,7 +976,7 @@ class ContractCheckMixin:
                     note = f"narrative implies: {', '.join(sorted(verbs))}"
                 else:
                     note = "narrative does not describe any verb intent"
-                self.diagnostics.append(
+                self._emit(
                     make_diagnostic(
                         Severity.WARNING,
                         "W501",
@@ -1006,7 +1001,7 @@ class ContractCheckMixin:
                 if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", step):
                     continue  # skip non-identifier tokens (e.g. numbers, ellipsis)
                 if step not in defined:
-                    self.diagnostics.append(
+                    self._emit(
                         make_diagnostic(
                             Severity.WARNING,
                             "W343",
@@ -1031,7 +1026,7 @@ class ContractCheckMixin:
             if entry.condition is not None:
                 continue  # `when` entries are structural — skip
             if entry.text.strip() and not prose_overlaps(entry.text, tokens):
-                self.diagnostics.append(
+                self._emit(
                     make_diagnostic(
                         Severity.WARNING,
                         "W502",
@@ -1047,7 +1042,7 @@ class ContractCheckMixin:
     def _check_chosen_has_why_not(self, fd: FunctionDef) -> None:
         """W503: chosen declared without any why_not alternatives."""
         if fd.chosen and not fd.why_not:
-            self.diagnostics.append(
+            self._emit(
                 make_diagnostic(
                     Severity.WARNING,
                     "W503",
@@ -1065,7 +1060,7 @@ class ContractCheckMixin:
 
         tokens = body_tokens(fd)
         if tokens and not prose_overlaps(fd.chosen, tokens):
-            self.diagnostics.append(
+            self._emit(
                 make_diagnostic(
                     Severity.WARNING,
                     "W504",
@@ -1084,7 +1079,7 @@ class ContractCheckMixin:
         for entry in fd.why_not:
             words = {w.lower() for w in re.findall(r"[a-zA-Z_][a-zA-Z0-9_]*", entry)}
             if not words & lower_known:
-                self.diagnostics.append(
+                self._emit(
                     make_diagnostic(
                         Severity.WARNING,
                         "W505",
@@ -1122,7 +1117,7 @@ class ContractCheckMixin:
             words = {w.lower() for w in re.findall(r"[a-zA-Z_][a-zA-Z0-9_]*", entry)}
             overlap = words & lower_calls
             if overlap:
-                self.diagnostics.append(
+                self._emit(
                     make_diagnostic(
                         Severity.WARNING,
                         "W506",
@@ -64,7 +64,6 @@ from prove.types import (
     AlgebraicType,
     ArrayType,
     BorrowType,
-    ErrorType,
     FunctionType,
     GenericInstance,
     ListType,
@@ -140,7 +139,7 @@ class TypeCheckMixin:
                 # Function reference: valid error → FunctionType([Diagnostic], Boolean)
                 sig = self.symbols.resolve_function_any(expr.name)
                 if sig is not None and sig.param_types:
-                    return FunctionType(list(sig.param_types), BOOLEAN)
+                    return FunctionType(tuple(sig.param_types), BOOLEAN)
             return BOOLEAN
         if isinstance(expr, ComptimeExpr):
             return self._infer_comptime(expr)
@@ -165,7 +164,7 @@ class TypeCheckMixin:
             )
             if suggestion:
                 diag.notes.append(f"did you mean '{suggestion}'?")
-            self.diagnostics.append(diag)
+            self._emit(diag)
             return ERROR_TY
         sym.used = True
         # Check for use-after-move error
@@ -190,7 +189,7 @@ class TypeCheckMixin:
         right = self._infer_expr(expr.right)
 
         # Error types propagate without cascading
-        if isinstance(left, ErrorType) or isinstance(right, ErrorType):
+        if left is ERROR_TY or right is ERROR_TY:
             return ERROR_TY
 
         # Comparison operators always return Boolean
@@ -251,7 +250,7 @@ class TypeCheckMixin:
             elif isinstance(self._current_function, MainDef):
                 can_fail = self._current_function.can_fail
             if not can_fail:
-                self.diagnostics.append(
+                self._emit(
                     Diagnostic(
                         severity=Severity.ERROR,
                         code="E350",
@@ -267,10 +266,10 @@ class TypeCheckMixin:
                 )
 
         # The inner expression must be a failable (Result-returning) call
-        if not isinstance(inner, ErrorType) and not (
+        if inner is not ERROR_TY and not (
             isinstance(inner, GenericInstance) and inner.base_name == "Result"
         ):
-            self.diagnostics.append(
+            self._emit(
                 Diagnostic(
                     severity=Severity.ERROR,
                     code="E351",
@@ -352,7 +351,7 @@ class TypeCheckMixin:
                             "`true` branch directly.",
                         ],
                     )
-                    self.diagnostics.append(diag)
+                    self._emit(diag)
                     break
 
         # Check exhaustiveness for algebraic types
@@ -425,7 +424,7 @@ class TypeCheckMixin:
 
         if isinstance(obj_type, ListType):
             return obj_type.element
-        if isinstance(obj_type, ErrorType):
+        if obj_type is ERROR_TY:
             return ERROR_TY
         return ERROR_TY
 
@@ -450,8 +449,8 @@ class TypeCheckMixin:
     def _infer_comptime(self, expr: ComptimeExpr) -> Type:
         # Register comptime built-in functions so type-checking passes
         comptime_builtins = {
-            "platform": FunctionType([], STRING),
-            "read": FunctionType([STRING], STRING),
+            "platform": FunctionType((), STRING),
+            "read": FunctionType((STRING,), STRING),
         }
         for name, ty in comptime_builtins.items():
             if self.symbols.lookup(name) is None:
@@ -484,20 +483,17 @@ class TypeCheckMixin:
         elif isinstance(pattern, VariantPattern):
             # Check variant exists
             if isinstance(subject_type, AlgebraicType):
-                found = False
-                for v in subject_type.variants:
-                    if v.name == pattern.name:
-                        found = True
-                        # Bind sub-patterns
-                        for i, sub in enumerate(pattern.fields):
-                            field_names = list(v.fields.keys())
-                            if i < len(field_names):
-                                ft = v.fields[field_names[i]]
-                            else:
-                                ft = ERROR_TY
-                            self._check_pattern(sub, ft)
-                        break
-                if not found:
+                v = subject_type.variant_by_name.get(pattern.name)
+                if v is not None:
+                    # Bind sub-patterns
+                    field_names = list(v.fields.keys())
+                    for i, sub in enumerate(pattern.fields):
+                        if i < len(field_names):
+                            ft = v.fields[field_names[i]]
+                        else:
+                            ft = ERROR_TY
+                        self._check_pattern(sub, ft)
+                else:
                     self._error("E370", f"unknown variant '{pattern.name}'", pattern.span)
         elif isinstance(pattern, WildcardPattern):
             pass  # matches everything
@@ -508,8 +504,8 @@ class TypeCheckMixin:
 
     def _check_exhaustiveness(self, expr: MatchExpr, subject_type: AlgebraicType) -> None:
         """Check match exhaustiveness for algebraic types."""
-        variant_names = {v.name for v in subject_type.variants}
-        covered: set[str] = set()
+        variant_bits = subject_type.variant_bits
+        covered = 0
         has_wildcard = False
         wildcard_seen = False
 
@@ -518,8 +514,9 @@ class TypeCheckMixin:
                 self._info("I301", "unreachable match arm after wildcard", arm.span)
 
             if isinstance(arm.pattern, VariantPattern):
-                if arm.pattern.name in variant_names:
-                    covered.add(arm.pattern.name)
+                bit = variant_bits.get(arm.pattern.name)
+                if bit is not None:
+                    covered |= bit
                 else:
                     self._error("E370", f"unknown variant '{arm.pattern.name}'", arm.pattern.span)
             elif isinstance(arm.pattern, WildcardPattern):
@@ -529,25 +526,24 @@ class TypeCheckMixin:
                 has_wildcard = True
                 wildcard_seen = True
 
-        if not has_wildcard:
-            missing = variant_names - covered
-            if missing:
-                names = ", ".join(sorted(missing))
-                arms_str = " | ".join(f"{v} => ..." for v in sorted(missing))
-                self.diagnostics.append(
-                    Diagnostic(
-                        severity=Severity.ERROR,
-                        code="E371",
-                        message=f"non-exhaustive match: missing {names}",
-                        labels=[DiagnosticLabel(span=expr.span, message="")],
-                        suggestions=[
-                            Suggestion(
-                                message="add the missing arms",
-                                replacement=arms_str,
-                            )
-                        ],
-                    )
+        if not has_wildcard and covered != (1 << len(variant_bits)) - 1:
+            missing = [name for name, bit in variant_bits.items() if not covered & bit]
+            names = ", ".join(sorted(missing))
+            arms_str = " | ".join(f"{v} => ..." for v in sorted(missing))
+            self._emit(
+                Diagnostic(
+                    severity=Severity.ERROR,
+                    code="E371",
+                    message=f"non-exhaustive match: missing {names}",
+                    labels=[DiagnosticLabel(span=expr.span, message="")],
+                    suggestions=[
+                        Suggestion(
+                            message="add the missing arms",
+                            replacement=arms_str,
+                        )
+                    ],
                 )
+            )
 
     # ── Lookup table checking ────────────────────────────────────
 
@@ -823,7 +819,7 @@ class TypeCheckMixin:
                 return ArrayType(args[0])
             # Special-case Verb<P1, ..., Pn, R> → FunctionType
             if type_expr.name == "Verb" and len(args) >= 1:
-                return FunctionType(list(args[:-1]), args[-1])
+                return FunctionType(tuple(args[:-1]), args[-1])
             # Check base type exists
             base = self.symbols.resolve_type(type_expr.name)
             if base is None:
@@ -26,11 +26,12 @@ from prove.c_types import CType, mangle_name, mangle_type_name, map_type, safe_c
 from prove.symbols import FunctionSignature
 from prove.type_inference import BUILTIN_MAP, get_type_key
 from prove.types import (
+    ERROR_TY,
     INTEGER,
     STRING,
+    UNIT,
     AlgebraicType,
     ArrayType,
-    ErrorType,
     FunctionType,
     GenericInstance,
     ListType,
@@ -135,7 +136,7 @@ class CallEmitterMixin:
         if not rec_direct:
             return args
         # Find the variant matching this constructor name
-        variant = next((v for v in ret_type.variants if v.name == name), None)
+        variant = ret_type.variant_by_name.get(name)
         if not variant:
             return args
         rec_ptr_locals: set[str] = getattr(self, "_recursive_pointer_locals", set())
@@ -1201,8 +1202,6 @@ class CallEmitterMixin:
                 # Resolve function reference args for Verb parameters.
                 # When the target function's return type is non-void, emit a
                 # void-returning thunk so the call-through cast is ABI-safe.
-                from prove.types import UnitType
-
                 for i, pt in enumerate(sig.param_types):
                     if i < len(expr.args) and isinstance(expr.args[i], IdentifierExpr):
                         is_verb_param = (
@@ -1224,8 +1223,7 @@ class CallEmitterMixin:
                                     # emit a void thunk wrapper to avoid ABI
                                     # mismatch at the void-cast call-through.
                                     needs_thunk = (
-                                        not isinstance(ref_sig.return_type, UnitType)
-                                        or ref_sig.can_fail
+                                        ref_sig.return_type is not UNIT or ref_sig.can_fail
                                     )
                                     if needs_thunk:
                                         thunk = self._emit_verb_thunk(ref_mangled, ref_sig)
@@ -1356,7 +1354,7 @@ class CallEmitterMixin:
                 cname = mangle_type_name(parent.name)
                 args = self._wrap_recursive_constructor_args(name, args, expr.args)
                 # Coerce (void)0 → NULL for variant fields with pointer types
-                variant = next((v for v in parent.variants if v.name == name), None)
+                variant = parent.variant_by_name.get(name)
                 if variant:
                     for i, (fname, ftype) in enumerate(variant.fields.items()):
                         if i < len(args) and args[i] == "(void)0":
@@ -1588,12 +1586,12 @@ class CallEmitterMixin:
             if (
                 event_type
                 and isinstance(event_type, AlgebraicType)
-                and any(v.name == name for v in event_type.variants)
+                and name in event_type.variant_names
             ):
                 evt_cname = map_type(event_type).decl
                 tag = f"{evt_cname}_TAG_{name.upper()}"
                 if self._in_renders_loop:
-                    variant = next((v for v in event_type.variants if v.name == name), None)
+                    variant = event_type.variant_by_name.get(name)
                     has_data_fields = (
                         variant and variant.fields and args and not all(a == "state" for a in args)
                     )
@@ -1617,7 +1615,7 @@ class CallEmitterMixin:
             cname = mangle_type_name(parent.name)
             args = self._wrap_recursive_constructor_args(name, args, expr.args)
             # Coerce (void)0 → NULL for variant fields with pointer types
-            variant = next((v for v in parent.variants if v.name == name), None)
+            variant = parent.variant_by_name.get(name)
             if variant:
                 for i, (fname, ftype) in enumerate(variant.fields.items()):
                     if i < len(args) and args[i] == "(void)0":
@@ -1654,7 +1652,7 @@ class CallEmitterMixin:
             return coll_type.element
         if isinstance(coll_type, ArrayType):
             return coll_type.element
-        if isinstance(coll_type, ErrorType):
+        if coll_type is ERROR_TY:
             return TypeVariable("Value")
         if isinstance(coll_type, PrimitiveType) and coll_type.name == "Cursor":
             return PrimitiveType("Row")
@@ -2042,8 +2040,8 @@ class CallEmitterMixin:
 
         elem_type: Type = self._infer_hof_elem_type(coll_type)
         # Refine: when ErrorType + option-none filter, use Option<Value>
-        if isinstance(coll_type, ErrorType) and self._is_option_none_filter(expr.args[1]):
-            elem_type = GenericInstance("Option", [TypeVariable("Value")])
+        if coll_type is ERROR_TY and self._is_option_none_filter(expr.args[1]):
+            elem_type = GenericInstance("Option", (TypeVariable("Value"),))
 
         fn_name, ctx_arg = self._emit_hof_lambda(expr.args[1], elem_type, "filter")
         filtered = f"prove_list_filter({list_arg}, {fn_name}, {ctx_arg})"
@@ -3784,7 +3782,7 @@ class CallEmitterMixin:
             self._locals[old_param] = elem_type
             elem_ct = map_type(elem_type)
             # ErrorType (unresolved inference) defaults to void* for parameter
-            if isinstance(elem_type, ErrorType) or (
+            if elem_type is ERROR_TY or (
                 isinstance(elem_type, PrimitiveType) and elem_type.name == "Verb"
             ):
                 from prove.c_types import CType
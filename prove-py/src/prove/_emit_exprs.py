@@ -48,13 +48,11 @@ from prove.types import (
     INTEGER,
     UNIT,
     AlgebraicType,
-    ErrorType,
     GenericInstance,
     ListType,
     PrimitiveType,
     RecordType,
     Type,
-    UnitType,
     types_compatible,
 )
 
@@ -604,7 +602,7 @@ class ExprEmitterMixin:
                 return self._unwrap_result_value(tmp, success_type)
         # Failable function with non-Result return -- the C ABI still wraps
         # in Prove_Result, so we need to unwrap.
-        if isinstance(inner_type, ErrorType):
+        if inner_type is ERROR_TY:
             return f"{tmp}"
         # Result without args already handled above; bare Result has no value.
         if (
@@ -763,7 +761,7 @@ class ExprEmitterMixin:
 
     def _unwrap_result_value(self, tmp: str, success_type: Type) -> str:
         """Emit the correct prove_result_unwrap_* call for a success type."""
-        if isinstance(success_type, UnitType):
+        if success_type is UNIT:
             return tmp  # No value to unwrap
         if isinstance(success_type, RecordType):
             ct = map_type(success_type)
@@ -867,7 +865,7 @@ class ExprEmitterMixin:
         ):
             if isinstance(result_type, GenericInstance) and result_type.base_name == "Option":
                 _option_wrap = True
-            elif isinstance(result_type, UnitType) or types_compatible(
+            elif result_type is UNIT or types_compatible(
                 self._current_func_return.args[0], result_type
             ):
                 result_type = self._current_func_return
@@ -888,7 +886,7 @@ class ExprEmitterMixin:
                     _option_wrap = True
 
         ct = map_type(result_type)
-        is_unit = isinstance(result_type, UnitType)
+        is_unit = result_type is UNIT
         tmp = "" if is_unit else self._tmp()
         if not is_unit:
             self._line(f"{ct.decl} {tmp};")
@@ -944,7 +942,7 @@ class ExprEmitterMixin:
                             inner_ty = subj_type.args[0] if subj_type.args else INTEGER
                             inner_ct = map_type(inner_ty)
                             bind_name = vp.fields[0].name
-                            if isinstance(inner_ty, UnitType):
+                            if inner_ty is UNIT:
                                 self._line(f"int {bind_name} = 0; /* Some(Unit) */")
                                 self._locals[bind_name] = inner_ty
                             else:
@@ -976,7 +974,7 @@ class ExprEmitterMixin:
                             inner_ty = subj_type.args[0] if subj_type.args else INTEGER
                             inner_ct = map_type(inner_ty)
                             bind_name = vp.fields[0].name
-                            if isinstance(inner_ty, UnitType):
+                            if inner_ty is UNIT:
                                 self._line(f"int {bind_name} = 0; /* Ok(Unit) */")
                                 self._locals[bind_name] = inner_ty
                             else:
@@ -1061,7 +1059,7 @@ class ExprEmitterMixin:
         sct = map_type(subj_type)
         cname = mangle_type_name(subj_type.name)
 
-        if not isinstance(result_type, UnitType):
+        if result_type is not UNIT:
             self._line(f"{ct.decl} {result_tmp};")
         self._line(f"{sct.decl} {subj_tmp} = {subj};")
         self._line(f"switch ({subj_tmp}.tag) {{")
@@ -1071,9 +1069,7 @@ class ExprEmitterMixin:
                 tag = f"{cname}_TAG_{arm.pattern.name.upper()}"
                 self._line(f"case {tag}: {{")
                 self._indent += 1
-                variant_info = next(
-                    (v for v in subj_type.variants if v.name == arm.pattern.name), None
-                )
+                variant_info = subj_type.variant_by_name.get(arm.pattern.name)
                 if variant_info:
                     rec_direct = getattr(self, "_recursive_fields_cache", {}).get(
                         subj_type.name, set()
@@ -1099,7 +1095,7 @@ class ExprEmitterMixin:
                                         f"{subj_tmp}.{arm.pattern.name}.{fname};"
                                     )
                 for j, s in enumerate(arm.body):
-                    if j == len(arm.body) - 1 and not isinstance(result_type, UnitType):
+                    if j == len(arm.body) - 1 and result_type is not UNIT:
                         e = self._stmt_expr(s)
                         if e is not None:
                             self._line(f"{result_tmp} = {self._emit_expr(e)};")
@@ -1123,7 +1119,7 @@ class ExprEmitterMixin:
                     self._locals[arm.pattern.name] = subj_type
                     self._line(f"{sct.decl} {arm.pattern.name} = {subj_tmp};")
                 for j, s in enumerate(arm.body):
-                    if j == len(arm.body) - 1 and not isinstance(result_type, UnitType):
+                    if j == len(arm.body) - 1 and result_type is not UNIT:
                         e = self._stmt_expr(s)
                         if e is not None:
                             self._line(f"{result_tmp} = {self._emit_expr(e)};")
@@ -1136,7 +1132,7 @@ class ExprEmitterMixin:
                 self._line("}")
         self._line("}")
 
-        return result_tmp if not isinstance(result_type, UnitType) else "/* match */"
+        return result_tmp if result_type is not UNIT else "/* match */"
 
     def _emit_arm_body(
         self,
@@ -1174,7 +1170,7 @@ class ExprEmitterMixin:
                     val = self._emit_expr(e)
                     if option_wrap:
                         arm_ty = self._infer_expr_type(e)
-                        if isinstance(arm_ty, UnitType):
+                        if arm_ty is UNIT:
                             self._line(f"{val};")
                             self._line(f"{tmp} = prove_option_none();")
                         elif isinstance(arm_ty, GenericInstance) and arm_ty.base_name == "Option":
@@ -1261,7 +1257,7 @@ class ExprEmitterMixin:
                                 self._locals[s.name] = vt
                     ty = self._infer_expr_type(last.expr)
                     self._locals = saved
-                    if not isinstance(ty, ErrorType):
+                    if ty is not ERROR_TY:
                         return ty
         return UNIT
 
@@ -1296,7 +1292,7 @@ class ExprEmitterMixin:
                 val = self._emit_expr(part)
                 if isinstance(part_type, PrimitiveType) and part_type.name == "String":
                     parts.append(val)
-                elif isinstance(part_type, ErrorType) or (
+                elif part_type is ERROR_TY or (
                     isinstance(part_type, PrimitiveType) and part_type.name == "Error"
                 ):
                     # Error is Prove_String* — use directly
@@ -56,7 +56,6 @@ from prove.types import (
     RefinementType,
     Type,
     TypeVariable,
-    UnitType,
     get_scale,
 )
 from prove.verb_defs import ALL_IO_VERBS, NON_ALLOCATING_VERBS
@@ -148,7 +147,7 @@ class StmtEmitterMixin:
             else:
                 default_idx = i
 
-        is_unit = isinstance(ret_type, UnitType)
+        is_unit = ret_type is UNIT
 
         # Each obligation maps to the body expression at the same index.
         # Body is a list of stmts — we use obligation index to pick the
@@ -204,7 +203,7 @@ class StmtEmitterMixin:
                 continue
             if is_last and not isinstance(stmt, VarDecl):
                 # Last expression is the return value
-                if isinstance(ret_type, UnitType) and not is_failable:
+                if ret_type is UNIT and not is_failable:
                     self._emit_stmt(stmt)
                     self._emit_releases(None)
                     self._emit_region_exit()
@@ -249,7 +248,7 @@ class StmtEmitterMixin:
                             self._emit_releases(None)
                             self._emit_region_exit()
                             self._line("return prove_result_ok();")
-                    elif isinstance(ret_type, UnitType):
+                    elif ret_type is UNIT:
                         self._emit_stmt(stmt)
                         self._emit_releases(None)
                         self._emit_region_exit()
@@ -415,7 +414,7 @@ class StmtEmitterMixin:
                                     and expr_type.base_name == "Option"
                                 )
                             ):
-                                if isinstance(expr_type, UnitType):
+                                if expr_type is UNIT:
                                     self._line(f"{ret_ct.decl} {ret_tmp} = prove_option_none();")
                                 else:
                                     inner_ct = map_type(expr_type)
@@ -1121,7 +1120,7 @@ class StmtEmitterMixin:
         val = self._emit_expr(assign.value)
         # If the RHS is a void function call, emit just the call (no assignment)
         call_sig = self._resolve_call_sig(assign.value)
-        if call_sig is not None and isinstance(call_sig.return_type, UnitType):
+        if call_sig is not None and call_sig.return_type is UNIT:
             self._line(f"{val};")
         else:
             self._line(f"{assign.target} = {val};")
@@ -1335,9 +1334,7 @@ class StmtEmitterMixin:
                     self._line(f"case {tag}: {{")
                     self._indent += 1
                     # Bind fields
-                    variant_info = next(
-                        (v for v in subj_type.variants if v.name == arm.pattern.name), None
-                    )
+                    variant_info = subj_type.variant_by_name.get(arm.pattern.name)
                     if variant_info:
                         for i, sub_pat in enumerate(arm.pattern.fields):
                             if isinstance(sub_pat, BindingPattern):
@@ -1528,7 +1525,7 @@ class StmtEmitterMixin:
                         inner_ty = subj_type.args[0] if subj_type.args else INTEGER
                         inner_ct = map_type(inner_ty)
                         bind_name = arm.pattern.fields[0].name
-                        if isinstance(inner_ty, UnitType):
+                        if inner_ty is UNIT:
                             # Unit/void cannot be stored in a variable;
                             # declare as int so references in the arm body
                             # still compile (value is meaningless for Unit).
@@ -558,8 +558,8 @@ class TypeEmitterMixin:
                 # Check if any variant shares a name with a variant in the base type
                 base_type = self._symbols.resolve_type(type_name)
                 if isinstance(base_type, AlgebraicType):
-                    base_names = {v.name for v in base_type.variants}
-                    child_names = {v.name for v in resolved.variants}
+                    base_names = base_type.variant_names
+                    child_names = resolved.variant_names
                     if base_names.issubset(child_names) and base_names:
                         return True
         return False
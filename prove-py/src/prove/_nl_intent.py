@@ -216,9 +216,10 @@ def body_tokens(fd: FunctionDef) -> set[str]:
         if isinstance(node, CallExpr):
             if isinstance(node.func, IdentifierExpr):
                 names.add(node.func.name)
-        if hasattr(node, "__dataclass_fields__"):
-            for val in vars(node).values():
-                _collect(val)
+        fields = getattr(node, "__dataclass_fields__", None)
+        if fields is not None:
+            for fname in fields:
+                _collect(getattr(node, fname))
 
     for stmt in fd.body:
         _collect(stmt)
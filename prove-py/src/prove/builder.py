@@ -27,6 +27,13 @@ _FOREIGN_PKG_CONFIG: dict[str, str] = {
     "libjvm": "jni",
 }
 
+# Parsed and checked pure stdlib modules, keyed by module name and source.
+# The stdlib is static within a process, so repeat builds (tests, watch
+# mode) reuse the AST instead of re-parsing and re-checking it.
+_pure_stdlib_cache: dict[
+    tuple[str, str], tuple[Module | None, SymbolTable | None, tuple[Diagnostic, ...]]
+] = {}
+
 
 def _resolve_foreign_flags(
     library: str, *, standalone: bool = False
@@ -370,22 +377,34 @@ def _compile_pure_stdlib(
         if source is None:
             continue
 
-        filename = f"<stdlib:{mod_name}>"
-        try:
-            stdlib_module = parse_source(source, filename)
-        except CompileError as e:
-            all_diags.extend(e.diagnostics)
-            continue
-
-        checker = Checker()
-        symbols = checker.check(stdlib_module)
-        all_diags.extend(checker.diagnostics)
-        if checker.has_errors():
+        key = (mod_name, source)
+        if key not in _pure_stdlib_cache:
+            _pure_stdlib_cache[key] = _check_pure_stdlib(mod_name, source)
+        stdlib_module, symbols, diags = _pure_stdlib_cache[key]
+        all_diags.extend(diags)
+        if stdlib_module is None or symbols is None:
             continue
 
         modules_and_symbols.append((stdlib_module, symbols))
 
 
+def _check_pure_stdlib(
+    mod_name: str, source: str
+) -> tuple[Module | None, SymbolTable | None, tuple[Diagnostic, ...]]:
+    """Parse and check one pure stdlib module; (None, None, diags) on errors."""
+    filename = f"<stdlib:{mod_name}>"
+    try:
+        stdlib_module = parse_source(source, filename)
+    except CompileError as e:
+        return None, None, tuple(e.diagnostics)
+
+    checker = Checker()
+    symbols = checker.check(stdlib_module)
+    if checker.has_errors():
+        return None, None, tuple(checker.diagnostics)
+    return stdlib_module, symbols, tuple(checker.diagnostics)
+
+
 def _compile_package_modules(
     package_modules: dict[str, object],
     modules_and_symbols: list[tuple[Module, SymbolTable]],
@@ -5,6 +5,7 @@ from __future__ import annotations
 import shutil
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -16,6 +17,7 @@ class CompileCError(Exception):
         super().__init__(message)
 
 
+@lru_cache(maxsize=None)
 def _compiler_family(cc: str) -> str:
     """Return 'gcc', 'clang', or 'msvc'."""
     try:
@@ -37,14 +39,20 @@ def _compiler_family(cc: str) -> str:
     return "gcc"  # default assumption
 
 
+@lru_cache(maxsize=1)
 def find_c_compiler() -> str | None:
-    """Search PATH for a C compiler (gcc, cc, clang)."""
+    """Search PATH for a C compiler (gcc, cc, clang).
+
+    The result is cached for the life of the process; call
+    ``find_c_compiler.cache_clear()`` after changing PATH.
+    """
     for name in ("gcc", "cc", "clang"):
         if shutil.which(name):
             return name
     return None
 
 
+@lru_cache(maxsize=1)
 def find_ccache() -> str | None:
     """Return the path to ccache if installed, else None."""
     return shutil.which("ccache")
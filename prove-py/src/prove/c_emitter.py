@@ -64,7 +64,6 @@ from prove.types import (
     STRING,
     UNIT,
     AlgebraicType,
-    ErrorType,
     FunctionType,
     GenericInstance,
     ListType,
@@ -586,7 +585,7 @@ class CEmitter(
                     self._needed_headers.add("prove_event.h")
                     rsig = self._symbols.resolve_function(decl.verb, decl.name, len(decl.params))
                     if rsig and rsig.event_type and isinstance(rsig.event_type, AlgebraicType):
-                        vnames = {v.name for v in rsig.event_type.variants}
+                        vnames = rsig.event_type.variant_names
                         if "Visible" in vnames and "Focused" in vnames:
                             self._needed_headers.add("prove_gui.h")
                         else:
@@ -1653,7 +1652,7 @@ class CEmitter(
                     self._line(
                         f"if (__builtin_expect(!({cond}), 0)) return prove_result_err({ref});"
                     )
-                elif ret_type == BOOLEAN:
+                elif ret_type is BOOLEAN:
                     self._line(f"if (__builtin_expect(!({cond}), 0)) return true;")
                 elif ret_type == UNIT:
                     self._line(f"if (__builtin_expect(!({cond}), 0)) return;")
@@ -2273,7 +2272,7 @@ class CEmitter(
         # if those are present, it's a GUI app.
         is_graphic = False
         if event_type and isinstance(event_type, AlgebraicType):
-            variant_names = {v.name for v in event_type.variants}
+            variant_names = event_type.variant_names
             is_graphic = "Visible" in variant_names and "Focused" in variant_names
 
         # Initialize backend
@@ -2562,7 +2561,7 @@ class CEmitter(
                 if inner.args:
                     return inner.args[0]
             # Failable function with concrete return type (not Result<Value>)
-            if not isinstance(inner, ErrorType):
+            if inner is not ERROR_TY:
                 return inner
             return ERROR_TY
 
@@ -2575,7 +2574,7 @@ class CEmitter(
             return ListType(INTEGER)
 
         if isinstance(expr, LambdaExpr):
-            return FunctionType([], UNIT)
+            return FunctionType((), UNIT)
 
         if isinstance(expr, IndexExpr):
             obj_type = self._infer_expr_type(expr.obj)
@@ -5,9 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from prove.types import (
+    ERROR_TY,
+    UNIT,
     AlgebraicType,
     ArrayType,
-    ErrorType,
     FunctionType,
     GenericInstance,
     ListType,
@@ -17,7 +18,6 @@ from prove.types import (
     StructType,
     Type,
     TypeVariable,
-    UnitType,
     VariantInfo,
 )
 
@@ -113,8 +113,25 @@ _PRIMITIVE_MAP: dict[str, CType] = {
 # ── Public API ─────────────────────────────────────────────────────
 
 
+# id(ty) -> (ty, CType); the entry keeps ty alive so its id is not reused.
+# Cleared wholesale once it reaches _MAP_TYPE_CACHE_MAX entries.
+_MAP_TYPE_CACHE: dict[int, tuple[Type, CType]] = {}
+_MAP_TYPE_CACHE_MAX = 4096
+
+
 def map_type(ty: Type) -> CType:
     """Map a Prove resolved Type to its C representation."""
+    hit = _MAP_TYPE_CACHE.get(id(ty))
+    if hit is not None:
+        return hit[1]
+    ct = _map_type(ty)
+    if len(_MAP_TYPE_CACHE) >= _MAP_TYPE_CACHE_MAX:
+        _MAP_TYPE_CACHE.clear()
+    _MAP_TYPE_CACHE[id(ty)] = (ty, ct)
+    return ct
+
+
+def _map_type(ty: Type) -> CType:
     # Unwrap borrowed types - they're passed as regular pointers in C
     from prove.types import BorrowType
 
@@ -145,7 +162,7 @@ def map_type(ty: Type) -> CType:
         # Fallback for unknown primitives
         return CType("int64_t", is_pointer=False, header=None)
 
-    if isinstance(ty, UnitType):
+    if ty is UNIT:
         return CType("void", is_pointer=False, header=None)
 
     if isinstance(ty, RecordType):
@@ -200,7 +217,7 @@ def map_type(ty: Type) -> CType:
     if isinstance(ty, VariantInfo):
         return CType("int64_t", is_pointer=False, header=None)
 
-    if isinstance(ty, ErrorType):
+    if ty is ERROR_TY:
         return CType("int64_t", is_pointer=False, header=None)
 
     return CType("int64_t", is_pointer=False, header=None)
@@ -264,6 +281,14 @@ def safe_c_name(name: str) -> str:
     return name
 
 
+# (module, verb, name, param ids) -> (param types, mangled name); the entry
+# keeps the parameter types alive so their ids are not reused.
+_MANGLE_CACHE: dict[
+    tuple[str | None, str | None, str, tuple[int, ...]], tuple[tuple[Type, ...], str]
+] = {}
+_MANGLE_CACHE_MAX = 4096
+
+
 def mangle_name(
     verb: str | None,
     name: str,
@@ -282,20 +307,38 @@ def mangle_name(
     The prefix prevents collisions with C standard library and system
     functions (e.g. ``file``, ``read``, ``close``).
     """
+    params = tuple(param_types) if param_types else ()
+    key = (module, verb, name, tuple(map(id, params)))
+    hit = _MANGLE_CACHE.get(key)
+    if hit is not None:
+        return hit[1]
     parts: list[str] = ["prv"]
     if module:
         parts.append(module)
     if verb:
         parts.append(verb)
     parts.append(name)
-    if param_types:
-        for pt in param_types:
-            parts.append(_type_tag(pt))
-    return "_".join(parts)
+    for pt in params:
+        parts.append(_type_tag(pt))
+    mangled = "_".join(parts)
+    if len(_MANGLE_CACHE) >= _MANGLE_CACHE_MAX:
+        _MANGLE_CACHE.clear()
+    _MANGLE_CACHE[key] = (params, mangled)
+    return mangled
+
+
+# Characters that can appear in spelled-out type names but not in C identifiers.
+_TYPE_NAME_SANITIZE = str.maketrans({"<": "_", ">": "_", ",": "_", ".": "_", " ": None})
 
 
 def mangle_type_name(name: str) -> str:
-    """Mangle a type name for C. e.g. "Point" -> "Prove_Point"."""
+    """Mangle a type name for C. e.g. "Point" -> "Prove_Point".
+
+    Names that are not plain identifiers (e.g. "Option<Integer>") are
+    sanitized in a single translate pass.
+    """
+    if not name.isidentifier():
+        name = name.translate(_TYPE_NAME_SANITIZE)
     return f"Prove_{name}"
 
 
@@ -313,7 +356,7 @@ def _type_tag(ty: Type) -> str:
         return "Array"
     if isinstance(ty, GenericInstance):
         return ty.base_name
-    if isinstance(ty, UnitType):
+    if ty is UNIT:
         return "Unit"
     if isinstance(ty, TypeVariable):
         return ty.name
@@ -6,8 +6,10 @@ Pass 2: Check each declaration body (type inference, verb enforcement, exhaustiv
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, cast
 
 from prove._check_calls import CallCheckMixin
 from prove._check_contracts import ContractCheckMixin, _match_arms_have_fail_prop
@@ -102,7 +104,6 @@ from prove.types import (
     ArrayType,
     BorrowType,  # noqa: E501
     EffectType,
-    ErrorType,
     FunctionType,
     GenericInstance,
     ListType,
@@ -112,8 +113,8 @@ from prove.types import (
     StructType,
     Type,
     TypeVariable,
-    UnitType,
     VariantInfo,
+    clear_compat_cache,
     find_recursive_fields,
     get_scale,
     has_mutable_modifier,
@@ -131,6 +132,9 @@ from prove.verb_defs import (
     VERBS_NEED_OWNERSHIP,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 def _count_decimal_places(literal: str) -> int:
     """Count decimal places in a numeric literal string like '3.14159'."""
@@ -158,6 +162,12 @@ _IO_FUNCTIONS = frozenset(
 # Re-export for external consumers (export.py)
 _BUILTIN_FUNCTIONS = BUILTIN_FUNCTIONS
 
+# Variants a match on a built-in generic must cover
+_GENERIC_VARIANTS: dict[str, frozenset[str]] = {
+    "Result": frozenset({"Ok", "Err"}),
+    "Option": frozenset({"Some", "None"}),
+}
+
 # Built-in type names that user code must not shadow
 _BUILTIN_TYPE_NAMES = frozenset(
     {
@@ -183,10 +193,179 @@ _BUILTIN_TYPE_NAMES = frozenset(
 )
 
 
-def _edit_distance(a: str, b: str) -> int:
-    """Compute Levenshtein edit distance between two strings."""
+@lru_cache(maxsize=1)
+def _builtin_tables() -> tuple[
+    tuple[tuple[str, Type], ...],
+    tuple[FunctionSignature, ...],
+    Mapping[tuple[str, int], frozenset[Type]],
+]:
+    """Built-in types, function signatures and extra argument types.
+
+    Built once and shared by every Checker: the types are hash-consed,
+    signatures are frozen and the extra-type table is a read-only view, so
+    ``_register_builtins`` only has to insert them.
+    """
+    types: list[tuple[str, Type]] = [(name, ty) for name, ty in BUILTINS.items()]
+    # Generic constructors
+    types += [
+        ("Result", GenericInstance("Result", (TypeVariable("Value"), TypeVariable("Error")))),
+        ("Option", GenericInstance("Option", (TypeVariable("Value"),))),
+        ("List", ListType(TypeVariable("Value"))),
+        ("Table", GenericInstance("Table", (TypeVariable("Value"),))),
+        ("Error", PrimitiveType("Error")),
+        ("Value", TypeVariable("Value")),
+        ("Source", TypeVariable("Source")),
+        ("Verb", PrimitiveType("Verb")),
+        ("Attached", PrimitiveType("Attached")),
+        ("Listens", PrimitiveType("Listens")),
+    ]
+
+    _dummy = Span("<builtin>", 0, 0, 0, 0)
+
+    # Builtins that accept additional types beyond their signature.
+    # Maps (func_name, param_index) → frozenset of extra types.
+    _cursor_ty = PrimitiveType("Cursor")
+    extra_types: dict[tuple[str, int], frozenset[Type]] = {
+        ("len", 0): frozenset({STRING}),
+        ("map", 0): frozenset({_cursor_ty}),
+        ("each", 0): frozenset({_cursor_ty}),
+        ("filter", 0): frozenset({_cursor_ty}),
+        ("reduce", 0): frozenset({_cursor_ty}),
+        ("all", 0): frozenset({_cursor_ty}),
+        ("any", 0): frozenset({_cursor_ty}),
+        ("find", 0): frozenset({_cursor_ty}),
+    }
+
+    # Common built-in functions
+    builtins = [
+        ("len", [ListType(TypeVariable("Value"))], INTEGER),
+        (
+            "map",
+            [
+                ListType(TypeVariable("Value")),
+                FunctionType((TypeVariable("Value"),), TypeVariable("Output")),
+            ],
+            ListType(TypeVariable("Output")),
+        ),
+        (
+            "each",
+            [
+                ListType(TypeVariable("Value")),
+                FunctionType((TypeVariable("Value"),), TypeVariable("Output")),
+            ],
+            UNIT,
+        ),
+        (
+            "filter",
+            [
+                ListType(TypeVariable("Value")),
+                FunctionType((TypeVariable("Value"),), BOOLEAN),
+            ],
+            ListType(TypeVariable("Value")),
+        ),
+        (
+            "all",
+            [
+                ListType(TypeVariable("Value")),
+                FunctionType((TypeVariable("Value"),), BOOLEAN),
+            ],
+            BOOLEAN,
+        ),
+        (
+            "any",
+            [
+                ListType(TypeVariable("Value")),
+                FunctionType((TypeVariable("Value"),), BOOLEAN),
+            ],
+            BOOLEAN,
+        ),
+        (
+            "find",
+            [
+                ListType(TypeVariable("Value")),
+                FunctionType((TypeVariable("Value"),), BOOLEAN),
+            ],
+            GenericInstance("Option", (TypeVariable("Value"),)),
+        ),
+        (
+            "reduce",
+            [
+                ListType(TypeVariable("Value")),
+                TypeVariable("Output"),
+                FunctionType(
+                    (TypeVariable("Output"), TypeVariable("Value")),
+                    TypeVariable("Output"),
+                ),
+            ],
+            TypeVariable("Output"),
+        ),
+        # Parallel HOFs: same signatures as sequential counterparts
+        (
+            "par_map",
+            [
+                ListType(TypeVariable("Value")),
+                FunctionType((TypeVariable("Value"),), TypeVariable("Output")),
+            ],
+            ListType(TypeVariable("Output")),
+        ),
+        (
+            "par_filter",
+            [
+                ListType(TypeVariable("Value")),
+                FunctionType((TypeVariable("Value"),), BOOLEAN),
+            ],
+            ListType(TypeVariable("Value")),
+        ),
+        (
+            "par_reduce",
+            [
+                ListType(TypeVariable("Value")),
+                TypeVariable("Output"),
+                FunctionType(
+                    (TypeVariable("Output"), TypeVariable("Value")),
+                    TypeVariable("Output"),
+                ),
+            ],
+            TypeVariable("Output"),
+        ),
+        (
+            "par_each",
+            [
+                ListType(TypeVariable("Value")),
+                FunctionType((TypeVariable("Value"),), TypeVariable("Output")),
+            ],
+            UNIT,
+        ),
+        ("clamp", [INTEGER, INTEGER, INTEGER], INTEGER),
+    ]
+    signatures = tuple(
+        FunctionSignature(
+            verb=None,
+            name=name,
+            param_names=[f"p{i}" for i in range(len(param_types))],
+            param_types=param_types,
+            return_type=return_type,
+            can_fail=False,
+            span=_dummy,
+            requires=[],
+        )
+        for name, param_types, return_type in builtins
+    )
+    return tuple(types), signatures, MappingProxyType(extra_types)
+
+
+class _StopChecking(Exception):
+    """Internal exception that ends a check once the ``stop_on`` error is emitted."""
+
+
+def _edit_distance(a: str, b: str, limit: int | None = None) -> int:
+    """Compute Levenshtein edit distance between two strings.
+
+    With *limit*, stop as soon as the distance is known to exceed it and
+    return ``limit + 1``.
+    """
     if len(a) < len(b):
-        return _edit_distance(b, a)
+        return _edit_distance(b, a, limit)
     if not b:
         return len(a)
     prev = list(range(len(b) + 1))
@@ -195,6 +374,8 @@ def _edit_distance(a: str, b: str) -> int:
         for j, cb in enumerate(b):
             cost = 0 if ca == cb else 1
             curr.append(min(prev[j + 1] + 1, curr[j] + 1, prev[j] + cost))
+        if limit is not None and min(curr) > limit:
+            return limit + 1
         prev = curr
     return prev[-1]
 
@@ -317,6 +498,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         # Store-backed lookup type names (runtime data, not compile-time)
         self._store_lookup_types: set[str] = set()
         STORE_BACKED_TYPES.clear()
+        clear_compat_cache()
         # Expected type context for bidirectional type inference (e.g. binary lookups)
         self._expected_type: Type | None = None
         # Ownership tracking: variables that have been moved (passed to Own parameters)
@@ -331,6 +513,11 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         self._temporal_order: list[str] = []
         # Coherence checking enabled (set via CLI --coherence flag)
         self._coherence: bool = False
+        # Error code that ends the check as soon as it is emitted (see check())
+        self._stop_on: str | None = None
+        # Depth of speculative inference whose diagnostics may be rolled back;
+        # stop_on is deferred until they are kept (see _commit_speculative)
+        self._speculative: int = 0
         # Set when checking a stdlib module itself (skip E316 for builtins it provides)
         self._is_stdlib: bool = False
         # Flag: current expression is the direct callee of an AsyncCallExpr (&)
@@ -357,8 +544,27 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
 
     # ── Public API ──────────────────────────────────────────────
 
-    def check(self, module: Module) -> SymbolTable:
-        """Run both passes on a module. Raises nothing; check self.diagnostics."""
+    def check(
+        self, module: Module, *, lint: bool = True, stop_on: str | None = None
+    ) -> SymbolTable:
+        """Run both passes on a module. Raises nothing; check self.diagnostics.
+
+        With ``lint=False`` the whole-module lint passes (unused names,
+        domain profiles, verification chains, coherence) are skipped.  They
+        only ever add warnings and info notes, so callers that care about
+        errors alone get the same error set for less work.
+
+        With ``stop_on`` set to an error code, checking stops right after the
+        first error with that code; diagnostics and symbols are then partial.
+        """
+        self._stop_on = stop_on
+        try:
+            self._check_module(module, lint)
+        except _StopChecking:
+            pass
+        return self.symbols
+
+    def _check_module(self, module: Module, lint: bool) -> None:
         self._register_builtins()
 
         # Require a module declaration with narrative (skip for internal sources)
@@ -453,6 +659,11 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                     elif isinstance(item, MainDef):
                         self._check_main(item)
 
+        if lint:
+            self._run_lints(module)
+
+    def _run_lints(self, module: Module) -> None:
+        """Whole-module passes that emit only warnings and info notes."""
         # Check unused variables (W300)
         self._check_unused()
 
@@ -475,8 +686,6 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         if self._coherence:
             self._check_coherence(module)
 
-        return self.symbols
-
     def has_errors(self) -> bool:
         return any(d.severity == Severity.ERROR for d in self.diagnostics)
 
@@ -487,15 +696,32 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         """Find the closest match for *name* among *candidates*."""
         best: str | None = None
         best_dist = max_dist + 1
+        n = len(name)
         for c in candidates:
-            d = _edit_distance(name, c)
+            # The length difference is a lower bound on the edit distance.
+            if abs(len(c) - n) >= best_dist:
+                continue
+            d = _edit_distance(name, c, best_dist - 1)
             if d < best_dist:
                 best_dist = d
                 best = c
         return best if best_dist <= max_dist else None
 
+    def _emit(self, diag: Diagnostic) -> None:
+        self.diagnostics.append(diag)
+        if diag.code == self._stop_on and diag.severity == Severity.ERROR and not self._speculative:
+            raise _StopChecking
+
+    def _commit_speculative(self, start: int) -> None:
+        """Keep the diagnostics emitted since *start*, honouring ``stop_on``."""
+        if self._speculative or self._stop_on is None:
+            return
+        for diag in self.diagnostics[start:]:
+            if diag.code == self._stop_on and diag.severity == Severity.ERROR:
+                raise _StopChecking
+
     def _error(self, code: str, message: str, span: Span) -> None:
-        self.diagnostics.append(
+        self._emit(
             Diagnostic(
                 severity=Severity.ERROR,
                 code=code,
@@ -505,7 +731,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         )
 
     def _warning(self, code: str, message: str, span: Span) -> None:
-        self.diagnostics.append(
+        self._emit(
             Diagnostic(
                 severity=Severity.WARNING,
                 code=code,
@@ -515,7 +741,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         )
 
     def _info(self, code: str, message: str, span: Span) -> None:
-        self.diagnostics.append(
+        self._emit(
             Diagnostic(
                 severity=Severity.NOTE,
                 code=code,
@@ -545,169 +771,12 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
 
     def _register_builtins(self) -> None:
         """Register built-in types and functions."""
-        # Built-in primitive types
-        for name, ty in BUILTINS.items():
+        types, signatures, extra_types = _builtin_tables()
+        for name, ty in types:
             self.symbols.define_type(name, ty)
-
-        # Generic constructors
-        self.symbols.define_type(
-            "Result",
-            GenericInstance(
-                "Result",
-                [TypeVariable("Value"), TypeVariable("Error")],
-            ),
-        )
-        self.symbols.define_type(
-            "Option",
-            GenericInstance(
-                "Option",
-                [TypeVariable("Value")],
-            ),
-        )
-        self.symbols.define_type("List", ListType(TypeVariable("Value")))
-        self.symbols.define_type(
-            "Table",
-            GenericInstance(
-                "Table",
-                [TypeVariable("Value")],
-            ),
-        )
-        self.symbols.define_type("Error", PrimitiveType("Error"))
-        self.symbols.define_type("Value", TypeVariable("Value"))
-        self.symbols.define_type("Source", TypeVariable("Source"))
-        self.symbols.define_type("Verb", PrimitiveType("Verb"))
-        self.symbols.define_type("Attached", PrimitiveType("Attached"))
-        self.symbols.define_type("Listens", PrimitiveType("Listens"))
-
-        _dummy = Span("<builtin>", 0, 0, 0, 0)
-
-        # Common built-in functions
         # Builtins that accept additional types beyond their signature.
-        # Maps (func_name, param_index) → frozenset of extra types.
-        _cursor_ty = PrimitiveType("Cursor")
-        self._builtin_extra_types: dict[tuple[str, int], frozenset[Type]] = {
-            ("len", 0): frozenset({STRING}),
-            ("map", 0): frozenset({_cursor_ty}),
-            ("each", 0): frozenset({_cursor_ty}),
-            ("filter", 0): frozenset({_cursor_ty}),
-            ("reduce", 0): frozenset({_cursor_ty}),
-            ("all", 0): frozenset({_cursor_ty}),
-            ("any", 0): frozenset({_cursor_ty}),
-            ("find", 0): frozenset({_cursor_ty}),
-        }
-
-        builtins = [
-            ("len", [ListType(TypeVariable("Value"))], INTEGER),
-            (
-                "map",
-                [
-                    ListType(TypeVariable("Value")),
-                    FunctionType([TypeVariable("Value")], TypeVariable("Output")),
-                ],
-                ListType(TypeVariable("Output")),
-            ),
-            (
-                "each",
-                [
-                    ListType(TypeVariable("Value")),
-                    FunctionType([TypeVariable("Value")], TypeVariable("Output")),
-                ],
-                UNIT,
-            ),
-            (
-                "filter",
-                [
-                    ListType(TypeVariable("Value")),
-                    FunctionType([TypeVariable("Value")], BOOLEAN),
-                ],
-                ListType(TypeVariable("Value")),
-            ),
-            (
-                "all",
-                [
-                    ListType(TypeVariable("Value")),
-                    FunctionType([TypeVariable("Value")], BOOLEAN),
-                ],
-                BOOLEAN,
-            ),
-            (
-                "any",
-                [
-                    ListType(TypeVariable("Value")),
-                    FunctionType([TypeVariable("Value")], BOOLEAN),
-                ],
-                BOOLEAN,
-            ),
-            (
-                "find",
-                [
-                    ListType(TypeVariable("Value")),
-                    FunctionType([TypeVariable("Value")], BOOLEAN),
-                ],
-                GenericInstance("Option", [TypeVariable("Value")]),
-            ),
-            (
-                "reduce",
-                [
-                    ListType(TypeVariable("Value")),
-                    TypeVariable("Output"),
-                    FunctionType(
-                        [TypeVariable("Output"), TypeVariable("Value")],
-                        TypeVariable("Output"),
-                    ),
-                ],
-                TypeVariable("Output"),
-            ),
-            # Parallel HOFs: same signatures as sequential counterparts
-            (
-                "par_map",
-                [
-                    ListType(TypeVariable("Value")),
-                    FunctionType([TypeVariable("Value")], TypeVariable("Output")),
-                ],
-                ListType(TypeVariable("Output")),
-            ),
-            (
-                "par_filter",
-                [
-                    ListType(TypeVariable("Value")),
-                    FunctionType([TypeVariable("Value")], BOOLEAN),
-                ],
-                ListType(TypeVariable("Value")),
-            ),
-            (
-                "par_reduce",
-                [
-                    ListType(TypeVariable("Value")),
-                    TypeVariable("Output"),
-                    FunctionType(
-                        [TypeVariable("Output"), TypeVariable("Value")],
-                        TypeVariable("Output"),
-                    ),
-                ],
-                TypeVariable("Output"),
-            ),
-            (
-                "par_each",
-                [
-                    ListType(TypeVariable("Value")),
-                    FunctionType([TypeVariable("Value")], TypeVariable("Output")),
-                ],
-                UNIT,
-            ),
-            ("clamp", [INTEGER, INTEGER, INTEGER], INTEGER),
-        ]
-        for name, param_types, return_type in builtins:
-            sig = FunctionSignature(
-                verb=None,
-                name=name,
-                param_names=[f"p{i}" for i in range(len(param_types))],
-                param_types=param_types,
-                return_type=return_type,
-                can_fail=False,
-                span=_dummy,
-                requires=[],
-            )
+        self._builtin_extra_types: Mapping[tuple[str, int], frozenset[Type]] = extra_types
+        for sig in signatures:
             self.symbols.define_function(sig)
 
     def _forward_declare_type(self, td: TypeDef) -> None:
@@ -745,9 +814,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
             for rf in rec_fields:
                 if rf.direct:
                     # Find which type this field references
-                    variant = next(
-                        (v for v in resolved.variants if v.name == rf.variant_name), None
-                    )
+                    variant = resolved.variant_by_name.get(rf.variant_name)
                     if variant and rf.field_name in variant.fields:
                         ft = variant.fields[rf.field_name]
                         if isinstance(ft, AlgebraicType) and ft.name in all_type_names:
@@ -780,7 +847,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                     continue
                 grecs = find_recursive_fields(gtype, group - {gname})
                 rec_variants = {rf.variant_name for rf in grecs if rf.direct}
-                if {v.name for v in gtype.variants} - rec_variants:
+                if gtype.variant_names - rec_variants:
                     group_has_base = True
                     break
             if not group_has_base:
@@ -889,6 +956,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
             self._lookup_tables[td.name] = body
             self._store_lookup_types.add(td.name)
             STORE_BACKED_TYPES.add(td.name)
+            clear_compat_cache()
             # Validate column types
             if body.is_binary:
                 self._validate_binary_lookup(body, td.span)
@@ -1703,9 +1771,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
             for entry in fd.explain.entries:
                 if entry.condition is not None:
                     cond_type = self._infer_expr(entry.condition)
-                    if not isinstance(cond_type, ErrorType) and not types_compatible(
-                        BOOLEAN, cond_type
-                    ):
+                    if cond_type is not ERROR_TY and not types_compatible(BOOLEAN, cond_type):
                         self._error(
                             "E394",
                             f"explain condition must be Boolean, got '{type_name(cond_type)}'",
@@ -1881,7 +1947,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         if fd.verb == "validates":
             # validates has implicit Boolean return
             if fd.return_type is not None:
-                self.diagnostics.append(
+                self._emit(
                     Diagnostic(
                         severity=Severity.NOTE,
                         code="I360",
@@ -1896,7 +1962,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                     )
                 )
             # Body must return Boolean (or compatible)
-            if not isinstance(body_type, ErrorType) and not types_compatible(BOOLEAN, body_type):
+            if body_type is not ERROR_TY and not types_compatible(BOOLEAN, body_type):
                 self._error(
                     "E322",
                     f"validates body must return Boolean, got '{type_name(body_type)}'",
@@ -1904,7 +1970,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                 )
         elif (
             fd.verb not in ("renders", "listens")
-            and not isinstance(body_type, ErrorType)
+            and body_type is not ERROR_TY
             and not types_compatible(return_type, body_type)
         ):
             # For failable functions, body can return the success type
@@ -1931,8 +1997,8 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         # but the user needs explicit conversion (e.g. Parse.text()).
         if (
             fd.verb != "validates"
-            and not isinstance(body_type, ErrorType)
-            and not isinstance(return_type, ErrorType)
+            and body_type is not ERROR_TY
+            and return_type is not ERROR_TY
             and self._has_implicit_value_coercion(return_type, body_type)
         ):
             self._error(
@@ -1990,9 +2056,9 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                             verb_sigs.append((elem.name, sig))
                 if len(verb_sigs) >= 2:
                     ref_name, ref_sig = verb_sigs[0]
-                    ref_arity = len(ref_sig.param_types)
+                    ref_arity = ref_sig.arity
                     for fn_name, fn_sig in verb_sigs[1:]:
-                        fn_arity = len(fn_sig.param_types)
+                        fn_arity = fn_sig.arity
                         if fn_arity != ref_arity:
                             self._error(
                                 "E402",
@@ -2063,7 +2129,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         if isinstance(body, RecordTypeDef):
             for f in body.fields:
                 ft = self._resolve_type_expr(f.type_expr)
-                if isinstance(ft, UnitType):
+                if ft is UNIT:
                     self._error(
                         "E435",
                         f"field '{f.name}' has type Unit, which has no "
@@ -2501,7 +2567,8 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
             if fd.params:
                 first_type = self._resolve_type_expr(fd.params[0].type_expr)
                 is_matchable = (
-                    isinstance(first_type, (AlgebraicType, ErrorType))
+                    first_type is ERROR_TY
+                    or isinstance(first_type, AlgebraicType)
                     or (
                         isinstance(first_type, PrimitiveType)
                         and first_type.name in ("String", "Integer", "Boolean")
@@ -2734,10 +2801,10 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
 
     def _has_pure_overload(self, name: str) -> bool:
         """Check if a function name has at least one pure verb overload."""
-        for verb, fname in self.symbols.all_functions():
-            if fname == name and verb in _PURE_VERBS:
-                return True
-        return False
+        # Functions are keyed by (verb, name): probe each pure verb directly
+        # instead of scanning every registered function.
+        functions = self.symbols.all_functions()
+        return any((verb, name) in functions for verb in _PURE_VERBS)
 
     def _check_pure_body(self, body: list[Stmt | MatchExpr], span: Span) -> None:
         """Check that a body doesn't contain IO calls."""
@@ -3022,7 +3089,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                         not isinstance(sig.return_type, PrimitiveType)
                         or sig.return_type.name != "Unit"
                     ):
-                        self.diagnostics.append(
+                        self._emit(
                             Diagnostic(
                                 severity=Severity.WARNING,
                                 code="W332",
@@ -3084,7 +3151,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         expected = None
         if vd.type_expr is not None:
             expected = self._resolve_type_expr(vd.type_expr)
-            if isinstance(expected, UnitType):
+            if expected is UNIT:
                 self._error(
                     "E326",
                     "cannot use 'Unit' as a variable type",
@@ -3093,7 +3160,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
 
         inferred = self._infer_expr(vd.value, expected_type=expected)
 
-        if isinstance(inferred, UnitType) and not isinstance(expected, UnitType):
+        if inferred is UNIT and expected is not UNIT:
             self._error(
                 "E326",
                 "cannot assign a 'Unit' value to a variable",
@@ -3160,7 +3227,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         else:
             resolved = inferred
             # Record inferred type for LSP inlay hints (untyped VarDecl only)
-            if not isinstance(resolved, ErrorType):
+            if resolved is not ERROR_TY:
                 self.inlay_type_map[(vd.span.start_line, vd.span.start_col)] = type_name(resolved)
 
         # Static refinement check: reject invalid constants at compile time
@@ -3188,7 +3255,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         if sym is None:
             # Implicit declaration: `x = expr` without `x as Type = expr`
             tn = type_name(value_type)
-            self.diagnostics.append(
+            self._emit(
                 Diagnostic(
                     severity=Severity.NOTE,
                     code="I310",
@@ -3335,7 +3402,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
             if expr.args is None:
                 # Function reference: valid error → FunctionType([Diagnostic], Boolean)
                 if sig is not None and sig.param_types:
-                    return FunctionType(list(sig.param_types), BOOLEAN)
+                    return FunctionType(tuple(sig.param_types), BOOLEAN)
             # Check argument types against the validator's parameter types
             if sig is not None and expr.args is not None:
                 for i, (param_ty, arg_expr) in enumerate(zip(sig.param_types, expr.args)):
@@ -3343,10 +3410,15 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                     # that are not yet in scope (e.g. local vars in ensures clauses).
                     # Roll back those side-effect diagnostics if the arg is unresolved.
                     _diag_count = len(self.diagnostics)
-                    arg_ty = self._infer_expr(arg_expr)
-                    if isinstance(arg_ty, ErrorType):
+                    self._speculative += 1
+                    try:
+                        arg_ty = self._infer_expr(arg_expr)
+                    finally:
+                        self._speculative -= 1
+                    if arg_ty is ERROR_TY:
                         del self.diagnostics[_diag_count:]
                         continue
+                    self._commit_speculative(_diag_count)
                     # Allow Option<T>→T coercions: the C emitter generates .value
                     # unwrapping for params narrowed via requires valid
                     if (
@@ -3391,7 +3463,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
             )
             if suggestion:
                 diag.notes.append(f"did you mean '{suggestion}'?")
-            self.diagnostics.append(diag)
+            self._emit(diag)
             return ERROR_TY
         sym.used = True
         if self._match_arm_depth == 0:
@@ -3420,7 +3492,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         right = self._infer_expr(expr.right)
 
         # Error types propagate without cascading
-        if isinstance(left, ErrorType) or isinstance(right, ErrorType):
+        if left is ERROR_TY or right is ERROR_TY:
             return ERROR_TY
 
         # Comparison operators always return Boolean
@@ -3476,7 +3548,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         """Check fail propagation (!)."""
         inner_expected = None
         if expected_type is not None:
-            inner_expected = GenericInstance("Result", [expected_type, ERROR_TY])
+            inner_expected = GenericInstance("Result", (expected_type, ERROR_TY))
         inner = self._infer_expr(expr.expr, expected_type=inner_expected)
 
         # Current function must be failable
@@ -3487,7 +3559,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
             elif isinstance(self._current_function, MainDef):
                 can_fail = self._current_function.can_fail
             if not can_fail:
-                self.diagnostics.append(
+                self._emit(
                     Diagnostic(
                         severity=Severity.ERROR,
                         code="E350",
@@ -3517,11 +3589,11 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
 
         # The inner expression must be a failable (Result-returning or Fail-effected) call
         if (
-            not isinstance(inner, ErrorType)
+            inner is not ERROR_TY
             and not (isinstance(inner, GenericInstance) and inner.base_name == "Result")
             and not (isinstance(inner, EffectType) and "Fail" in inner.effects)
         ):
-            self.diagnostics.append(
+            self._emit(
                 Diagnostic(
                     severity=Severity.ERROR,
                     code="E351",
@@ -3680,7 +3752,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                             "`true` branch directly.",
                         ],
                     )
-                    self.diagnostics.append(diag)
+                    self._emit(diag)
                     break
 
         # Check exhaustiveness for algebraic types
@@ -3761,7 +3833,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                 arm_type = self._check_stmt(stmt)  # type: ignore[assignment]
             if not is_bool_match:
                 self._match_arm_depth -= 1
-            if not isinstance(arm_type, ErrorType):
+            if arm_type is not ERROR_TY:
                 result_type = arm_type
             arm_types.append((arm_type, arm))
             self.symbols.pop_scope()
@@ -3776,7 +3848,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         # Find the dominant value type (first non-Unit, non-Error arm type)
         value_type: Type | None = None
         for t, _ in arm_types:
-            if not isinstance(t, (UnitType, ErrorType)):
+            if t is not UNIT and t is not ERROR_TY:
                 value_type = t
                 break
         if value_type is not None:
@@ -3808,14 +3880,14 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                             "None",
                         ):
                             continue
-                        if isinstance(arm_type, UnitType):
+                        if arm_type is UNIT:
                             self._error(
                                 "E400",
                                 f"match arm returns Unit but other arms return "
                                 f"'{type_name(value_type)}'",
                                 arm.span,
                             )
-                        elif not isinstance(arm_type, ErrorType) and not types_compatible(
+                        elif arm_type is not ERROR_TY and not types_compatible(
                             value_type, arm_type
                         ):
                             self._error(
@@ -3937,7 +4009,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
 
         if isinstance(obj_type, ListType):
             return obj_type.element
-        if isinstance(obj_type, ErrorType):
+        if obj_type is ERROR_TY:
             return ERROR_TY
         return ERROR_TY
 
@@ -3987,8 +4059,8 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
     def _infer_comptime(self, expr: ComptimeExpr) -> Type:
         # Register comptime built-in functions so type-checking passes
         comptime_builtins = {
-            "platform": FunctionType([], STRING),
-            "read": FunctionType([STRING], STRING),
+            "platform": FunctionType((), STRING),
+            "read": FunctionType((STRING,), STRING),
         }
         for name, ty in comptime_builtins.items():
             if self.symbols.lookup(name) is None:
@@ -4040,20 +4112,17 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
         elif isinstance(pattern, VariantPattern):
             # Check variant exists
             if isinstance(subject_type, AlgebraicType):
-                found = False
-                for v in subject_type.variants:
-                    if v.name == pattern.name:
-                        found = True
-                        # Bind sub-patterns
-                        for i, sub in enumerate(pattern.fields):
-                            field_names = list(v.fields.keys())
-                            if i < len(field_names):
-                                ft = v.fields[field_names[i]]
-                            else:
-                                ft = ERROR_TY
-                            self._check_pattern(sub, ft)
-                        break
-                if not found:
+                v = subject_type.variant_by_name.get(pattern.name)
+                if v is not None:
+                    # Bind sub-patterns
+                    field_names = list(v.fields.keys())
+                    for i, sub in enumerate(pattern.fields):
+                        if i < len(field_names):
+                            ft = v.fields[field_names[i]]
+                        else:
+                            ft = ERROR_TY
+                        self._check_pattern(sub, ft)
+                else:
                     self._error("E370", f"unknown variant '{pattern.name}'", pattern.span)
             elif isinstance(subject_type, GenericInstance):
                 # Handle Result<Value, Error> and Option<Value> variant patterns
@@ -4121,7 +4190,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                 inner_type = args[1]
                 valid = True
             else:
-                self.diagnostics.append(
+                self._emit(
                     make_diagnostic(
                         Severity.ERROR,
                         "E372",
@@ -4140,7 +4209,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                 inner_type = None  # No binding for None
                 valid = True
             else:
-                self.diagnostics.append(
+                self._emit(
                     make_diagnostic(
                         Severity.ERROR,
                         "E372",
@@ -4161,8 +4230,8 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
 
     def _check_exhaustiveness(self, expr: MatchExpr, subject_type: AlgebraicType) -> None:
         """Check match exhaustiveness for algebraic types."""
-        variant_names = {v.name for v in subject_type.variants}
-        covered: set[str] = set()
+        variant_bits = subject_type.variant_bits
+        covered = 0
         has_wildcard = False
         wildcard_seen = False
 
@@ -4171,14 +4240,15 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                 self._info("I301", "unreachable match arm after wildcard", arm.span)
 
             if isinstance(arm.pattern, VariantPattern):
-                if arm.pattern.name in variant_names:
-                    if arm.pattern.name in covered and not arm.pattern.fields:
+                bit = variant_bits.get(arm.pattern.name)
+                if bit is not None:
+                    if covered & bit and not arm.pattern.fields:
                         self._warning(
                             "W305",
                             f"duplicate match arm for variant '{arm.pattern.name}'",
                             arm.pattern.span,
                         )
-                    covered.add(arm.pattern.name)
+                    covered |= bit
                 else:
                     self._error("E370", f"unknown variant '{arm.pattern.name}'", arm.pattern.span)
             elif isinstance(arm.pattern, WildcardPattern):
@@ -4188,34 +4258,30 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                 has_wildcard = True
                 wildcard_seen = True
 
-        if not has_wildcard:
-            missing = variant_names - covered
-            if missing:
-                names = ", ".join(sorted(missing))
-                arms_str = " | ".join(f"{v} => ..." for v in sorted(missing))
-                self.diagnostics.append(
-                    Diagnostic(
-                        severity=Severity.ERROR,
-                        code="E371",
-                        message=f"non-exhaustive match: missing {names}",
-                        labels=[DiagnosticLabel(span=expr.span, message="")],
-                        suggestions=[
-                            Suggestion(
-                                message="add the missing arms",
-                                replacement=arms_str,
-                            )
-                        ],
-                    )
+        if not has_wildcard and covered != (1 << len(variant_bits)) - 1:
+            missing = [name for name, bit in variant_bits.items() if not covered & bit]
+            names = ", ".join(sorted(missing))
+            arms_str = " | ".join(f"{v} => ..." for v in sorted(missing))
+            self._emit(
+                Diagnostic(
+                    severity=Severity.ERROR,
+                    code="E371",
+                    message=f"non-exhaustive match: missing {names}",
+                    labels=[DiagnosticLabel(span=expr.span, message="")],
+                    suggestions=[
+                        Suggestion(
+                            message="add the missing arms",
+                            replacement=arms_str,
+                        )
+                    ],
                 )
+            )
 
     def _check_generic_exhaustiveness(self, expr: MatchExpr, subject_type: GenericInstance) -> None:
         """Check match exhaustiveness for Result/Option generic types."""
         base = subject_type.base_name
-        if base == "Result":
-            required = {"Ok", "Err"}
-        elif base == "Option":
-            required = {"Some", "None"}
-        else:
+        required = _GENERIC_VARIANTS.get(base)
+        if required is None:
             return
 
         covered: set[str] = set()
@@ -4242,7 +4308,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                     f"{v}(x) => ..." if v not in ("None",) else f"{v} => ..."
                     for v in sorted(missing)
                 )
-                self.diagnostics.append(
+                self._emit(
                     make_diagnostic(
                         Severity.ERROR,
                         "E373",
@@ -4303,7 +4369,7 @@ class Checker(TypeCheckMixin, CallCheckMixin, ContractCheckMixin):
                 return ArrayType(args[0])
             # Special-case Verb<P1, ..., Pn, R> → FunctionType
             if type_expr.name == "Verb" and len(args) >= 1:
-                return FunctionType(list(args[:-1]), args[-1])
+                return FunctionType(tuple(args[:-1]), args[-1])
             # Check base type exists
             base = self.symbols.resolve_type(type_expr.name)
             if base is None:
@@ -14,7 +14,6 @@ import click
 
 from prove import __version__
 from prove.errors import CompileError, DiagnosticRenderer
-from prove.parse import parse
 
 
 def _apply_nlp_override(enabled: bool) -> None:
@@ -77,6 +76,7 @@ def check(path: str, md: bool, strict: bool, no_intent: bool) -> None:
     from prove.checker import Checker
     from prove.errors import DiagnosticRenderer
     from prove.module_resolver import build_module_registry
+    from prove.parse import parse
 
     project_dir = Path(path).resolve()
     src_dir = project_dir / "src"
@@ -134,6 +134,7 @@ def format_cmd(path: str, status: bool, md: bool) -> None:
     from prove.checker import Checker
     from prove.formatter import ProveFormatter
     from prove.module_resolver import build_module_registry
+    from prove.parse import parse
 
     project_dir = Path(path).resolve()
     src_dir = project_dir / "src"
@@ -189,6 +190,7 @@ def test(path: str, property_rounds: int) -> None:
     """Run contract tests for a Prove project (Python fallback)."""
     from prove.checker import Checker
     from prove.module_resolver import build_module_registry
+    from prove.parse import parse
     from prove.testing import TestGenerator
 
     project_dir = Path(path).resolve()
@@ -318,6 +320,7 @@ def _generate_from_narrative(target: Path, update: bool, dry_run: bool) -> None:
     from prove._body_gen import generate_function_source, has_generated_marker
     from prove._nl_intent import extract_nouns, implied_verbs, pair_verbs_nouns
     from prove.ast_nodes import FunctionDef, ModuleDecl, TodoStmt
+    from prove.parse import parse
 
     source = target.read_text()
     filename = str(target)
@@ -910,6 +913,8 @@ def package_clean() -> None:
 
 def _view_impl(file: str) -> None:
     """View the AST of a Prove source file."""
+    from prove.parse import parse
+
     source = Path(file).read_text()
     filename = str(file)
 
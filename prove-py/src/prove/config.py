@@ -5,7 +5,9 @@ from __future__ import annotations
 import os
 import tomllib
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 
 def _expand_flags(flags: list[str], base: Path) -> list[str]:
@@ -89,23 +91,36 @@ def discover_prv_files(root: Path) -> list[Path]:
 
 def find_config(start_path: Path | None = None) -> Path:
     """Walk up directories to find prove.toml. Raises FileNotFoundError."""
-    path = (start_path or Path.cwd()).resolve()
-    if path.is_file():
-        path = path.parent
+    # Walk plain strings; only the match is wrapped in a Path.
+    path = os.path.realpath(start_path if start_path is not None else os.getcwd())
+    if os.path.isfile(path):
+        path = os.path.dirname(path)
     while True:
-        candidate = path / "prove.toml"
-        if candidate.exists():
-            return candidate
-        parent = path.parent
+        candidate = os.path.join(path, "prove.toml")
+        if os.path.isfile(candidate):
+            return Path(candidate)
+        parent = os.path.dirname(path)
         if parent == path:
             raise FileNotFoundError("No prove.toml found in any parent directory")
         path = parent
 
 
-def load_config(path: Path) -> ProveConfig:
-    """Parse a prove.toml file into a ProveConfig."""
+@lru_cache(maxsize=64)
+def _read_toml(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a TOML file; the stat fields key the cache so edits are re-read."""
     with open(path, "rb") as f:
-        data = tomllib.load(f)
+        return tomllib.load(f)
+
+
+def load_config(path: Path) -> ProveConfig:
+    """Parse a prove.toml file into a ProveConfig.
+
+    The parsed TOML is cached per (path, mtime, size), so long-running
+    callers like the LSP only re-read prove.toml after it changes. Each call
+    still builds a fresh ProveConfig, copying list values out of the cache.
+    """
+    st = os.stat(path)
+    data = _read_toml(os.fspath(path), st.st_mtime_ns, st.st_size)
 
     config = ProveConfig()
 
@@ -114,7 +129,7 @@ def load_config(path: Path) -> ProveConfig:
         config.package = PackageConfig(
             name=pkg.get("name", "untitled"),
             version=pkg.get("version", "0.0.0"),
-            authors=pkg.get("authors", []),
+            authors=list(pkg.get("authors", [])),
             license=pkg.get("license", ""),
         )
 
@@ -126,10 +141,10 @@ def load_config(path: Path) -> ProveConfig:
             debug=bld.get("debug", False),
             c_flags=_expand_flags(bld.get("c_flags", []), path.parent),
             link_flags=_expand_flags(bld.get("link_flags", []), path.parent),
-            c_sources=bld.get("c_sources", []),
-            pre_build=bld.get("pre_build", []),
+            c_sources=list(bld.get("c_sources", [])),
+            pre_build=[list(cmd) for cmd in bld.get("pre_build", [])],
             ccache=bld.get("ccache", True),
-            vendor_libs=bld.get("vendor_libs", []),
+            vendor_libs=list(bld.get("vendor_libs", [])),
         )
 
     if "optimize" in data:
@@ -231,57 +231,52 @@ class DiagnosticRenderer:
     def render(self, diag: Diagnostic) -> str:
         lines: list[str] = []
         sev = diag.severity
-        color = _COLORS[sev]
+        # Resolve escape codes once; every line below reuses these fragments.
+        if self.color:
+            color, blue, bold, reset = _COLORS[sev], _BLUE, _BOLD, _RESET
+        else:
+            color = blue = bold = reset = ""
+        bar = f"  {blue}   |{reset}"
+        eq = f"  {blue}={reset}"
 
         # Header: error[E042]: message
-        lines.append(
-            f"{self._c(color)}{sev.value}[{diag.code}]{self._c(_RESET)}"
-            f"{self._c(_BOLD)}: {diag.message}{self._c(_RESET)}"
-        )
+        lines.append(f"{color}{sev.value}[{diag.code}]{reset}{bold}: {diag.message}{reset}")
 
         # Labels
         for label in diag.labels:
             span = label.span
             loc = f"{span.file}:{span.start_line}:{span.start_col}"
-            lines.append(f"  {self._c(_BLUE)}-->{self._c(_RESET)} {loc}")
-            gutter = f"{span.start_line:>4}"
-            lines.append(f"  {self._c(_BLUE)}   |{self._c(_RESET)}")
+            lines.append(f"  {blue}-->{reset} {loc}")
+            gutter = f"  {blue}{span.start_line:>4} |{reset}"
+            lines.append(bar)
 
             # Show the source line if available
             source_line = self._get_source_line(span.file, span.start_line)
             if source_line is not None:
-                lines.append(f"  {self._c(_BLUE)}{gutter} |{self._c(_RESET)} {source_line}")
+                lines.append(f"{gutter} {source_line}")
 
             # Show carets underneath
             if span.start_line == span.end_line:
                 caret_len = max(1, span.end_col - span.start_col + 1)
                 padding = " " * (span.start_col - 1)
                 carets = "^" * caret_len
-                lines.append(
-                    f"  {self._c(_BLUE)}   |{self._c(_RESET)} "
-                    f"{padding}{self._c(color)}{carets}{self._c(_RESET)}"
-                )
+                lines.append(f"{bar} {padding}{color}{carets}{reset}")
             else:
                 if source_line is None:
-                    lines.append(f"  {self._c(_BLUE)}{gutter} |{self._c(_RESET)}")
+                    lines.append(gutter)
 
             if label.message:
-                lines.append(
-                    f"  {self._c(_BLUE)}   |{self._c(_RESET)}   "
-                    f"{self._c(color)}{label.message}{self._c(_RESET)}"
-                )
+                lines.append(f"{bar}   {color}{label.message}{reset}")
 
         # Notes
-        for note in diag.notes:
-            lines.append(f"  {self._c(_BLUE)}={self._c(_RESET)} note: {note}")
+        lines.extend(f"{eq} note: {note}" for note in diag.notes)
 
         # Suggestions
-        for suggestion in diag.suggestions:
-            lines.append(f"  {self._c(_BLUE)}try:{self._c(_RESET)} {suggestion.replacement}")
+        lines.extend(f"  {blue}try:{reset} {s.replacement}" for s in diag.suggestions)
 
         # Doc link
         if diag.doc_url:
-            lines.append(f"  {self._c(_BLUE)}={self._c(_RESET)} help: {diag.doc_url}")
+            lines.append(f"{eq} help: {diag.doc_url}")
 
         return "\n".join(lines)
 
@@ -1260,7 +1260,7 @@ class ProveFormatter:
                 if fname != name:
                     continue
                 for s in sigs:
-                    if len(s.param_types) != arg_count:
+                    if s.arity != arg_count:
                         continue
                     r = s.return_type
                     if isinstance(r, GenericInstance) and r.base_name == "Result":
@@ -1294,9 +1294,9 @@ class ProveFormatter:
         FailProp (!) propagates the error case, so the variable holds the
         success type Value.  For non-Result return types, stringify as-is.
         """
-        from prove.types import ErrorType, GenericInstance, UnitType
+        from prove.types import ERROR_TY, UNIT, GenericInstance
 
-        if isinstance(ty, (UnitType, ErrorType)):
+        if ty is UNIT or ty is ERROR_TY:
             return None
         # Result<Value, Error> → Value (the success type)
         if isinstance(ty, GenericInstance) and ty.base_name == "Result" and ty.args:
@@ -1306,9 +1306,9 @@ class ProveFormatter:
     @staticmethod
     def _type_to_str(ty: Type) -> str | None:
         """Convert a resolved Type to source-level type syntax."""
-        from prove.types import ErrorType, FunctionType, UnitType, type_name
+        from prove.types import ERROR_TY, UNIT, FunctionType, type_name
 
-        if isinstance(ty, (UnitType, ErrorType, FunctionType)):
+        if ty is UNIT or ty is ERROR_TY or isinstance(ty, FunctionType):
             return None
         return type_name(ty)
 
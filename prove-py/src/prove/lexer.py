@@ -6,11 +6,13 @@ INDENT/DEDENT tokens and string interpolation support.
 
 from __future__ import annotations
 
+import re
+
 from prove.errors import CompileError, Diagnostic, DiagnosticLabel, Severity
 from prove.source import Span
 from prove.tokens import (
     KEYWORDS,
-    NEWLINE_SUPPRESSED_AFTER,
+    NEWLINE_SUPPRESSED_MASK,
     Token,
     TokenKind,
 )
@@ -39,6 +41,9 @@ _VALUE_TOKENS = frozenset(
     }
 )
 
+# Identifier tail: ``\w`` is exactly ``str.isalnum() or "_"`` for str patterns.
+_IDENT_RE = re.compile(r"\w*")
+
 
 class Lexer:
     """Tokenizes Prove source code."""
@@ -55,18 +60,22 @@ class Lexer:
         self.tokens: list[Token] = []
         self.diagnostics: list[Diagnostic] = []
         self._at_line_start = True
+        # word -> token kind, seeded with the keywords and filled as names are classified
+        self._word_kinds: dict[str, TokenKind] = dict(KEYWORDS)
 
     def lex(self) -> list[Token]:
         """Tokenize the entire source and return the token list."""
-        while self.pos < len(self.source):
+        source = self.source
+        n = len(source)
+        while self.pos < n:
             if self._at_line_start and self.bracket_depth == 0:
                 self._handle_indentation()
             self._at_line_start = False
 
             self._skip_spaces()
-            if self.pos >= len(self.source):
+            if self.pos >= n:
                 break
-            ch = self.source[self.pos]
+            ch = source[self.pos]
             if ch == "\n":
                 self._handle_newline()
             elif ch == "/" and self._peek(1) == "/" and self._peek(2) == "/":
@@ -124,10 +133,6 @@ class Lexer:
         ch = self.source[self.pos]
         return ch.isdigit() or ch == "_"
 
-    def _is_ident_char(self) -> bool:
-        ch = self.source[self.pos]
-        return ch.isalnum() or ch == "_"
-
     def _emit(self, kind: TokenKind, value: str, start_line: int, start_col: int) -> Token:
         end_col = self.col - 1 if self.col > 1 else 1
         span = Span(self.filename, start_line, start_col, self.line, end_col)
@@ -147,26 +152,50 @@ class Lexer:
             )
         )
 
+    def _advance_to(self, end: int) -> str:
+        """Consume ``source[pos:end]`` in one step and return it."""
+        chunk = self.source[self.pos : end]
+        newlines = chunk.count("\n")
+        if newlines:
+            self.line += newlines
+            self.col = len(chunk) - chunk.rfind("\n")
+        else:
+            self.col += len(chunk)
+        self.pos = end
+        return chunk
+
     def _skip_spaces(self) -> None:
         """Skip spaces and tabs (but not newlines)."""
-        while self.pos < len(self.source) and self.source[self.pos] in (" ", "\t"):
-            self._advance()
+        source = self.source
+        n = len(source)
+        pos = start = self.pos
+        while pos < n and source[pos] in " \t":
+            pos += 1
+        self.col += pos - start
+        self.pos = pos
 
     # ── Indentation ──────────────────────────────────────────────
 
     def _handle_indentation(self) -> None:
         """Process indentation at the start of a line."""
+        source = self.source
+        n = len(source)
+        pos = start = self.pos
         indent = 0
-        while self.pos < len(self.source) and self.source[self.pos] in (" ", "\t"):
-            if self.source[self.pos] == "\t":
+        while pos < n:
+            ch = source[pos]
+            if ch == " ":
+                indent += 1
+            elif ch == "\t":
                 indent += 4
             else:
-                indent += 1
-            self.pos += 1
-            self.col += 1
+                break
+            pos += 1
+        self.col += pos - start
+        self.pos = pos
 
         # Skip blank lines
-        if self.pos >= len(self.source) or self.source[self.pos] == "\n":
+        if pos >= n or source[pos] == "\n":
             return
 
         current = self.indent_stack[-1]
@@ -190,7 +219,7 @@ class Lexer:
 
         if self.bracket_depth > 0:
             return
-        if self.prev_token is not None and self.prev_token.kind in NEWLINE_SUPPRESSED_AFTER:
+        if self.prev_token is not None and (NEWLINE_SUPPRESSED_MASK >> self.prev_token.kind) & 1:
             return
 
         self._at_line_start = True
@@ -210,10 +239,9 @@ class Lexer:
             self._advance()
         if self.pos < len(self.source) and self.source[self.pos] == " ":
             self._advance()
-        text: list[str] = []
-        while self.pos < len(self.source) and self.source[self.pos] != "\n":
-            text.append(self._advance())
-        self._emit(kind, "".join(text), start_line, start_col)
+        end = self.source.find("\n", self.pos)
+        text = self._advance_to(len(self.source) if end < 0 else end)
+        self._emit(kind, text, start_line, start_col)
 
     def _lex_doc_comment(self) -> None:
         self._lex_comment(3, TokenKind.DOC_COMMENT)
@@ -230,16 +258,14 @@ class Lexer:
         self._advance()
         self._advance()
         self._advance()
-        text: list[str] = []
-        while self.pos < len(self.source):
-            if self.source[self.pos] == '"' and self._peek(1) == '"' and self._peek(2) == '"':
-                self._advance()
-                self._advance()
-                self._advance()
-                self._emit(TokenKind.TRIPLE_STRING_LIT, "".join(text), start_line, start_col)
-                return
-            text.append(self._advance())
-        self._error("unterminated triple-quoted string", start_line, start_col, "E102")
+        end = self.source.find('"""', self.pos)
+        if end < 0:
+            self._advance_to(len(self.source))
+            self._error("unterminated triple-quoted string", start_line, start_col, "E102")
+            return
+        text = self._advance_to(end)
+        self._advance_to(end + 3)
+        self._emit(TokenKind.TRIPLE_STRING_LIT, text, start_line, start_col)
 
     def _lex_string(self) -> None:
         """Lex a plain string literal. No interpolation — { is literal."""
@@ -531,10 +557,13 @@ class Lexer:
     def _lex_identifier(self) -> None:
         start_line = self.line
         start_col = self.col
-        text = []
-        while self.pos < len(self.source) and self._is_ident_char():
-            text.append(self._advance())
-        word = "".join(text)
+        # Identifier characters never include a newline, so scan ahead and
+        # slice the word out in one step instead of advancing per character.
+        source = self.source
+        end = _IDENT_RE.match(source, self.pos).end()
+        word = source[self.pos : end]
+        self.col += end - self.pos
+        self.pos = end
 
         # Check for f-string or r-string prefix
         if word in ("f", "r") and self.pos < len(self.source) and self.source[self.pos] == '"':
@@ -544,27 +573,25 @@ class Lexer:
                 self._lex_raw_string(start_line, start_col)
             return
 
-        # Check keywords first
-        if word in KEYWORDS:
-            self._emit(KEYWORDS[word], word, start_line, start_col)
-            return
-
-        # Classify identifier
-        kind = self._classify_identifier(word)
+        # Keywords and already-seen names resolve in one lookup
+        kind = self._word_kinds.get(word)
+        if kind is None:
+            kind = self._word_kinds[word] = self._classify_identifier(word)
         self._emit(kind, word, start_line, start_col)
 
     def _classify_identifier(self, word: str) -> TokenKind:
-        if word == "_":
+        # Every non-IDENTIFIER kind starts uppercase; most names do not.
+        if not word[0].isupper():
             return TokenKind.IDENTIFIER
         # All uppercase + underscores = CONSTANT (must have at least 2 chars)
         all_upper = all(c.isupper() or c == "_" or c.isdigit() for c in word)
-        if len(word) >= 2 and all_upper and word[0].isupper():
+        if len(word) >= 2 and all_upper:
             return TokenKind.CONSTANT_IDENTIFIER
         # Starts uppercase + has lowercase = TYPE
-        if word[0].isupper() and any(c.islower() for c in word):
+        if any(c.islower() for c in word):
             return TokenKind.TYPE_IDENTIFIER
         # Single uppercase letter = TYPE
-        if len(word) == 1 and word[0].isupper():
+        if len(word) == 1:
             return TokenKind.TYPE_IDENTIFIER
         return TokenKind.IDENTIFIER
 
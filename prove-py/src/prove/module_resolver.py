@@ -103,11 +103,11 @@ def build_module_registry(
         # Also register generic builtins
         type_registry["Result"] = GenericInstance(
             "Result",
-            [TypeVariable("Value"), TypeVariable("Error")],
+            (TypeVariable("Value"), TypeVariable("Error")),
         )
         type_registry["Option"] = GenericInstance(
             "Option",
-            [TypeVariable("Value")],
+            (TypeVariable("Value"),),
         )
         type_registry["List"] = ListType(TypeVariable("Value"))
         type_registry["Error"] = PrimitiveType("Error")
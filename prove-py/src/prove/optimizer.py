@@ -8,7 +8,7 @@ dataclasses.replace() for field updates.
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from prove.ast_nodes import (
     Assignment,
@@ -51,6 +51,40 @@ from prove.interpreter import ComptimeInterpreter
 from prove.symbols import SymbolTable
 from prove.verb_defs import NON_ALLOCATING_VERBS, PURE_VERBS
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Node type → fields holding a single sub-expression, for the read-only call
+# walkers. One dict lookup on type(expr) replaces an isinstance ladder; AST
+# node classes are never subclassed, so the exact type is a safe key.
+# Direct-call detection (recursion checks in TCO, inlining, compile-time
+# evaluation and memoization).
+_SELF_CALL_FIELDS: dict[type, tuple[str, ...]] = {
+    BinaryExpr: ("left", "right"),
+    UnaryExpr: ("operand",),
+    PipeExpr: ("left", "right"),
+    FailPropExpr: ("expr",),
+    AsyncCallExpr: ("expr",),
+    LambdaExpr: ("body",),
+}
+# Reachability for dead code elimination.
+_CALL_SCAN_FIELDS: dict[type, tuple[str, ...]] = {
+    FieldExpr: ("obj",),
+    IndexExpr: ("obj", "index"),
+    BinaryExpr: ("left", "right"),
+    UnaryExpr: ("operand",),
+    PipeExpr: ("left", "right"),
+    LambdaExpr: ("body",),
+    VarDecl: ("value",),
+    FailPropExpr: ("expr",),
+    AsyncCallExpr: ("expr",),
+}
+
+
+def _same_nodes(new: list[Any], old: list[Any]) -> bool:
+    """True if a rewrite of *old* handed back every node unchanged."""
+    return len(new) == len(old) and all(n is o for n, o in zip(new, old))
+
 
 @dataclass
 class MemoizationCandidate:
@@ -136,23 +170,68 @@ class Optimizer:
         self._runtime_deps = RuntimeDeps()
         self._elision_candidates: set[tuple[str, str]] = set()  # (func, var)
         self._escape_info = EscapeInfo()
+        # id(body) -> (body, called names); the body is kept alive so its id
+        # cannot be reused by another list while the entry exists.
+        self._called_cache: dict[int, tuple[list[Any], frozenset[str]]] = {}
 
     def optimize(self) -> Module:
+        self._called_cache.clear()
         module = self._collect_runtime_deps(self._module)
-        module = self._tail_call_optimization(module)
-        module = self._dead_branch_elimination(module)
+        # Passes that look at one function at a time share a walk over the
+        # declarations; the passes in between need the whole module.
+        module = self._map_functions(
+            module,
+            lambda fd: self._dbe_function(self._tco_function(fd)),
+            self._dbe_main,
+        )
         module = self._ct_eval_pure_calls(module)
         module = self._inline_small_functions(module)
         module = self._inline_tco_calls(module)
-        module = self._fold_trivial_loops(module)
-        module = self._iterator_fusion(module)
-        module = self._copy_elision(module)
+        module = self._map_functions(
+            module,
+            lambda fd: self._elide_copies_in_func(
+                self._fuse_iterators_in_func(self._fold_loops_in_function(fd))
+            ),
+            lambda md: self._elide_copies_in_main(self._fuse_iterators_in_main(md)),
+        )
         module = self._dead_code_elimination(module)
         module = self._identify_memoization_candidates(module)
-        module = self._match_compilation(module)
-        module = self._escape_analysis(module)
+        module = self._map_functions(
+            module,
+            lambda fd: self._escape_function(self._merge_matches_in_func(fd)),
+            lambda md: self._escape_main(self._merge_matches_in_main(md)),
+        )
         return module
 
+    def _map_functions(
+        self,
+        module: Module,
+        on_function: Callable[[FunctionDef], FunctionDef],
+        on_main: Callable[[MainDef], MainDef] | None = None,
+    ) -> Module:
+        """Rebuild *module* with each function, including those in module blocks, rewritten.
+
+        Rewrites hand back the node itself when they change nothing, so a
+        pass that touches nothing returns *module* unchanged.
+        """
+        new_decls: list[Declaration] = []
+        for decl in module.declarations:
+            if isinstance(decl, FunctionDef):
+                new_decls.append(on_function(decl))
+            elif isinstance(decl, ModuleDecl):
+                new_body = [on_function(d) if isinstance(d, FunctionDef) else d for d in decl.body]
+                if _same_nodes(new_body, decl.body):
+                    new_decls.append(decl)
+                else:
+                    new_decls.append(replace(decl, body=new_body))
+            elif isinstance(decl, MainDef) and on_main is not None:
+                new_decls.append(on_main(decl))
+            else:
+                new_decls.append(decl)
+        if _same_nodes(new_decls, module.declarations):
+            return module
+        return replace(module, declarations=new_decls)
+
     def get_memo_info(self) -> MemoizationInfo:
         """Return memoization candidates discovered during optimization."""
         return self._memo_info
@@ -177,37 +256,19 @@ class Optimizer:
 
     # ── Pass 1: Tail Call Optimization ────────────────────────────
 
-    def _tail_call_optimization(self, module: Module) -> Module:
-        """Rewrite eligible tail-recursive functions into TailLoop/TailContinue."""
-        new_decls: list[Declaration] = []
-        for decl in module.declarations:
-            if isinstance(decl, FunctionDef):
-                new_decls.append(self._tco_function(decl))
-            elif isinstance(decl, ModuleDecl):
-                new_body: list[Declaration] = []
-                for inner in decl.body:
-                    if isinstance(inner, FunctionDef):
-                        new_body.append(self._tco_function(inner))
-                    else:
-                        new_body.append(inner)
-                new_decls.append(replace(decl, body=new_body))
-            else:
-                new_decls.append(decl)
-        return replace(module, declarations=new_decls)
-
     def _tco_function(self, fd: FunctionDef) -> FunctionDef:
-        """Apply TCO to a single function if eligible."""
+        """Rewrite *fd* into TailLoop/TailContinue if it is eligibly tail-recursive."""
         # Must have `terminates` annotation and be self-recursive
         if fd.terminates is None:
             return fd
         if not self._calls_self(fd.name, fd.body):
             return fd
-        # Check that the body ends in a tail position self-call
-        if not self._has_tail_call(fd.name, fd.body):
-            return fd
-
+        # Detection and rewriting share one walk: the rewrite reports whether
+        # any self-call was in tail position.
         param_names = [p.name for p in fd.params]
-        rewritten_body = self._rewrite_tail_calls(fd.name, param_names, fd.body)
+        rewritten_body, found = self._rewrite_tail_calls(fd.name, param_names, fd.body)
+        if not found:
+            return fd
         tail_loop = TailLoop(
             params=param_names,
             body=rewritten_body,
@@ -215,41 +276,6 @@ class Optimizer:
         )
         return replace(fd, body=[tail_loop])
 
-    def _has_tail_call(self, name: str, body: list[Any]) -> bool:
-        """Check if body ends with a self-call in tail position."""
-        if not body:
-            return False
-        last = body[-1]
-        # Unwrap ExprStmt to get the inner expression
-        if isinstance(last, ExprStmt):
-            if self._is_tail_call(name, last.expr):
-                return True
-            # Match wrapped in ExprStmt
-            if isinstance(last.expr, MatchExpr):
-                return any(
-                    arm.body and self._is_tail_call_in_arm(name, arm) for arm in last.expr.arms
-                )
-        if isinstance(last, MatchExpr):
-            return any(arm.body and self._is_tail_call_in_arm(name, arm) for arm in last.arms)
-        return False
-
-    def _is_tail_call_in_arm(self, name: str, arm: MatchArm) -> bool:
-        """Check if a match arm ends with a tail call."""
-        if not arm.body:
-            return False
-        last = arm.body[-1]
-        if isinstance(last, ExprStmt):
-            if self._is_tail_call(name, last.expr):
-                return True
-            if isinstance(last.expr, MatchExpr):
-                return any(
-                    inner.body and self._is_tail_call_in_arm(name, inner)
-                    for inner in last.expr.arms
-                )
-        if isinstance(last, MatchExpr):
-            return any(inner.body and self._is_tail_call_in_arm(name, inner) for inner in last.arms)
-        return False
-
     def _is_tail_call(self, name: str, expr: Expr) -> bool:
         """Check if an expression is a direct self-call."""
         return (
@@ -263,152 +289,135 @@ class Optimizer:
         name: str,
         params: list[str],
         body: list[Any],
-    ) -> list[Any]:
-        """Rewrite tail-recursive calls to TailContinue."""
-        result: list[Any] = []
-        for i, stmt in enumerate(body):
-            is_last = i == len(body) - 1
-            if is_last:
-                if isinstance(stmt, ExprStmt) and self._is_tail_call(name, stmt.expr):
-                    call = stmt.expr
-                    assert isinstance(call, CallExpr)
-                    assignments = list(zip(params, call.args))
-                    result.append(TailContinue(assignments=assignments, span=stmt.span))
-                elif isinstance(stmt, ExprStmt) and isinstance(stmt.expr, MatchExpr):
-                    # Match wrapped in ExprStmt — rewrite inner match
-                    rewritten = self._rewrite_match_tail_calls(name, params, stmt.expr)
-                    result.append(rewritten)
-                elif isinstance(stmt, MatchExpr):
-                    result.append(self._rewrite_match_tail_calls(name, params, stmt))
-                else:
-                    result.append(stmt)
-            else:
-                result.append(stmt)
-        return result
+    ) -> tuple[list[Any], bool]:
+        """Rewrite tail-recursive calls to TailContinue.
+
+        Only the last statement can hold a tail call. Returns the new body and
+        whether any call was rewritten.
+        """
+        if not body:
+            return [], False
+        last = body[-1]
+        if isinstance(last, ExprStmt) and self._is_tail_call(name, last.expr):
+            call = last.expr
+            assert isinstance(call, CallExpr)
+            assignments = list(zip(params, call.args))
+            return [*body[:-1], TailContinue(assignments=assignments, span=last.span)], True
+        if isinstance(last, ExprStmt) and isinstance(last.expr, MatchExpr):
+            # Match wrapped in ExprStmt — rewrite inner match
+            rewritten, found = self._rewrite_match_tail_calls(name, params, last.expr)
+            return [*body[:-1], rewritten], found
+        if isinstance(last, MatchExpr):
+            rewritten, found = self._rewrite_match_tail_calls(name, params, last)
+            return [*body[:-1], rewritten], found
+        return list(body), False
 
     def _rewrite_match_tail_calls(
         self,
         name: str,
         params: list[str],
         m: MatchExpr,
-    ) -> MatchExpr:
+    ) -> tuple[MatchExpr, bool]:
         """Rewrite tail calls inside match arms."""
         new_arms = []
+        any_found = False
         for arm in m.arms:
-            new_body = self._rewrite_tail_calls(name, params, arm.body)
+            new_body, found = self._rewrite_tail_calls(name, params, arm.body)
             new_arms.append(replace(arm, body=new_body))
-        return replace(m, arms=new_arms)
+            any_found = any_found or found
+        return replace(m, arms=new_arms), any_found
 
     def _calls_self(self, name: str, body: list[Any]) -> bool:
         """Check if function body contains a recursive call to itself."""
+        return name in self._called_names(body)
+
+    def _calls_any(self, body: list[Any], candidates: dict[str, Any], *, exclude: str) -> bool:
+        """Check if body calls any candidate (other than *exclude*)."""
+        called = self._called_names(body)
+        return any(name in called for name in candidates if name != exclude)
+
+    def _called_names(self, body: list[Any]) -> frozenset[str]:
+        """Names of the functions *body* calls directly, cached per run.
+
+        TCO, compile-time evaluation, inlining and memoization all ask
+        whether the same bodies call some function; one walk per body
+        answers every name with a set lookup.
+        """
+        cached = self._called_cache.get(id(body))
+        if cached is not None and cached[0] is body:
+            return cached[1]
+        called: set[str] = set()
+        self._collect_body_calls(body, called)
+        result = frozenset(called)
+        self._called_cache[id(body)] = (body, result)
+        return result
+
+    def _collect_body_calls(self, body: list[Any], called: set[str]) -> None:
         for stmt in body:
             if isinstance(stmt, ExprStmt):
-                if self._expr_calls(name, stmt.expr):
-                    return True
-            elif isinstance(stmt, VarDecl):
-                if self._expr_calls(name, stmt.value):
-                    return True
-            elif isinstance(stmt, Assignment):
-                if self._expr_calls(name, stmt.value):
-                    return True
+                self._collect_expr_calls(stmt.expr, called)
+            elif isinstance(stmt, (VarDecl, Assignment)):
+                self._collect_expr_calls(stmt.value, called)
             elif isinstance(stmt, MatchExpr):
-                if stmt.subject and self._expr_calls(name, stmt.subject):
-                    return True
+                if stmt.subject:
+                    self._collect_expr_calls(stmt.subject, called)
                 for arm in stmt.arms:
-                    if self._calls_self(name, arm.body):
-                        return True
-        return False
+                    self._collect_body_calls(arm.body, called)
 
-    def _expr_calls(self, name: str, expr: Expr) -> bool:
-        """Check if an expression contains a call to the named function."""
-        from prove.ast_nodes import (
-            BinaryExpr,
-            FailPropExpr,
-            LambdaExpr,
-            PipeExpr,
-            UnaryExpr,
-        )
-
-        if isinstance(expr, CallExpr):
-            if isinstance(expr.func, IdentifierExpr) and expr.func.name == name:
-                return True
+    def _collect_expr_calls(self, expr: Expr, called: set[str]) -> None:
+        kind = type(expr)
+        if kind is CallExpr:
+            if isinstance(expr.func, IdentifierExpr):
+                called.add(expr.func.name)
             for arg in expr.args:
-                if self._expr_calls(name, arg):
-                    return True
-        elif isinstance(expr, BinaryExpr):
-            return self._expr_calls(name, expr.left) or self._expr_calls(name, expr.right)
-        elif isinstance(expr, UnaryExpr):
-            return self._expr_calls(name, expr.operand)
-        elif isinstance(expr, PipeExpr):
-            return self._expr_calls(name, expr.left) or self._expr_calls(name, expr.right)
-        elif isinstance(expr, FailPropExpr):
-            return self._expr_calls(name, expr.expr)
-        elif isinstance(expr, AsyncCallExpr):
-            return self._expr_calls(name, expr.expr)
-        elif isinstance(expr, LambdaExpr):
-            return self._expr_calls(name, expr.body)
-        elif isinstance(expr, MatchExpr):
-            if expr.subject and self._expr_calls(name, expr.subject):
-                return True
+                self._collect_expr_calls(arg, called)
+        elif kind is MatchExpr:
+            if expr.subject:
+                self._collect_expr_calls(expr.subject, called)
             for arm in expr.arms:
                 for s in arm.body:
-                    if isinstance(s, ExprStmt) and self._expr_calls(name, s.expr):
-                        return True
-                    elif isinstance(s, VarDecl) and self._expr_calls(name, s.value):
-                        return True
-                    elif isinstance(s, Assignment) and self._expr_calls(name, s.value):
-                        return True
-        return False
-
-    def _calls_any(self, body: list[Any], candidates: dict[str, Any], *, exclude: str) -> bool:
-        """Check if body calls any candidate (other than *exclude*)."""
-        for name in candidates:
-            if name == exclude:
-                continue
-            if self._calls_self(name, body):
-                return True
-        return False
+                    if isinstance(s, ExprStmt):
+                        self._collect_expr_calls(s.expr, called)
+                    elif isinstance(s, (VarDecl, Assignment)):
+                        self._collect_expr_calls(s.value, called)
+        else:
+            for field in _SELF_CALL_FIELDS.get(kind, ()):
+                self._collect_expr_calls(getattr(expr, field), called)
 
     # ── Pass 2: Dead Branch Elimination ───────────────────────────
 
-    def _dead_branch_elimination(self, module: Module) -> Module:
+    def _dbe_function(self, fd: FunctionDef) -> FunctionDef:
         """Remove match arms with statically-known-false patterns."""
-        new_decls: list[Declaration] = []
-        for decl in module.declarations:
-            if isinstance(decl, FunctionDef):
-                new_decls.append(self._dbe_function(decl))
-            elif isinstance(decl, ModuleDecl):
-                new_body = [
-                    self._dbe_function(d) if isinstance(d, FunctionDef) else d for d in decl.body
-                ]
-                new_decls.append(replace(decl, body=new_body))
-            elif isinstance(decl, MainDef):
-                new_decls.append(replace(decl, body=self._dbe_stmts(decl.body)))
-            else:
-                new_decls.append(decl)
-        return replace(module, declarations=new_decls)
+        new_body = self._dbe_stmts(fd.body)
+        return fd if new_body is fd.body else replace(fd, body=new_body)
 
-    def _dbe_function(self, fd: FunctionDef) -> FunctionDef:
-        return replace(fd, body=self._dbe_stmts(fd.body))
+    def _dbe_main(self, md: MainDef) -> MainDef:
+        new_body = self._dbe_stmts(md.body)
+        return md if new_body is md.body else replace(md, body=new_body)
 
     def _dbe_stmts(self, stmts: list[Any]) -> list[Any]:
         """Walk statements looking for match exprs to simplify."""
+        changed = False
         result: list[Any] = []
         for stmt in stmts:
+            new_stmt = stmt
             if isinstance(stmt, ExprStmt) and isinstance(stmt.expr, MatchExpr):
                 simplified = self._dbe_match(stmt.expr)
-                result.append(replace(stmt, expr=simplified))
+                if simplified is not stmt.expr:
+                    new_stmt = replace(stmt, expr=simplified)
             elif isinstance(stmt, MatchExpr):
-                result.append(self._dbe_match(stmt))
+                new_stmt = self._dbe_match(stmt)
             elif isinstance(stmt, TailLoop):
-                result.append(replace(stmt, body=self._dbe_stmts(stmt.body)))
-            elif isinstance(stmt, VarDecl) and isinstance(stmt.value, MatchExpr):
-                result.append(replace(stmt, value=self._dbe_match(stmt.value)))
-            elif isinstance(stmt, Assignment) and isinstance(stmt.value, MatchExpr):
-                result.append(replace(stmt, value=self._dbe_match(stmt.value)))
-            else:
-                result.append(stmt)
-        return result
+                new_body = self._dbe_stmts(stmt.body)
+                if new_body is not stmt.body:
+                    new_stmt = replace(stmt, body=new_body)
+            elif isinstance(stmt, (VarDecl, Assignment)) and isinstance(stmt.value, MatchExpr):
+                simplified = self._dbe_match(stmt.value)
+                if simplified is not stmt.value:
+                    new_stmt = replace(stmt, value=simplified)
+            changed = changed or new_stmt is not stmt
+            result.append(new_stmt)
+        return result if changed else stmts
 
     def _dbe_match(self, m: MatchExpr) -> MatchExpr:
         """Eliminate dead branches in a match expression."""
@@ -428,7 +437,8 @@ class Optimizer:
                     kept_arms.append(arm)
                 else:
                     kept_arms.append(arm)
-            if kept_arms:
+            # Rebuild only when an arm actually went away
+            if kept_arms and len(kept_arms) < len(m.arms):
                 return replace(m, arms=kept_arms)
 
         return m
@@ -442,53 +452,51 @@ class Optimizer:
             if isinstance(decl, FunctionDef):
                 func_defs[decl.name] = decl
 
-        new_decls: list[Declaration] = []
-        for decl in module.declarations:
-            if isinstance(decl, FunctionDef):
-                new_decls.append(self._ct_eval_function(decl, func_defs))
-            elif isinstance(decl, ModuleDecl):
-                new_body = [
-                    self._ct_eval_function(d, func_defs) if isinstance(d, FunctionDef) else d
-                    for d in decl.body
-                ]
-                new_decls.append(replace(decl, body=new_body))
-            elif isinstance(decl, MainDef):
-                new_decls.append(replace(decl, body=self._ct_eval_stmts(decl.body, func_defs)))
-            else:
-                new_decls.append(decl)
-        return replace(module, declarations=new_decls)
+        return self._map_functions(
+            module,
+            lambda fd: self._ct_eval_function(fd, func_defs),
+            lambda md: self._ct_eval_main(md, func_defs),
+        )
 
     def _ct_eval_function(self, fd: FunctionDef, func_defs: dict[str, FunctionDef]) -> FunctionDef:
-        return replace(fd, body=self._ct_eval_stmts(fd.body, func_defs))
+        new_body = self._ct_eval_stmts(fd.body, func_defs)
+        return fd if new_body is fd.body else replace(fd, body=new_body)
+
+    def _ct_eval_main(self, md: MainDef, func_defs: dict[str, FunctionDef]) -> MainDef:
+        new_body = self._ct_eval_stmts(md.body, func_defs)
+        return md if new_body is md.body else replace(md, body=new_body)
 
     def _ct_eval_stmts(self, stmts: list[Any], func_defs: dict[str, FunctionDef]) -> list[Any]:
         """Walk statements looking for pure function calls with constant args."""
+        changed = False
         result: list[Any] = []
         for stmt in stmts:
+            new_stmt = stmt
             if isinstance(stmt, ExprStmt):
                 new_expr = self._ct_eval_expr(stmt.expr, func_defs)
-                result.append(replace(stmt, expr=new_expr))
-            elif isinstance(stmt, VarDecl):
-                new_val = self._ct_eval_expr(stmt.value, func_defs)
-                result.append(replace(stmt, value=new_val))
-            elif isinstance(stmt, Assignment):
+                if new_expr is not stmt.expr:
+                    new_stmt = replace(stmt, expr=new_expr)
+            elif isinstance(stmt, (VarDecl, Assignment)):
                 new_val = self._ct_eval_expr(stmt.value, func_defs)
-                result.append(replace(stmt, value=new_val))
+                if new_val is not stmt.value:
+                    new_stmt = replace(stmt, value=new_val)
             elif isinstance(stmt, MatchExpr):
-                result.append(self._ct_eval_match(stmt, func_defs))
+                new_stmt = self._ct_eval_match(stmt, func_defs)
             elif isinstance(stmt, TailLoop):
-                result.append(replace(stmt, body=self._ct_eval_stmts(stmt.body, func_defs)))
-            else:
-                result.append(stmt)
-        return result
+                new_body = self._ct_eval_stmts(stmt.body, func_defs)
+                if new_body is not stmt.body:
+                    new_stmt = replace(stmt, body=new_body)
+            changed = changed or new_stmt is not stmt
+            result.append(new_stmt)
+        return result if changed else stmts
 
     def _ct_eval_match(self, m: MatchExpr, func_defs: dict[str, FunctionDef]) -> MatchExpr:
         """Evaluate pure function calls in match arms."""
         new_arms: list[MatchArm] = []
         for arm in m.arms:
             new_body = self._ct_eval_stmts(arm.body, func_defs) if arm.body else arm.body
-            new_arms.append(replace(arm, body=new_body))
-        return replace(m, arms=new_arms)
+            new_arms.append(arm if new_body is arm.body else replace(arm, body=new_body))
+        return m if _same_nodes(new_arms, m.arms) else replace(m, arms=new_arms)
 
     def _ct_eval_expr(self, expr: Expr, func_defs: dict[str, FunctionDef]) -> Expr:
         """Try to evaluate a pure function call at compile time."""
@@ -532,37 +540,27 @@ class Optimizer:
 
     # ── Pass 2c: Iterator Fusion ───────────────────────────────────
 
-    def _iterator_fusion(self, module: Module) -> Module:
-        """Fuse chained HOF calls into single-pass operations.
+    def _fuse_iterators_in_func(self, fd: FunctionDef) -> FunctionDef:
+        """Fuse chained HOF calls in a function body into single-pass operations.
 
         Detects patterns:
         - map(filter(list, pred), func) → fused_map_filter(list, pred, func)
         - filter(map(list, func), pred) → fused_filter_map(list, func, pred)
         - map(map(list, f), g) → map(list, composed(f, g))
         """
-        new_decls: list[Declaration] = []
-        for decl in module.declarations:
-            if isinstance(decl, FunctionDef):
-                new_decls.append(self._fuse_iterators_in_func(decl))
-            elif isinstance(decl, MainDef):
-                new_body = [self._fuse_iterators_in_stmt(s) for s in decl.body]
-                new_body = self._fuse_multi_reduce(new_body)
-                new_decls.append(replace(decl, body=new_body))
-            elif isinstance(decl, ModuleDecl):
-                new_body = [
-                    self._fuse_iterators_in_func(d) if isinstance(d, FunctionDef) else d
-                    for d in decl.body
-                ]
-                new_decls.append(replace(decl, body=new_body))
-            else:
-                new_decls.append(decl)
-        return replace(module, declarations=new_decls)
+        new_body = self._fuse_iterators_in_stmts(fd.body)
+        return fd if new_body is fd.body else replace(fd, body=new_body)
 
-    def _fuse_iterators_in_func(self, fd: FunctionDef) -> FunctionDef:
-        """Apply iterator fusion within a function body."""
-        new_body = [self._fuse_iterators_in_stmt(s) for s in fd.body]
-        new_body = self._fuse_multi_reduce(new_body)
-        return replace(fd, body=new_body)
+    def _fuse_iterators_in_main(self, md: MainDef) -> MainDef:
+        new_body = self._fuse_iterators_in_stmts(md.body)
+        return md if new_body is md.body else replace(md, body=new_body)
+
+    def _fuse_iterators_in_stmts(self, stmts: list[Any]) -> list[Any]:
+        """Fuse iterators in each statement, then consecutive reduces."""
+        new_stmts = [self._fuse_iterators_in_stmt(s) for s in stmts]
+        if _same_nodes(new_stmts, stmts):
+            new_stmts = stmts
+        return self._fuse_multi_reduce(new_stmts)
 
     @staticmethod
     def _is_reduce_on(stmt: Any) -> str | None:
@@ -586,6 +584,7 @@ class Optimizer:
 
     def _fuse_multi_reduce(self, stmts: list[Any]) -> list[Any]:
         """Fuse consecutive reduce() calls on the same list into one loop."""
+        changed = False
         result: list[Any] = []
         i = 0
         while i < len(stmts):
@@ -633,9 +632,10 @@ class Optimizer:
                     span=span,
                 )
                 result.append(replace(stmt, value=ref_call))
+            changed = True
             i = j
 
-        return result
+        return result if changed else stmts
 
     def _fuse_iterators_in_stmt(self, stmt: Any) -> Any:
         """Apply iterator fusion within a statement."""
@@ -650,11 +650,13 @@ class Optimizer:
         elif isinstance(stmt, MatchExpr):
             new_arms = []
             for arm in stmt.arms:
-                new_arm_body = [self._fuse_iterators_in_stmt(s) for s in arm.body]
-                new_arm_body = self._fuse_multi_reduce(new_arm_body)
-                new_arms.append(replace(arm, body=new_arm_body))
+                new_arm_body = self._fuse_iterators_in_stmts(arm.body)
+                new_arms.append(
+                    arm if new_arm_body is arm.body else replace(arm, body=new_arm_body)
+                )
             new_subj = self._fuse_iterators_in_expr(stmt.subject) if stmt.subject else None
-            return replace(stmt, arms=new_arms, subject=new_subj)
+            if new_subj is not stmt.subject or not _same_nodes(new_arms, stmt.arms):
+                return replace(stmt, arms=new_arms, subject=new_subj)
         return stmt
 
     def _fuse_iterators_in_expr(self, expr: Expr) -> Expr:
@@ -853,34 +855,19 @@ class Optimizer:
 
     # ── Pass 2d: Copy Elision ────────────────────────────────────────
 
-    def _copy_elision(self, module: Module) -> Module:
+    def _elide_copies_in_func(self, fd: FunctionDef) -> FunctionDef:
         """Mark last-use variables for move semantics instead of copy.
 
         Performs simple liveness analysis per function: if a variable is used
         exactly once after its definition, mark the use as a move (no copy
         needed). This is recorded as an annotation on the AST node.
         """
-        new_decls: list[Declaration] = []
-        for decl in module.declarations:
-            if isinstance(decl, FunctionDef):
-                new_decls.append(self._elide_copies_in_func(decl))
-            elif isinstance(decl, MainDef):
-                new_body = self._mark_last_uses(decl.body, "main")
-                new_decls.append(replace(decl, body=new_body))
-            elif isinstance(decl, ModuleDecl):
-                new_body = [
-                    self._elide_copies_in_func(d) if isinstance(d, FunctionDef) else d
-                    for d in decl.body
-                ]
-                new_decls.append(replace(decl, body=new_body))
-            else:
-                new_decls.append(decl)
-        return replace(module, declarations=new_decls)
-
-    def _elide_copies_in_func(self, fd: FunctionDef) -> FunctionDef:
-        """Mark last-use identifiers in a function body."""
         new_body = self._mark_last_uses(fd.body, fd.name)
-        return replace(fd, body=new_body)
+        return fd if new_body is fd.body else replace(fd, body=new_body)
+
+    def _elide_copies_in_main(self, md: MainDef) -> MainDef:
+        new_body = self._mark_last_uses(md.body, "main")
+        return md if new_body is md.body else replace(md, body=new_body)
 
     def _mark_last_uses(self, stmts: list[Any], func_name: str = "") -> list[Any]:
         """Analyze variable usage and mark last uses for move semantics.
@@ -1005,25 +992,24 @@ class Optimizer:
 
     def _find_called_in_stmt(self, stmt: Any, called: set[str]) -> None:
         """Recursively find function calls in a statement."""
-        if isinstance(stmt, ExprStmt):
+        kind = type(stmt)
+        if kind is ExprStmt:
             self._find_called_in_expr(stmt.expr, called)
-        elif isinstance(stmt, MatchExpr):
+        elif kind is VarDecl or kind is Assignment:
+            self._find_called_in_expr(stmt.value, called)
+        elif kind is MatchExpr:
             for arm in stmt.arms:
                 if arm.body:
                     for body_stmt in arm.body:
                         self._find_called_in_stmt(body_stmt, called)
-        elif isinstance(stmt, TailLoop):
+        elif kind is TailLoop:
             self._find_called_in_stmts(stmt.body, called)
-        elif isinstance(stmt, TailContinue):
+        elif kind is TailContinue:
             for _, expr in stmt.assignments:
                 self._find_called_in_expr(expr, called)
-        elif isinstance(stmt, WhileLoop):
+        elif kind is WhileLoop:
             self._find_called_in_expr(stmt.break_cond, called)
             self._find_called_in_stmts(stmt.body, called)
-        elif isinstance(stmt, VarDecl):
-            self._find_called_in_expr(stmt.value, called)
-        elif isinstance(stmt, Assignment):
-            self._find_called_in_expr(stmt.value, called)
 
     def _find_called_in_stmts(self, stmts: list[Any], called: set[str]) -> None:
         for stmt in stmts:
@@ -1031,7 +1017,8 @@ class Optimizer:
 
     def _find_called_in_expr(self, expr: Expr, called: set[str]) -> None:
         """Recursively find function calls in an expression."""
-        if isinstance(expr, CallExpr):
+        kind = type(expr)
+        if kind is CallExpr:
             if isinstance(expr.func, IdentifierExpr):
                 called.add(expr.func.name)
             else:
@@ -1041,40 +1028,22 @@ class Optimizer:
                 if isinstance(arg, IdentifierExpr):
                     called.add(arg.name)
                 self._find_called_in_expr(arg, called)
-        elif isinstance(expr, FieldExpr):
-            self._find_called_in_expr(expr.obj, called)
-        elif isinstance(expr, IndexExpr):
-            self._find_called_in_expr(expr.obj, called)
-            self._find_called_in_expr(expr.index, called)
-        elif isinstance(expr, MatchExpr):
+        elif kind is MatchExpr:
             if expr.subject:
                 self._find_called_in_expr(expr.subject, called)
             for arm in expr.arms:
                 if arm.body:
                     for body_stmt in arm.body:
                         self._find_called_in_stmt(body_stmt, called)
-        elif isinstance(expr, BinaryExpr):
-            self._find_called_in_expr(expr.left, called)
-            self._find_called_in_expr(expr.right, called)
-        elif isinstance(expr, UnaryExpr):
-            self._find_called_in_expr(expr.operand, called)
-        elif isinstance(expr, PipeExpr):
-            self._find_called_in_expr(expr.left, called)
-            self._find_called_in_expr(expr.right, called)
-        elif isinstance(expr, LambdaExpr):
-            self._find_called_in_expr(expr.body, called)
-        elif isinstance(expr, StringInterp):
+        elif kind is StringInterp:
             for part in expr.parts:
                 self._find_called_in_expr(part, called)
-        elif isinstance(expr, ListLiteral):
+        elif kind is ListLiteral:
             for elem in expr.elements:
                 self._find_called_in_expr(elem, called)
-        elif isinstance(expr, VarDecl):
-            self._find_called_in_expr(expr.value, called)
-        elif isinstance(expr, FailPropExpr):
-            self._find_called_in_expr(expr.expr, called)
-        elif isinstance(expr, AsyncCallExpr):
-            self._find_called_in_expr(expr.expr, called)
+        else:
+            for field in _CALL_SCAN_FIELDS.get(kind, ()):
+                self._find_called_in_expr(getattr(expr, field), called)
 
     # ── Pass 3: Small Function Inlining ───────────────────────────
 
@@ -1602,7 +1571,7 @@ class Optimizer:
 
     # ── Pass 3c: Trivial Loop Folding ──────────────────────────────
 
-    def _fold_trivial_loops(self, module: Module) -> Module:
+    def _fold_loops_in_function(self, fd: FunctionDef) -> FunctionDef:
         """Fold trivial counting/accumulating loops to O(1) computations.
 
         Detects TailLoop nodes where:
@@ -1613,24 +1582,6 @@ class Optimizer:
 
         Example: count(n-1, acc+1) folds to match n<=0: True->acc, False->acc+n
         """
-        new_decls: list[Declaration] = []
-        for decl in module.declarations:
-            if isinstance(decl, FunctionDef):
-                new_decls.append(self._fold_loops_in_function(decl))
-            elif isinstance(decl, ModuleDecl):
-                new_body: list[Declaration] = []
-                for inner in decl.body:
-                    if isinstance(inner, FunctionDef):
-                        new_body.append(self._fold_loops_in_function(inner))
-                    else:
-                        new_body.append(inner)
-                new_decls.append(replace(decl, body=new_body))
-            else:
-                new_decls.append(decl)
-        return replace(module, declarations=new_decls)
-
-    def _fold_loops_in_function(self, fd: FunctionDef) -> FunctionDef:
-        """Try to fold trivial loops in a function body."""
         new_body = self._fold_loops_in_stmts(fd.body)
         if new_body is not fd.body:
             return replace(fd, body=new_body)
@@ -2135,28 +2086,17 @@ class Optimizer:
 
     # ── Pass 4: Match Compilation ─────────────────────────────────
 
-    def _match_compilation(self, module: Module) -> Module:
+    def _merge_matches_in_func(self, fd: FunctionDef) -> FunctionDef:
         """Merge consecutive match statements on the same variable.
 
         v0.5 scope: simple merge only. Full decision-tree deferred.
         """
-        new_decls: list[Declaration] = []
-        for decl in module.declarations:
-            if isinstance(decl, FunctionDef):
-                new_decls.append(replace(decl, body=self._merge_matches(decl.body)))
-            elif isinstance(decl, MainDef):
-                new_decls.append(replace(decl, body=self._merge_matches(decl.body)))
-            elif isinstance(decl, ModuleDecl):
-                new_body = [
-                    replace(d, body=self._merge_matches(d.body))
-                    if isinstance(d, FunctionDef)
-                    else d
-                    for d in decl.body
-                ]
-                new_decls.append(replace(decl, body=new_body))
-            else:
-                new_decls.append(decl)
-        return replace(module, declarations=new_decls)
+        new_body = self._merge_matches(fd.body)
+        return fd if new_body is fd.body else replace(fd, body=new_body)
+
+    def _merge_matches_in_main(self, md: MainDef) -> MainDef:
+        new_body = self._merge_matches(md.body)
+        return md if new_body is md.body else replace(md, body=new_body)
 
     def _merge_matches(self, stmts: list[Any]) -> list[Any]:
         """Merge consecutive match statements on the same subject.
@@ -2168,6 +2108,7 @@ class Optimizer:
         if len(stmts) < 2:
             return stmts
 
+        changed = False
         result = []
         i = 0
         while i < len(stmts):
@@ -2210,13 +2151,14 @@ class Optimizer:
                         break
                 if j > i + 1:
                     result.append(replace(stmt, arms=merged_arms))
+                    changed = True
                 else:
                     result.append(stmt)
                 i = j
             else:
                 result.append(stmt)
                 i += 1
-        return result
+        return result if changed else stmts
 
     # ── Pass 5: Escape Analysis ─────────────────────────────────────
 
@@ -2238,7 +2180,7 @@ class Optimizer:
         }
     )
 
-    def _escape_analysis(self, module: Module) -> Module:
+    def _escape_function(self, fd: FunctionDef) -> FunctionDef:
         """Analyze which values escape their enclosing function.
 
         A value escapes if:
@@ -2247,18 +2189,15 @@ class Optimizer:
         3. It's stored in a global/module variable
         4. It's passed to a function that may store it beyond current scope
 
-        Conservative: defaults to escaping if uncertain.
+        Conservative: defaults to escaping if uncertain. The function is
+        returned unchanged; results go to ``get_escape_info()``.
         """
-        for decl in module.declarations:
-            if isinstance(decl, FunctionDef):
-                self._analyze_function_escape(decl.name, decl.params, decl.body)
-            elif isinstance(decl, MainDef):
-                self._analyze_function_escape("main", [], decl.body)
-            elif isinstance(decl, ModuleDecl):
-                for item in decl.body:
-                    if isinstance(item, FunctionDef):
-                        self._analyze_function_escape(item.name, item.params, item.body)
-        return module
+        self._analyze_function_escape(fd.name, fd.params, fd.body)
+        return fd
+
+    def _escape_main(self, md: MainDef) -> MainDef:
+        self._analyze_function_escape("main", [], md.body)
+        return md
 
     def _analyze_function_escape(
         self,
@@ -96,6 +96,10 @@ class ProofVerifier:
 
     def verify(self, fd: FunctionDef) -> None:
         """Run all explain verification checks on a function."""
+        # Every check below keys off ensures, explain, believe or
+        # near-misses — plain functions have nothing to verify.
+        if not fd.ensures and fd.explain is None and not fd.believe and not fd.near_misses:
+            return
         self._check_ensures_explain(fd)
         self._check_entry_uniqueness(fd)
         self._check_entry_coverage(fd)
@@ -182,6 +186,7 @@ class ProofVerifier:
         for p in fd.params:
             concepts.add(p.name)
         concepts.add("result")
+        concepts_lower = [c.lower() for c in concepts]
 
         for entry in fd.explain.entries:
             # Structured conditions reference params directly — skip text check
@@ -191,7 +196,7 @@ class ProofVerifier:
             if entry.name is None:
                 continue
             text_lower = entry.text.lower()
-            if not any(c.lower() in text_lower for c in concepts):
+            if not any(c in text_lower for c in concepts_lower):
                 self.diagnostics.append(
                     Diagnostic(
                         severity=Severity.WARNING,
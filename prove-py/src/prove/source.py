@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Span:
-    """A range within a source file."""
+    """A range within a source file.
+
+    Slotted: a failing compile can hold one Span per AST node and diagnostic.
+    """
 
     file: str
     start_line: int
@@ -26,10 +30,15 @@ class SourceFile:
     def __init__(self, path: Path) -> None:
         self.path = path
         self.content = path.read_text()
-        self.lines = self.content.splitlines()
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Source lines, split once on first access."""
+        return self.content.splitlines()
 
     def line_at(self, n: int) -> str:
         """Return the 1-indexed line, or empty string if out of range."""
-        if 1 <= n <= len(self.lines):
-            return self.lines[n - 1]
+        lines = self.lines
+        if 1 <= n <= len(lines):
+            return lines[n - 1]
         return ""
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib.resources
 import sys
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -39,15 +40,28 @@ _DUMMY = Span("<stdlib>", 0, 0, 0, 0)
 
 # ── Per-module registration ──────────────────────────────────────
 
-# Populated by _register_module() calls below
-_BINARY_C_MAP: dict[tuple[str, str | None, str], str] = {}
-_BINARY_C_OVERLOADS: dict[tuple[str, str | None, str, str], str] = {}
+# Populated by _register_module() calls below.  The C maps are nested
+# module → verb → name (→ first param type) so lookups need no tuple keys.
+_BINARY_C_MAP: dict[str, dict[str | None, dict[str, str]]] = {}
+_BINARY_C_OVERLOADS: dict[str, dict[str | None, dict[str, dict[str, str]]]] = {}
 _STDLIB_MODULES: dict[str, str] = {}
 _STDLIB_LINK_FLAGS: dict[str, list[str]] = {}
 _STDLIB_C_FLAGS: dict[str, list[str]] = {}
 _MODULE_DISPLAY_NAMES: dict[str, str] = {}
 
 
+def _add_c_map(key: str, c_map: dict[tuple[str, str], str]) -> None:
+    verbs = _BINARY_C_MAP.setdefault(key, {})
+    for (verb, func), c_name in c_map.items():
+        verbs.setdefault(verb, {})[func] = c_name
+
+
+def _add_overloads(key: str, overloads: dict[tuple[str, str, str], str]) -> None:
+    verbs = _BINARY_C_OVERLOADS.setdefault(key, {})
+    for (verb, func, type_name), c_name in overloads.items():
+        verbs.setdefault(verb, {}).setdefault(func, {})[type_name] = c_name
+
+
 def _register_module(
     name: str,
     *,
@@ -66,12 +80,10 @@ def _register_module(
     _MODULE_DISPLAY_NAMES[key] = display
 
     if c_map:
-        for (verb, func), c_name in c_map.items():
-            _BINARY_C_MAP[(key, verb, func)] = c_name
+        _add_c_map(key, c_map)
 
     if overloads:
-        for (verb, func, type_name), c_name in overloads.items():
-            _BINARY_C_OVERLOADS[(key, verb, func, type_name)] = c_name
+        _add_overloads(key, overloads)
 
     # Resolve flags via pkg-config if specified
     if pkg_config:
@@ -106,11 +118,9 @@ def _register_module(
             _STDLIB_MODULES[alias_key] = prv_file
             _MODULE_DISPLAY_NAMES[alias_key] = display
             if c_map:
-                for (verb, func), c_name in c_map.items():
-                    _BINARY_C_MAP[(alias_key, verb, func)] = c_name
+                _add_c_map(alias_key, c_map)
             if overloads:
-                for (verb, func, type_name), c_name in overloads.items():
-                    _BINARY_C_OVERLOADS[(alias_key, verb, func, type_name)] = c_name
+                _add_overloads(alias_key, overloads)
             if link_flags:
                 _STDLIB_LINK_FLAGS[alias_key] = link_flags
 
@@ -919,10 +929,16 @@ def binary_c_name(
     """Look up the C runtime function for a binary stdlib function."""
     key = module.lower()
     if first_param_type is not None:
-        overload = _BINARY_C_OVERLOADS.get((key, verb, name, first_param_type))
+        overload = binary_c_name_overload_only(key, verb, name, first_param_type)
         if overload is not None:
             return overload
-    return _BINARY_C_MAP.get((key, verb, name))
+    verbs = _BINARY_C_MAP.get(key)
+    if verbs is None:
+        return None
+    names = verbs.get(verb)
+    if names is None:
+        return None
+    return names.get(name)
 
 
 def binary_c_name_overload_only(
@@ -932,8 +948,16 @@ def binary_c_name_overload_only(
     first_param_type: str,
 ) -> str | None:
     """Look up overload-only (no generic fallback) for a binary stdlib function."""
-    key = module.lower()
-    return _BINARY_C_OVERLOADS.get((key, verb, name, first_param_type))
+    verbs = _BINARY_C_OVERLOADS.get(module.lower())
+    if verbs is None:
+        return None
+    names = verbs.get(verb)
+    if names is None:
+        return None
+    types = names.get(name)
+    if types is None:
+        return None
+    return types.get(first_param_type)
 
 
 # Cache loaded signatures
@@ -1069,7 +1093,7 @@ def _resolve_type_expr(
                 return ArrayType(args[0], modifiers=mods)  # type: ignore[return-value]
             return ArrayType(args[0])  # type: ignore[return-value]
         if type_expr.name == "Verb" and len(args) >= 1:
-            return FunctionType(list(args[:-1]), args[-1])  # type: ignore[return-value]
+            return FunctionType(tuple(args[:-1]), args[-1])  # type: ignore[return-value]
         return GenericInstance(type_expr.name, args)
 
     if isinstance(type_expr, ModifiedType):
@@ -1291,9 +1315,8 @@ def load_stdlib_prv_source(module_name: str) -> str | None:
     prv_rel = _STDLIB_MODULES.get(key)
     if prv_rel is None:
         return None
-    for mod, _verb, _func in _BINARY_C_MAP:
-        if mod == key:
-            return None
+    if key in _BINARY_C_MAP:
+        return None
     pkg = importlib.resources.files("prove.stdlib")
     try:
         return pkg.joinpath(prv_rel).read_text(encoding="utf-8")
@@ -1309,7 +1332,7 @@ def is_stdlib_module(module_name: str) -> bool:
 # ── Auto-import support ──────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportSuggestion:
     """A suggestion for auto-importing a stdlib function."""
 
@@ -1353,9 +1376,12 @@ def _function_signature_display(decl: object) -> str:
     return f"({params}) {ret}{fail}"
 
 
-def _parse_stdlib_module(module_name: str) -> Module | None:
-    """Parse a stdlib .prv file and return the Module AST, or None."""
-    normalized = module_name.lower()
+def _parse_stdlib_module(normalized: str) -> Module | None:
+    """Parse a stdlib .prv file and return the Module AST, or None.
+
+    ``normalized`` must already be lowercased — every caller has the
+    normalized key at hand, so it is not recomputed here.
+    """
     filename = _STDLIB_MODULES.get(normalized)
     if filename is None:
         return None
@@ -1369,7 +1395,7 @@ def _parse_stdlib_module(module_name: str) -> Module | None:
         return None
 
     try:
-        return parse(source, f"<stdlib:{module_name}>")
+        return parse(source, f"<stdlib:{normalized}>")
     except (CompileError, ValueError, IndexError):
         return None
 
@@ -1462,7 +1488,7 @@ def build_import_index() -> dict[str, list[ImportSuggestion]]:
 
     from prove.ast_nodes import AlgebraicTypeDef, ConstantDef, FunctionDef, ModuleDecl
 
-    index: dict[str, list[ImportSuggestion]] = {}
+    index: defaultdict[str, list[ImportSuggestion]] = defaultdict(list)
     for key, _filename in _STDLIB_MODULES.items():
         if key in _ALIAS_KEYS:
             continue
@@ -1492,12 +1518,12 @@ def build_import_index() -> dict[str, list[ImportSuggestion]]:
                     signature=_function_signature_display(decl),
                     docstring=decl.doc_comment or "",
                 )
-                index.setdefault(decl.name, []).append(suggestion)
+                index[decl.name].append(suggestion)
 
         for td in all_types:
             # Index the type name itself with the type definition
             type_def = _format_type_def(td)
-            index.setdefault(td.name, []).append(
+            index[td.name].append(
                 ImportSuggestion(
                     module=display,
                     verb="types",
@@ -1508,7 +1534,7 @@ def build_import_index() -> dict[str, list[ImportSuggestion]]:
             # Index variant constructors for algebraic types
             if AlgebraicTypeDef and isinstance(td.body, AlgebraicTypeDef):  # type: ignore[truthy-function]
                 for variant in td.body.variants:
-                    index.setdefault(variant.name, []).append(
+                    index[variant.name].append(
                         ImportSuggestion(
                             module=display,
                             verb="types",
@@ -1517,7 +1543,7 @@ def build_import_index() -> dict[str, list[ImportSuggestion]]:
                     )
 
         for cd in all_constants:
-            index.setdefault(cd.name, []).append(
+            index[cd.name].append(
                 ImportSuggestion(
                     module=display,
                     verb="constants",
@@ -1525,5 +1551,130 @@ def build_import_index() -> dict[str, list[ImportSuggestion]]:
                 ),
             )
 
-    _import_index = index
+    # Plain dict so lookups of unknown names don't insert empty entries
+    _import_index = dict(index)
     return _import_index
+
+
+# ── Precompiled cache ────────────────────────────────────────────
+
+# Written by write_precompiled_cache() before the wheel is built, shipped
+# alongside the .prv files
+_PRECOMPILED_FILE = "_precompiled.pkl"
+
+
+def _stdlib_fingerprint() -> str:
+    """Hash everything the cached signatures are derived from.
+
+    That is the compiler version, the compiler's own ``.py`` sources (this
+    loader, the type and symbol code, the parser) and the bundled stdlib
+    sources, so an edit to any of them in an editable checkout makes the
+    sidecar stale instead of silently serving old signatures.
+    """
+    import hashlib
+
+    from prove import __version__
+
+    digest = hashlib.sha256(__version__.encode())
+    compiler_dir = Path(__file__).parent
+    for path in sorted(compiler_dir.rglob("*.py")):
+        digest.update(path.relative_to(compiler_dir).as_posix().encode())
+        digest.update(path.read_bytes())
+    pkg = importlib.resources.files("prove.stdlib")
+    for key in sorted(_STDLIB_MODULES):
+        digest.update(key.encode())
+        try:
+            digest.update(pkg.joinpath(_STDLIB_MODULES[key]).read_bytes())
+        except Exception:
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _shared_types() -> dict[str, Type]:
+    """Type singletons that must keep their identity across a pickle round-trip."""
+    shared: dict[str, Type] = {f"known:{name}": ty for name, ty in _KNOWN_TYPES.items()}
+    shared["error"] = ERROR_TY
+    return shared
+
+
+def write_precompiled_cache(out_path: Path | None = None) -> Path:
+    """Load every stdlib module and pickle the signatures and import index.
+
+    The result is picked up at import time by ``_load_precompiled`` so that
+    fresh processes skip lexing and parsing the stdlib. The pickle is written
+    to a temporary file and moved into place, so a concurrent reader or a
+    wheel build never sees a partly written sidecar.
+    """
+    import os
+    import pickle
+    import tempfile
+
+    if out_path is None:
+        out_path = Path(__file__).parent / "stdlib" / _PRECOMPILED_FILE
+
+    signatures = {key: load_stdlib(key) for key in _STDLIB_MODULES}
+    payload = {
+        "fingerprint": _stdlib_fingerprint(),
+        "signatures": signatures,
+        "import_index": build_import_index(),
+    }
+
+    shared_ids = {id(ty): key for key, ty in _shared_types().items()}
+
+    class _Pickler(pickle.Pickler):
+        def persistent_id(self, obj: object) -> str | None:
+            return shared_ids.get(id(obj))
+
+    fd, tmp = tempfile.mkstemp(dir=out_path.parent, prefix=f".{out_path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            _Pickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(payload)
+        os.replace(tmp, out_path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return out_path
+
+
+def _read_precompiled(data: bytes) -> dict[str, object] | None:
+    """Unpickle a precompiled cache, or None if it is unreadable or stale."""
+    import io
+    import pickle
+
+    shared = _shared_types()
+
+    class _Unpickler(pickle.Unpickler):
+        def persistent_load(self, pid: object) -> Type:
+            return shared[pid]  # type: ignore[index]
+
+    try:
+        payload = _Unpickler(io.BytesIO(data)).load()
+    except Exception:
+        return None
+    if not isinstance(payload, dict) or payload.get("fingerprint") != _stdlib_fingerprint():
+        return None
+    return payload
+
+
+def _load_precompiled() -> None:
+    """Populate the signature cache and import index from the pickle sidecar.
+
+    Silently falls back to lazy parsing when the sidecar is missing,
+    unreadable, or was built from different stdlib sources.
+    """
+    global _import_index
+
+    pkg = importlib.resources.files("prove.stdlib")
+    try:
+        data = pkg.joinpath(_PRECOMPILED_FILE).read_bytes()
+    except Exception:
+        return
+
+    payload = _read_precompiled(data)
+    if payload is None:
+        return
+    _cache.update(payload["signatures"])  # type: ignore[arg-type]
+    _import_index = payload["import_index"]  # type: ignore[assignment]
+
+
+_load_precompiled()
@@ -4,10 +4,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 from prove.source import Span
 from prove.types import Type
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping, ValuesView
+
 
 class SymbolKind(Enum):
     FUNCTION = auto()
@@ -17,7 +22,7 @@ class SymbolKind(Enum):
     PARAMETER = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     name: str
     kind: SymbolKind
@@ -31,7 +36,7 @@ class Symbol:
     match_arm_ids: set[int] = field(default_factory=set)  # unique arm IDs where used
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FunctionSignature:
     verb: str | None
     name: str
@@ -45,15 +50,44 @@ class FunctionSignature:
     doc_comment: str | None = None
     event_type: Type | None = None
     ensures: list = field(default_factory=list)
+    # len(param_types), precomputed for overload resolution
+    arity: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "arity", len(self.param_types))
+
+
+_LOOKUP_CACHE_MAX = 512
+
+
+def _bloom_mask(name: str) -> int:
+    """Two-bit Bloom filter mask for *name* within a 64-bit scope filter."""
+    h = hash(name)
+    return (1 << (h & 63)) | (1 << ((h >> 6) & 63))
 
 
 class Scope:
     """A single lexical scope level."""
 
+    __slots__ = ("parent", "name", "_symbols", "_bloom")
+
     def __init__(self, parent: Scope | None = None, name: str = "") -> None:
         self.parent = parent
         self.name = name
         self._symbols: dict[str, Symbol] = {}
+        # Bloom filter over the names defined here: lets lookups skip the
+        # dict probe for scopes that certainly don't define a name.
+        self._bloom = 0
+
+    def __getstate__(self) -> tuple[Scope | None, str, dict[str, Symbol]]:
+        return self.parent, self.name, self._symbols
+
+    def __setstate__(self, state: tuple[Scope | None, str, dict[str, Symbol]]) -> None:
+        # The filter is built from str hashes, which are salted per process.
+        self.parent, self.name, self._symbols = state
+        self._bloom = 0
+        for name in self._symbols:
+            self._bloom |= _bloom_mask(name)
 
     def define(self, symbol: Symbol) -> Symbol | None:
         """Define a symbol in this scope. Returns existing symbol if duplicate."""
@@ -61,20 +95,24 @@ class Scope:
         if existing is not None:
             return existing
         self._symbols[symbol.name] = symbol
+        self._bloom |= _bloom_mask(symbol.name)
         return None
 
     def lookup(self, name: str) -> Symbol | None:
         """Look up a name in this scope and all parent scopes."""
-        sym = self._symbols.get(name)
-        if sym is not None:
-            return sym
-        if self.parent is not None:
-            return self.parent.lookup(name)
+        mask = _bloom_mask(name)
+        scope: Scope | None = self
+        while scope is not None:
+            if scope._bloom & mask == mask:
+                sym = scope._symbols.get(name)
+                if sym is not None:
+                    return sym
+            scope = scope.parent
         return None
 
-    def all_symbols(self) -> list[Symbol]:
-        """Return all symbols defined in this scope."""
-        return list(self._symbols.values())
+    def all_symbols(self) -> ValuesView[Symbol]:
+        """Return a live view of all symbols defined in this scope."""
+        return self._symbols.values()
 
 
 def _types_structurally_equal(a: Type, b: Type) -> bool:
@@ -84,6 +122,7 @@ def _types_structurally_equal(a: Type, b: Type) -> bool:
     Two types are equal only when they have the same structure and names.
     """
     from prove.types import (
+        UNIT,
         AlgebraicType,
         FunctionType,
         GenericInstance,
@@ -91,7 +130,6 @@ def _types_structurally_equal(a: Type, b: Type) -> bool:
         RecordType,
         RefinementType,
         TypeVariable,
-        UnitType,
     )
 
     if type(a) is not type(b):
@@ -100,7 +138,7 @@ def _types_structurally_equal(a: Type, b: Type) -> bool:
         return a.name == b.name
     if isinstance(a, PrimitiveType):
         return a.name == b.name
-    if isinstance(a, UnitType):
+    if a is UNIT:
         return True
     if isinstance(a, GenericInstance):
         b_gi: GenericInstance = b  # type: ignore[assignment]
@@ -130,8 +168,39 @@ class SymbolTable:
     def __init__(self) -> None:
         self._scope_stack: list[Scope] = [Scope(name="module")]
         self._functions: dict[tuple[str | None, str], list[FunctionSignature]] = {}
+        self._functions_view = MappingProxyType(self._functions)
+        # Secondary indexes over _functions: first signature per
+        # (verb, name, arity), and the (verb, name) keys per bare name in
+        # registration order.
+        self._by_arity: dict[tuple[str | None, str, int], FunctionSignature] = {}
+        self._keys_by_name: dict[str, list[tuple[str | None, str]]] = {}
+        # name → {(arg type ids, arity, return type id): (result, *operands)}.
+        # The operands are kept alive alongside the result so their ids
+        # cannot be recycled while cached.
+        self._resolve_any_cache: dict[str, dict[tuple[object, ...], tuple[object, ...]]] = {}
         self._types: dict[str, Type] = {}
+        self._types_view = MappingProxyType(self._types)
         self._known_names_cache: set[str] | None = None
+        # (id(scope), name) → lookup result.  Cleared on define and pop:
+        # a define only changes results for the innermost scope, and a
+        # popped scope's id may be reused by the next push.
+        self._lookup_cache: dict[tuple[int, str], Symbol | None] = {}
+
+    def __getstate__(self) -> dict[str, object]:
+        # The views can't be pickled, and the memo tables are keyed by
+        # object ids that mean nothing in another process.
+        state = self.__dict__.copy()
+        del state["_functions_view"]
+        del state["_types_view"]
+        state["_resolve_any_cache"] = {}
+        state["_known_names_cache"] = None
+        state["_lookup_cache"] = {}
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._functions_view = MappingProxyType(self._functions)
+        self._types_view = MappingProxyType(self._types)
 
     @property
     def current_scope(self) -> Scope:
@@ -146,28 +215,45 @@ class SymbolTable:
             raise RuntimeError("cannot pop module scope")
         scope = self._scope_stack.pop()
         self._known_names_cache = None
+        self._lookup_cache.clear()
         return scope
 
     def define(self, symbol: Symbol) -> Symbol | None:
         """Define a symbol in the current scope. Returns existing if duplicate."""
         self._known_names_cache = None
+        self._lookup_cache.clear()
         return self.current_scope.define(symbol)
 
     def lookup(self, name: str) -> Symbol | None:
         """Look up a name in the current scope chain."""
-        return self.current_scope.lookup(name)
+        current = self._scope_stack[-1]
+        key = (id(current), name)
+        cache = self._lookup_cache
+        if key in cache:
+            return cache[key]
+        result = current.lookup(name)
+        if len(cache) >= _LOOKUP_CACHE_MAX:
+            cache.clear()
+        cache[key] = result
+        return result
 
     def define_function(self, sig: FunctionSignature) -> None:
         """Register a function signature."""
         key = (sig.verb, sig.name)
-        self._functions.setdefault(key, []).append(sig)
+        sigs = self._functions.get(key)
+        if sigs is None:
+            sigs = self._functions[key] = []
+            self._keys_by_name.setdefault(sig.name, []).append(key)
+        sigs.append(sig)
+        self._by_arity.setdefault((sig.verb, sig.name, sig.arity), sig)
+        self._resolve_any_cache.pop(sig.name, None)
         self._known_names_cache = None
 
     def find_exact_duplicate(self, sig: FunctionSignature) -> FunctionSignature | None:
         """Find a previously registered function with the same verb, name, and param types."""
         key = (sig.verb, sig.name)
         for existing in self._functions.get(key, []):
-            if len(existing.param_types) != len(sig.param_types):
+            if existing.arity != sig.arity:
                 continue
             if all(
                 _types_structurally_equal(a, b)
@@ -197,7 +283,7 @@ class SymbolTable:
 
             # Priority 1: Exact type match
             for sig in sigs:
-                if len(sig.param_types) == len(arg_types) and all(
+                if sig.arity == len(arg_types) and all(
                     isinstance(p, TypeVariable) or types_compatible(p, a)
                     for p, a in zip(sig.param_types, arg_types)
                 ):
@@ -205,7 +291,7 @@ class SymbolTable:
 
             # Priority 2: Arity match
             for sig in sigs:
-                if len(sig.param_types) == len(arg_types):
+                if sig.arity == len(arg_types):
                     return sig
 
         return None
@@ -217,15 +303,15 @@ class SymbolTable:
 
         Tries (verb, name) first, then (None, name) as fallback for builtins.
         """
-        best = None
-        for key in [(verb, name), (None, name)]:
-            sigs = self._functions.get(key, [])
-            for sig in sigs:
-                if len(sig.param_types) == arg_count:
-                    return sig
-            if sigs and best is None:
-                best = sigs[0]
-        return best
+        sig = self._by_arity.get((verb, name, arg_count))
+        if sig is not None:
+            return sig
+        sig = self._by_arity.get((None, name, arg_count))
+        if sig is not None:
+            return sig
+        # No arity match — report against the first registered overload
+        sigs = self._functions.get((verb, name)) or self._functions.get((None, name))
+        return sigs[0] if sigs else None
 
     def resolve_function_any(
         self,
@@ -234,6 +320,33 @@ class SymbolTable:
         *,
         arity: int | None = None,
         expected_return: Type | None = None,
+    ) -> FunctionSignature | None:
+        """Look up a function by name alone (any verb), memoized per call shape.
+
+        See ``_resolve_function_any`` for the disambiguation rules.
+        """
+        key = (
+            None if arg_types is None else tuple(map(id, arg_types)),
+            arity,
+            id(expected_return),
+        )
+        by_shape = self._resolve_any_cache.setdefault(name, {})
+        hit = by_shape.get(key)
+        if hit is not None:
+            return hit[0]  # type: ignore[return-value]
+        result = self._resolve_function_any(
+            name, arg_types, arity=arity, expected_return=expected_return
+        )
+        by_shape[key] = (result, tuple(arg_types or ()), expected_return)
+        return result
+
+    def _resolve_function_any(
+        self,
+        name: str,
+        arg_types: list[Type] | None = None,
+        *,
+        arity: int | None = None,
+        expected_return: Type | None = None,
     ) -> FunctionSignature | None:
         """Look up a function by name alone (any verb).
 
@@ -258,9 +371,8 @@ class SymbolTable:
             return False
 
         candidates: list[FunctionSignature] = []
-        for (_, fname), sigs in self._functions.items():
-            if fname == name:
-                candidates.extend(sigs)
+        for key in self._keys_by_name.get(name, ()):
+            candidates.extend(self._functions[key])
         if not candidates:
             return None
         if len(candidates) == 1:
@@ -269,7 +381,7 @@ class SymbolTable:
         # Narrow by arity
         n = arity if arity is not None else (len(arg_types) if arg_types is not None else None)
         if n is not None:
-            by_arity = [s for s in candidates if len(s.param_types) == n]
+            by_arity = [s for s in candidates if s.arity == n]
             if len(by_arity) == 1:
                 return by_arity[0]
             if by_arity:
@@ -304,7 +416,7 @@ class SymbolTable:
         if arg_types:
             structural_matches = []
             for sig in candidates:
-                if len(sig.param_types) == len(arg_types):
+                if sig.arity == len(arg_types):
                     if all(
                         isinstance(p, TypeVariable) or types_compatible(p, a)
                         for p, a in zip(sig.param_types, arg_types)
@@ -446,17 +558,19 @@ class SymbolTable:
         """Register a resolved type in the type registry."""
         self._types[name] = resolved
         self._known_names_cache = None
+        self._resolve_any_cache.clear()
 
     def resolve_type(self, name: str) -> Type | None:
         """Look up a type by name."""
         return self._types.get(name)
 
-    def all_functions(self) -> dict[tuple[str | None, str], list[FunctionSignature]]:
-        return dict(self._functions)
+    def all_functions(self) -> Mapping[tuple[str | None, str], list[FunctionSignature]]:
+        """Read-only live view of every function, keyed by (verb, name)."""
+        return self._functions_view
 
-    def all_types(self) -> dict[str, Type]:
-        """Return all registered types."""
-        return dict(self._types)
+    def all_types(self) -> Mapping[str, Type]:
+        """Read-only live view of every registered type, keyed by name."""
+        return self._types_view
 
     def all_known_names(self) -> set[str]:
         """Return all names visible in current scope + types + functions."""
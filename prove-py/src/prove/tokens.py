@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from prove.source import Span
 
 
-class TokenKind(Enum):
+class TokenKind(IntEnum):
     # Verbs
     TRANSFORMS = auto()
     INPUTS = auto()
@@ -143,7 +143,7 @@ class TokenKind(Enum):
     EOF = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Token:
     kind: TokenKind
     value: str
@@ -233,3 +233,7 @@ NEWLINE_SUPPRESSED_AFTER: frozenset[TokenKind] = frozenset(
         TokenKind.DOT_DOT,
     }
 )
+
+# Bit ``kind`` is set for every kind in NEWLINE_SUPPRESSED_AFTER, so the
+# lexer's per-newline check is a shift and mask instead of a set probe.
+NEWLINE_SUPPRESSED_MASK: int = sum(1 << kind for kind in NEWLINE_SUPPRESSED_AFTER)
@@ -6,40 +6,135 @@ Resolved types are produced during semantic analysis.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional
+import sys
+import weakref
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from prove.ast_nodes import Expr
 
 # ── Resolved types ──────────────────────────────────────────────
+#
+# Named types intern their name on construction so that name comparisons
+# and dict probes hit the identity fast path, and hash on the name alone:
+# str caches its own hash, so this avoids building a field tuple per call.
+#
+# Every class also carries a ``kind`` tag — its position in the ``Type``
+# union below — which indexes the per-kind handler tables further down.
+
+
+def _intern_name(obj: object, attr: str = "name") -> None:
+    object.__setattr__(obj, attr, sys.intern(getattr(obj, attr)))
+
+
+def _freeze(value: object) -> object:
+    """Hashable stand-in for a field value (field maps become item tuples)."""
+    if isinstance(value, dict):
+        return (dict, tuple(value.items()))
+    return value
+
+
+def _as_tuple(obj: object, attr: str) -> None:
+    """Store a sequence field as a tuple, whatever the caller passed."""
+    value = getattr(obj, attr)
+    if type(value) is not tuple:
+        object.__setattr__(obj, attr, tuple(value))
+
+
+def _reduce_hash_consed(obj: Any) -> tuple[Any, tuple[object, ...]]:
+    """Unpickle/copy through the constructor so the result is canonical."""
+    return type(obj), tuple(getattr(obj, f.name) for f in fields(obj))
+
+
+class _HashConsed(type):
+    """Metaclass that hash-conses instances of a frozen type dataclass.
+
+    Structurally equal instances share one object, so identity checks
+    (``a is b``) are a cheap stand-in for equality.  Canonical instances
+    are held weakly; a type whose fields cannot be hashed (e.g. a
+    refinement constraint expression) is returned as built.
+    """
+
+    _instances: weakref.WeakValueDictionary[tuple[object, ...], Any]
+
+    def __init__(cls, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        cls._instances = weakref.WeakValueDictionary()
+        if "__reduce__" not in cls.__dict__:
+            cls.__reduce__ = _reduce_hash_consed  # type: ignore[method-assign,assignment]
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        obj = super().__call__(*args, **kwargs)
+        names = cls.__dataclass_fields__  # type: ignore[attr-defined]
+        key = tuple(_freeze(getattr(obj, name)) for name in names)
+        try:
+            return cls._instances.setdefault(key, obj)
+        except TypeError:
+            return obj
+
 
+@dataclass(frozen=True, eq=False, slots=True, weakref_slot=True)
+class PrimitiveType(metaclass=_HashConsed):
+    """Always hash-consed (its fields are hashable), so equality is identity."""
+
+    kind: ClassVar[int] = 0
 
-@dataclass(frozen=True)
-class PrimitiveType:
     name: str
     modifiers: tuple[tuple[str | None, str], ...] = ()
 
+    def __post_init__(self) -> None:
+        _intern_name(self)
+        _as_tuple(self, "modifiers")
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class UnitType(metaclass=_HashConsed):
+    """Stateless; hash-consing makes ``UNIT`` the only instance."""
 
-@dataclass(frozen=True)
-class UnitType:
-    pass
+    kind: ClassVar[int] = 1
 
+    def __reduce__(self) -> tuple[type, tuple[()]]:
+        # Route pickle/copy back through the constructor so the
+        # singleton survives and ``ty is UNIT`` stays valid.
+        return (UnitType, ())
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class VariantInfo:
+    kind: ClassVar[int] = 12
+
     name: str
     fields: dict[str, Type] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        _intern_name(self)
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class RecordType(metaclass=_HashConsed):
+    kind: ClassVar[int] = 2
 
-@dataclass(frozen=True)
-class RecordType:
     name: str
     fields: dict[str, Type] = field(default_factory=dict)
     type_params: tuple[str, ...] = ()
 
+    def __post_init__(self) -> None:
+        _intern_name(self)
+
+    def __hash__(self) -> int:
+        return hash(self.name)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StructType:
     """Row-polymorphic structural type.
 
@@ -48,67 +143,137 @@ class StructType:
     "any record that has at least these fields with these types".
     """
 
+    kind: ClassVar[int] = 3
+
     required_fields: dict[str, Type] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlgebraicType:
+    kind: ClassVar[int] = 4
+
     name: str
-    variants: list[VariantInfo] = field(default_factory=list)
+    variants: tuple[VariantInfo, ...] = ()
     type_params: tuple[str, ...] = ()
     parents: tuple[str, ...] = ()
+    # Derived from variants; membership checks skip rebuilding a name set.
+    variant_names: frozenset[str] = field(init=False, repr=False, compare=False)
+    # Variant name -> first variant declared with it, for O(1) arm lookup.
+    variant_by_name: dict[str, VariantInfo] = field(init=False, repr=False, compare=False)
+    # Variant name -> its bit (1 << declaration index); all bits set = covered.
+    variant_bits: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        _intern_name(self)
+        _as_tuple(self, "variants")
+        object.__setattr__(self, "variant_names", frozenset(v.name for v in self.variants))
+        by_name: dict[str, VariantInfo] = {}
+        for v in self.variants:
+            by_name.setdefault(v.name, v)
+        object.__setattr__(self, "variant_by_name", by_name)
+        bits = {name: 1 << i for i, name in enumerate(by_name)}
+        object.__setattr__(self, "variant_bits", bits)
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    def __reduce__(self) -> tuple[Any, tuple[object, ...]]:
+        # Rebuild through __init__ so derived fields are never pickled.
+        return (AlgebraicType, (self.name, self.variants, self.type_params, self.parents))
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class RefinementType(metaclass=_HashConsed):
+    kind: ClassVar[int] = 5
 
-
-@dataclass(frozen=True)
-class RefinementType:
     name: str
     base: Type = None  # type: ignore[assignment]
     constraint: Optional["Expr"] = None
 
+    def __post_init__(self) -> None:
+        _intern_name(self)
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class GenericInstance(metaclass=_HashConsed):
+    kind: ClassVar[int] = 6
 
-@dataclass(frozen=True)
-class GenericInstance:
     base_name: str
-    args: list[Type] = field(default_factory=list)
+    args: tuple[Type, ...] = ()
+
+    def __post_init__(self) -> None:
+        _intern_name(self, "base_name")
+        _as_tuple(self, "args")
 
+    def __hash__(self) -> int:
+        return hash(self.base_name)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TypeVariable:
+    kind: ClassVar[int] = 7
+
     name: str
 
+    def __post_init__(self) -> None:
+        _intern_name(self)
 
-@dataclass(frozen=True)
-class FunctionType:
-    param_types: list[Type] = field(default_factory=list)
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class FunctionType(metaclass=_HashConsed):
+    kind: ClassVar[int] = 8
+
+    param_types: tuple[Type, ...] = ()
     return_type: Type = None  # type: ignore[assignment]
 
+    def __post_init__(self) -> None:
+        _as_tuple(self, "param_types")
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class ListType(metaclass=_HashConsed):
+    kind: ClassVar[int] = 9
 
-@dataclass(frozen=True)
-class ListType:
     element: Type = None  # type: ignore[assignment]
 
 
-@dataclass(frozen=True)
-class ArrayType:
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class ArrayType(metaclass=_HashConsed):
+    kind: ClassVar[int] = 10
+
     element: Type = None  # type: ignore[assignment]
     modifiers: tuple[tuple[str | None, str], ...] = ()
 
 
-@dataclass(frozen=True)
-class ErrorType:
-    """Poison type that suppresses cascading errors."""
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class ErrorType(metaclass=_HashConsed):
+    """Poison type that suppresses cascading errors.
+
+    Stateless; hash-consing makes ``ERROR_TY`` the only instance.
+    """
+
+    kind: ClassVar[int] = 11
 
-    pass
+    def __reduce__(self) -> tuple[type, tuple[()]]:
+        return (ErrorType, ())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BorrowType:
     """Type representing a borrowed reference (compiler-inferred read-only borrow)."""
 
+    kind: ClassVar[int] = 13
+
     inner: Type
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EffectType:
     """Type annotated with effects (IO, Fail, Async).
 
@@ -116,6 +281,8 @@ class EffectType:
     are informational — violations produce warnings, not errors.
     """
 
+    kind: ClassVar[int] = 14
+
     base: "Type"
     effects: frozenset[str]
 
@@ -137,12 +304,13 @@ Type = (
     | BorrowType
     | EffectType
 )
+_KIND_COUNT = len(Type.__args__)
 
 
 # ── Recursive type analysis ───────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecursiveFieldInfo:
     """Describes a field that references its own type (or a mutually recursive type)."""
 
@@ -236,6 +404,7 @@ _NUMERIC_RANK: dict[str, int] = {
     "Decimal": 1,
     "Float": 2,
 }
+_NUMERIC_NAMES: frozenset[str] = frozenset(_NUMERIC_RANK)
 
 
 def numeric_widen(a: Type, b: Type) -> Type | None:
@@ -246,13 +415,11 @@ def numeric_widen(a: Type, b: Type) -> Type | None:
     """
     ua = _unwrap_refinement(a)
     ub = _unwrap_refinement(b)
-    if not (isinstance(ua, PrimitiveType) and isinstance(ub, PrimitiveType)):
+    if type(ua) is not PrimitiveType or ua.name not in _NUMERIC_NAMES:
         return None
-    ra = _NUMERIC_RANK.get(ua.name)
-    rb = _NUMERIC_RANK.get(ub.name)
-    if ra is None or rb is None:
+    if type(ub) is not PrimitiveType or ub.name not in _NUMERIC_NAMES:
         return None
-    return a if ra >= rb else b
+    return a if _NUMERIC_RANK[ua.name] >= _NUMERIC_RANK[ub.name] else b
 
 
 BUILTINS: dict[str, Type] = {
@@ -305,57 +472,96 @@ HOF_BUILTINS: frozenset[str] = frozenset(
 # ── Type utilities ──────────────────────────────────────────────
 
 
+def _primitive_name(ty: PrimitiveType) -> str:
+    if ty.modifiers:
+        parts = []
+        for mname, mval in ty.modifiers:
+            parts.append(f"{mname}:{mval}" if mname else mval)
+        return f"{ty.name}:[{' '.join(parts)}]"
+    return ty.name
+
+
+def _struct_name(ty: StructType) -> str:
+    if ty.required_fields:
+        fields = ", ".join(f"{n}: {type_name(t)}" for n, t in ty.required_fields.items())
+        return f"Struct with {{{fields}}}"
+    return "Struct"
+
+
+def _function_name(ty: FunctionType) -> str:
+    params = ", ".join(type_name(p) for p in ty.param_types)
+    ret = type_name(ty.return_type)
+    return f"({params}) -> {ret}"
+
+
+def _array_name(ty: ArrayType) -> str:
+    name = f"Array<{type_name(ty.element)}>"
+    if ty.modifiers:
+        parts = []
+        for mname, mval in ty.modifiers:
+            parts.append(f"{mname}:{mval}" if mname else mval)
+        return f"{name}:[{', '.join(parts)}]"
+    return name
+
+
+def _effect_name(ty: EffectType) -> str:
+    effs = " & ".join(sorted(ty.effects))
+    return f"{type_name(ty.base)} & {effs}"
+
+
+def _plain_name(ty: Any) -> str:
+    return ty.name  # type: ignore[no-any-return]
+
+
+def _by_kind(handlers: dict[type, Callable[..., Any]]) -> list[Callable[..., Any] | None]:
+    """Lay out per-class handlers as a list indexed by each class's ``kind``."""
+    table: list[Callable[..., Any] | None] = [None] * _KIND_COUNT
+    for cls, handler in handlers.items():
+        table[cls.kind] = handler
+    return table
+
+
+# Type kind → name formatter; one list index instead of an isinstance chain
+_TYPE_NAME_DISPATCH = _by_kind(
+    {
+        PrimitiveType: _primitive_name,
+        UnitType: lambda ty: "Unit",
+        RecordType: _plain_name,
+        StructType: _struct_name,
+        AlgebraicType: _plain_name,
+        RefinementType: _plain_name,
+        GenericInstance: lambda ty: f"{ty.base_name}<{', '.join(type_name(a) for a in ty.args)}>",
+        TypeVariable: _plain_name,
+        FunctionType: _function_name,
+        ListType: lambda ty: f"List<{type_name(ty.element)}>",
+        ArrayType: _array_name,
+        ErrorType: lambda ty: "<error>",
+        VariantInfo: _plain_name,
+        BorrowType: lambda ty: f"&{type_name(ty.inner)}",
+        EffectType: _effect_name,
+    }
+)
+
+
+# id(ty) → (ty, name).  Holding the type keeps its id from being reused
+# while the entry lives; hash-consing means shared subtrees (List<Integer>
+# inside several signatures) are formatted once.
+_TYPE_NAME_CACHE: dict[int, tuple[Type, str]] = {}
+_TYPE_NAME_CACHE_MAX = 4096
+
+
 def type_name(ty: Type) -> str:
     """Human-readable name for diagnostics."""
-    if isinstance(ty, PrimitiveType):
-        if ty.modifiers:
-            parts = []
-            for mname, mval in ty.modifiers:
-                parts.append(f"{mname}:{mval}" if mname else mval)
-            return f"{ty.name}:[{' '.join(parts)}]"
-        return ty.name
-    if isinstance(ty, UnitType):
-        return "Unit"
-    if isinstance(ty, RecordType):
-        return ty.name
-    if isinstance(ty, StructType):
-        if ty.required_fields:
-            fields = ", ".join(f"{n}: {type_name(t)}" for n, t in ty.required_fields.items())
-            return f"Struct with {{{fields}}}"
-        return "Struct"
-    if isinstance(ty, AlgebraicType):
-        return ty.name
-    if isinstance(ty, RefinementType):
-        return ty.name
-    if isinstance(ty, GenericInstance):
-        args = ", ".join(type_name(a) for a in ty.args)
-        return f"{ty.base_name}<{args}>"
-    if isinstance(ty, TypeVariable):
-        return ty.name
-    if isinstance(ty, FunctionType):
-        params = ", ".join(type_name(p) for p in ty.param_types)
-        ret = type_name(ty.return_type)
-        return f"({params}) -> {ret}"
-    if isinstance(ty, ListType):
-        return f"List<{type_name(ty.element)}>"
-    if isinstance(ty, ArrayType):
-        name = f"Array<{type_name(ty.element)}>"
-        if ty.modifiers:
-            parts = []
-            for mname, mval in ty.modifiers:
-                parts.append(f"{mname}:{mval}" if mname else mval)
-            return f"{name}:[{', '.join(parts)}]"
-        return name
-    if isinstance(ty, ErrorType):
-        return "<error>"
-    if isinstance(ty, VariantInfo):
-        return ty.name
-    if isinstance(ty, BorrowType):
-        return f"&{type_name(ty.inner)}"
-    if isinstance(ty, EffectType):
-        effs = " & ".join(sorted(ty.effects))
-        return f"{type_name(ty.base)} & {effs}"
-    return str(ty)
+    hit = _TYPE_NAME_CACHE.get(id(ty))
+    if hit is not None:
+        return hit[1]
+    kind = getattr(ty, "kind", None)
+    handler = None if kind is None else _TYPE_NAME_DISPATCH[kind]
+    name = str(ty) if handler is None else handler(ty)
+    if len(_TYPE_NAME_CACHE) >= _TYPE_NAME_CACHE_MAX:
+        _TYPE_NAME_CACHE.clear()
+    _TYPE_NAME_CACHE[id(ty)] = (ty, name)
+    return name
 
 
 def _unwrap_refinement(ty: Type) -> Type:
@@ -364,9 +570,17 @@ def _unwrap_refinement(ty: Type) -> Type:
     A refinement type (e.g. Price = Decimal where value > 0) is a subtype
     of its base and should be compatible wherever the base is expected.
     """
-    while isinstance(ty, RefinementType) and ty.base is not None:
-        ty = ty.base
-    return ty
+    if type(ty) is not RefinementType:
+        return ty
+    base = ty.base
+    if base is None:
+        return ty
+    if type(base) is not RefinementType:
+        return base
+    # Refinement of a refinement — rare, so only now fall back to a loop.
+    while type(base) is RefinementType and base.base is not None:
+        base = base.base
+    return base
 
 
 _JSON_SERIALIZABLE_PRIMITIVES = frozenset(
@@ -419,6 +633,18 @@ def is_json_serializable(ty: Type) -> bool:
 STORE_BACKED_TYPES: set[str] = set()
 
 
+# Memo for types_compatible keyed by operand identity.  Entries keep the
+# operands alive so their ids cannot be recycled while cached; the table is
+# dropped wholesale once it reaches _COMPAT_CACHE_MAX entries.
+_COMPAT_CACHE: dict[tuple[int, int, bool], tuple[Type, Type, bool]] = {}
+_COMPAT_CACHE_MAX = 4096
+
+
+def clear_compat_cache() -> None:
+    """Forget memoized types_compatible results (e.g. after STORE_BACKED_TYPES changes)."""
+    _COMPAT_CACHE.clear()
+
+
 def types_compatible(expected: Type, actual: Type, *, covariant: bool = True) -> bool:
     """Check structural compatibility between two types.
 
@@ -428,11 +654,51 @@ def types_compatible(expected: Type, actual: Type, *, covariant: bool = True) ->
     """
     if expected is actual:
         return True
-    if isinstance(expected, ErrorType) or isinstance(actual, ErrorType):
+    # Wildcards short-circuit before the memo: exact class checks are
+    # cheaper than building the cache key.
+    te = type(expected)
+    ta = type(actual)
+    if expected is ERROR_TY or actual is ERROR_TY or te is TypeVariable or ta is TypeVariable:
         return True
-    if isinstance(expected, TypeVariable) or isinstance(actual, TypeVariable):
-        return True
-
+    key = (id(expected), id(actual), covariant)
+    hit = _COMPAT_CACHE.get(key)
+    if hit is not None:
+        return hit[2]
+    # Structural sub-checks (type args, parameters, elements, fields) all
+    # have to hold, so instead of recursing they are pushed onto a worklist
+    # and drained here in a single frame.
+    pending: _Pending = [(expected, actual, covariant)]
+    result = True
+    while pending:
+        e, a, cov = pending.pop()
+        if e is a or e is ERROR_TY or a is ERROR_TY:
+            continue
+        if type(e) is TypeVariable or type(a) is TypeVariable:
+            continue
+        sub = _COMPAT_CACHE.get((id(e), id(a), cov))
+        if sub is not None:
+            if sub[2]:
+                continue
+            result = False
+            break
+        if not _compat_step(e, a, cov, pending):
+            result = False
+            break
+    if len(_COMPAT_CACHE) >= _COMPAT_CACHE_MAX:
+        _COMPAT_CACHE.clear()
+    _COMPAT_CACHE[key] = (expected, actual, result)
+    return result
+
+
+_Pending = list[tuple[Type, Type, bool]]
+
+
+def _compat_step(expected: Type, actual: Type, covariant: bool, pending: _Pending) -> bool:
+    """Check one pair, pushing structural sub-checks onto *pending*.
+
+    Returns False on a definite mismatch.  True means compatible provided
+    every pair pushed onto *pending* is compatible as well.
+    """
     # Value is the heterogeneous base type for all serializable types
     if isinstance(expected, PrimitiveType) and expected.name == "Value":
         if is_json_serializable(actual):
@@ -461,7 +727,7 @@ def types_compatible(expected: Type, actual: Type, *, covariant: bool = True) ->
     # Option<T> <- Unit: auto-converts to None
     # Only when covariant=True (not inside container type args)
     if isinstance(expected, GenericInstance) and expected.base_name == "Option" and expected.args:
-        if isinstance(actual, UnitType):
+        if actual is UNIT:
             return True
         if covariant:
             inner = expected.args[0]
@@ -477,14 +743,18 @@ def types_compatible(expected: Type, actual: Type, *, covariant: bool = True) ->
     actual = _unwrap_refinement(actual)
     # EffectType is transparent for compatibility — unwrap to base
     if isinstance(expected, EffectType):
-        return types_compatible(expected.base, actual)
+        pending.append((expected.base, actual, True))
+        return True
     if isinstance(actual, EffectType):
-        return types_compatible(expected, actual.base)
+        pending.append((expected, actual.base, True))
+        return True
     # BorrowType is compatible with its inner type for read-only access
     if isinstance(expected, BorrowType):
-        return types_compatible(expected.inner, actual)
+        pending.append((expected.inner, actual, True))
+        return True
     if isinstance(actual, BorrowType):
-        return types_compatible(expected, actual.inner)
+        pending.append((expected, actual.inner, True))
+        return True
     if isinstance(expected, PrimitiveType):
         if isinstance(actual, (RecordType, AlgebraicType)):
             return expected.name == actual.name
@@ -502,18 +772,17 @@ def types_compatible(expected: Type, actual: Type, *, covariant: bool = True) ->
     # Row polymorphism: StructType accepts any RecordType with matching fields
     if isinstance(expected, StructType):
         if isinstance(actual, RecordType):
-            for fname, ftype in expected.required_fields.items():
-                actual_ftype = actual.fields.get(fname)
-                if actual_ftype is None or not types_compatible(ftype, actual_ftype):
-                    return False
-            return True
-        if isinstance(actual, StructType):
-            for fname, ftype in expected.required_fields.items():
-                actual_ftype = actual.required_fields.get(fname)
-                if actual_ftype is None or not types_compatible(ftype, actual_ftype):
-                    return False
-            return True
-        return False
+            actual_fields = actual.fields
+        elif isinstance(actual, StructType):
+            actual_fields = actual.required_fields
+        else:
+            return False
+        for fname, ftype in expected.required_fields.items():
+            actual_ftype = actual_fields.get(fname)
+            if actual_ftype is None:
+                return False
+            pending.append((ftype, actual_ftype, True))
+        return True
     # Bare Verb is compatible with any FunctionType (unparameterised callable)
     if (
         isinstance(expected, PrimitiveType)
@@ -528,53 +797,87 @@ def types_compatible(expected: Type, actual: Type, *, covariant: bool = True) ->
         and isinstance(actual, FunctionType)
     ):
         return True
+    # Class identity rather than comparing kind tags: operands can be None
+    # (e.g. an unset FunctionType return type), which has no tag.
     if type(expected) is not type(actual):
         return False
-    if isinstance(expected, PrimitiveType) and isinstance(actual, PrimitiveType):
-        if expected.name != actual.name:
+    try:
+        handler = _SAME_KIND_COMPAT[expected.kind]
+    except AttributeError:
+        handler = None
+    if handler is None:
+        return expected == actual
+    return handler(expected, actual, pending)
+
+
+# ── Same-kind compatibility ──────────────────────────────────
+#
+# Once _compat_step has ruled out the cross-kind rules, both operands
+# have the same concrete class; these handlers compare them structurally,
+# pushing component pairs onto the worklist rather than recursing.
+
+
+def _primitive_compat(expected: PrimitiveType, actual: PrimitiveType, pending: _Pending) -> bool:
+    if expected.name != actual.name:
+        return False
+    if expected.name == "Decimal":
+        es, as_ = get_scale(expected), get_scale(actual)
+        if es is not None and as_ is not None and es != as_:
             return False
-        if expected.name == "Decimal":
-            es, as_ = get_scale(expected), get_scale(actual)
-            if es is not None and as_ is not None and es != as_:
-                return False
-        return True
-    if isinstance(expected, UnitType):
+    return True
+
+
+def _algebraic_compat(expected: AlgebraicType, actual: AlgebraicType, pending: _Pending) -> bool:
+    if expected.name == actual.name:
         return True
-    if isinstance(expected, RecordType) and isinstance(actual, RecordType):
-        return expected.name == actual.name
-    if isinstance(expected, AlgebraicType) and isinstance(actual, AlgebraicType):
-        if expected.name == actual.name:
-            return True
-        # Parent type is compatible where child type is expected:
-        # child contains all parent variants, so any parent value is valid.
-        if actual.name in expected.parents:
-            return True
+    # Parent type is compatible where child type is expected:
+    # child contains all parent variants, so any parent value is valid.
+    return actual.name in expected.parents
+
+
+def _generic_compat(expected: GenericInstance, actual: GenericInstance, pending: _Pending) -> bool:
+    if expected.base_name != actual.base_name:
         return False
-    if isinstance(expected, RefinementType) and isinstance(actual, RefinementType):
-        return expected.name == actual.name
-    if isinstance(expected, GenericInstance) and isinstance(actual, GenericInstance):
-        if expected.base_name != actual.base_name:
-            return False
-        if len(expected.args) != len(actual.args):
-            return False
-        # Type args are invariant — no Option auto-wrapping inside containers
-        return all(
-            types_compatible(e, a, covariant=False) for e, a in zip(expected.args, actual.args)
-        )
-    if isinstance(expected, FunctionType) and isinstance(actual, FunctionType):
-        if len(expected.param_types) != len(actual.param_types):
-            return False
-        if not all(
-            types_compatible(e, a) for e, a in zip(expected.param_types, actual.param_types)
-        ):
-            return False
-        return types_compatible(expected.return_type, actual.return_type)
-    if isinstance(expected, ListType) and isinstance(actual, ListType):
-        # List element types are invariant — no Option auto-wrapping
-        return types_compatible(expected.element, actual.element, covariant=False)
-    if isinstance(expected, ArrayType) and isinstance(actual, ArrayType):
-        return types_compatible(expected.element, actual.element, covariant=False)
-    return expected == actual
+    if len(expected.args) != len(actual.args):
+        return False
+    # Type args are invariant — no Option auto-wrapping inside containers
+    pending.extend((e, a, False) for e, a in zip(expected.args, actual.args))
+    return True
+
+
+def _function_compat(expected: FunctionType, actual: FunctionType, pending: _Pending) -> bool:
+    if len(expected.param_types) != len(actual.param_types):
+        return False
+    pending.append((expected.return_type, actual.return_type, True))
+    pending.extend((e, a, True) for e, a in zip(expected.param_types, actual.param_types))
+    return True
+
+
+def _element_compat(
+    expected: ListType | ArrayType, actual: ListType | ArrayType, pending: _Pending
+) -> bool:
+    # Element types are invariant — no Option auto-wrapping
+    pending.append((expected.element, actual.element, False))
+    return True
+
+
+def _same_name_compat(expected: Any, actual: Any, pending: _Pending) -> bool:
+    return expected.name == actual.name  # type: ignore[no-any-return]
+
+
+_SAME_KIND_COMPAT = _by_kind(
+    {
+        PrimitiveType: _primitive_compat,
+        UnitType: lambda expected, actual, pending: True,
+        RecordType: _same_name_compat,
+        AlgebraicType: _algebraic_compat,
+        RefinementType: _same_name_compat,
+        GenericInstance: _generic_compat,
+        FunctionType: _function_compat,
+        ListType: _element_compat,
+        ArrayType: _element_compat,
+    }
+)
 
 
 # ── Type variable resolution ───────────────────────────────
@@ -619,7 +922,7 @@ def substitute_type_vars(ty: Type, bindings: dict[str, Type]) -> Type:
     if isinstance(ty, TypeVariable):
         return bindings.get(ty.name, ty)
     if isinstance(ty, GenericInstance):
-        new_args = [substitute_type_vars(a, bindings) for a in ty.args]
+        new_args = tuple(substitute_type_vars(a, bindings) for a in ty.args)
         return GenericInstance(ty.base_name, new_args)
     if isinstance(ty, ListType):
         return ListType(substitute_type_vars(ty.element, bindings))
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
 from prove.c_compiler import find_c_compiler
 from prove.c_runtime import copy_runtime
+from prove.stdlib_loader import ImportSuggestion, build_import_index
+
+if TYPE_CHECKING:
+    from prove.lsp import DocumentState
 
 
 @pytest.fixture(scope="session")
@@ -25,7 +32,13 @@ def needs_cc(_cc: str | None) -> None:
 
 @pytest.fixture(scope="session")
 def _runtime_dir_session(tmp_path_factory: pytest.TempPathFactory, _cc: str | None) -> Path | None:
-    """Copy runtime files once per session. Returns None when no compiler."""
+    """Copy runtime files once per session. Returns None when no compiler.
+
+    Under pytest-xdist every worker runs its own session with its own
+    ``tmp_path_factory`` base, so each worker gets a private runtime copy
+    (and object files, see ``runtime_helpers.runtime_objects``). Runtime C
+    tests therefore need no xdist group and spread freely across workers.
+    """
     if _cc is None:
         return None
     tmp = tmp_path_factory.mktemp("runtime")
@@ -37,3 +50,29 @@ def _runtime_dir_session(tmp_path_factory: pytest.TempPathFactory, _cc: str | No
 def runtime_dir(_runtime_dir_session: Path | None, needs_cc: None) -> Path | None:
     """Return the session-scoped runtime directory (skips if no compiler)."""
     return _runtime_dir_session
+
+
+@pytest.fixture(scope="session")
+def import_index() -> dict[str, list[ImportSuggestion]]:
+    """Stdlib name → import suggestions, built once per session."""
+    return build_import_index()
+
+
+@pytest.fixture(scope="session")
+def analyze() -> Callable[[str, str], DocumentState]:
+    """``prove.lsp._analyze`` memoized on ``(uri, source)`` for the session.
+
+    Only for tests that inspect the returned state: a cache hit does not
+    refresh the LSP's per-URI document cache.
+    """
+    from prove.lsp import _analyze
+
+    return lru_cache(maxsize=128)(_analyze)
+
+
+@pytest.fixture
+def fresh_pipeline() -> None:
+    """Drop memoized parse/check results for tests that patch the compiler."""
+    from tests.helpers import _pipeline
+
+    _pipeline.cache_clear()
@@ -2,100 +2,223 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
 from prove.ast_nodes import Module
 from prove.checker import Checker
-from prove.errors import Diagnostic
+from prove.errors import Diagnostic, Severity
 from prove.parse import parse
 from prove.symbols import SymbolTable
 
+# Opt-in on-disk cache of pipeline results (PROVE_AST_CACHE=1), so repeat
+# pytest runs skip parsing and checking snippets they have seen before.
+_AST_CACHE_DIR = Path(__file__).resolve().parents[1] / ".pytest_cache" / "prove_ast"
+
+
+class _PipelineResult(NamedTuple):
+    """Parse/check output, with diagnostics grouped once for the assert helpers."""
+
+    module: Module
+    symbols: SymbolTable
+    diagnostics: tuple[Diagnostic, ...]
+    by_code: dict[str, tuple[Diagnostic, ...]]
+    errors: tuple[Diagnostic, ...]
+
+
+@lru_cache(maxsize=1)
+def _compiler_fingerprint() -> str:
+    """Digest of the compiler and stdlib sources, so edits invalidate the disk cache."""
+    import prove
+
+    digest = hashlib.blake2b(digest_size=16)
+    for root, _dirs, files in sorted(os.walk(Path(prove.__file__).parent, followlinks=True)):
+        for name in sorted(files):
+            if name.endswith((".py", ".prv")):
+                st = os.stat(os.path.join(root, name))
+                digest.update(f"{root}/{name}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _pipeline(
+    source: str,
+    legacy_parser: bool = False,
+    lint: bool = True,
+    coherence: bool = False,
+    stop_on: str | None = None,
+) -> _PipelineResult:
+    """Parse and check source once per distinct snippet.
+
+    Many tests feed the same source through several helpers; the AST is
+    frozen and neither the checker helpers, the emitter nor the test
+    generator mutate the symbol table, so the result is shared.
+    *legacy_parser* selects the hand-written Lexer/Parser instead of the
+    tree-sitter front end; *lint* and *stop_on* are passed through to
+    ``Checker.check`` and *coherence* enables the checker's coherence pass.
+    """
+    if os.environ.get("PROVE_AST_CACHE") != "1":
+        return _run_pipeline(source, legacy_parser, lint, coherence, stop_on)
+    key = hashlib.blake2b(
+        f"{_compiler_fingerprint()}\0{legacy_parser}\0{lint}\0{coherence}\0{stop_on}\0"
+        f"{source}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    path = _AST_CACHE_DIR / key
+    try:
+        with path.open("rb") as f:
+            return pickle.load(f)  # type: ignore[no-any-return]
+    except Exception:
+        pass
+    result = _run_pipeline(source, legacy_parser, lint, coherence, stop_on)
+    try:
+        _AST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return result
+
+
+def _run_pipeline(
+    source: str,
+    legacy_parser: bool,
+    lint: bool,
+    coherence: bool = False,
+    stop_on: str | None = None,
+) -> _PipelineResult:
+    if legacy_parser:
+        from prove.lexer import Lexer
+        from prove.parser import Parser
+
+        module = Parser(Lexer(source, "<test>").lex(), "<test>").parse()
+    else:
+        module = parse(source, "<test>")
+    checker = Checker()
+    checker._coherence = coherence
+    symbols = checker.check(module, lint=lint, stop_on=stop_on)
+    by_code: dict[str, list[Diagnostic]] = {}
+    for d in checker.diagnostics:
+        by_code.setdefault(d.code, []).append(d)
+    return _PipelineResult(
+        module,
+        symbols,
+        tuple(checker.diagnostics),
+        {code: tuple(ds) for code, ds in by_code.items()},
+        tuple(d for d in checker.diagnostics if d.severity == Severity.ERROR),
+    )
+
+
+def _expect_code(result: _PipelineResult, code: str, kind: str) -> list[Diagnostic]:
+    matching = list(result.by_code.get(code, ()))
+    assert matching, (
+        f"Expected {kind} {code} but got: "
+        f"{[f'{d.code}: {d.message}' for d in result.diagnostics] or 'no diagnostics'}"
+    )
+    return matching
+
 
 def parse_check(source: str) -> tuple[Module, SymbolTable]:
     """Parse and check source, return (module, symbols)."""
-    module = parse(source, "<test>")
-    checker = Checker()
-    symbols = checker.check(module)
-    assert not checker.has_errors(), [d.message for d in checker.diagnostics]
-    return module, symbols
+    result = _pipeline(source)
+    assert not result.errors, [d.message for d in result.diagnostics]
+    return result.module, result.symbols
+
+
+def emit_c(source: str) -> str:
+    """Parse with the legacy parser, check, and emit C for a Prove source string."""
+    from prove.c_emitter import CEmitter
+
+    result = _pipeline(source, legacy_parser=True)
+    assert not result.errors, [d.message for d in result.diagnostics]
+    return CEmitter(result.module, result.symbols).emit()
+
+
+@lru_cache(maxsize=256)
+def _needle_pattern(ordered: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+
+
+def _find_needles(text: str, needles: tuple[str, ...]) -> set[str]:
+    """Return the needles that occur in *text*, using a single regex scan.
+
+    The alternation is tried longest-first inside a lookahead so that
+    overlapping needles are seen at every position; a needle shadowed by a
+    longer one starting at the same offset falls back to a plain search.
+    """
+    ordered = tuple(sorted(set(needles), key=len, reverse=True))
+    found = {m.group(1) for m in _needle_pattern(ordered).finditer(text)}
+    found.update(n for n in ordered if n not in found and n in text)
+    return found
+
+
+def assert_contains_all(text: str, *needles: str) -> None:
+    """Assert that every needle occurs in *text*."""
+    found = _find_needles(text, needles)
+    missing = [n for n in needles if n not in found]
+    assert not missing, f"missing from output: {missing}"
+
+
+def assert_c_contract(
+    c_code: str, *, requires: tuple[str, ...] = (), forbids: tuple[str, ...] = ()
+) -> None:
+    """Assert every *requires* needle and no *forbids* needle occurs, in one scan."""
+    found = _find_needles(c_code, requires + forbids)
+    missing = [n for n in requires if n not in found]
+    leaked = [n for n in forbids if n in found]
+    assert not missing and not leaked, f"missing: {missing}, unexpected: {leaked}"
 
 
 def check(source: str) -> SymbolTable:
     """Parse and check source, asserting no errors. Returns symbol table."""
-    module = parse(source, "<test>")
-    checker = Checker()
-    st = checker.check(module)
-    errors = [d for d in checker.diagnostics if d.severity.value == "error"]
+    result = _pipeline(source)
+    errors = result.errors
     assert not errors, f"Unexpected errors: {[f'{d.code}: {d.message}' for d in errors]}"
-    return st
+    return result.symbols
 
 
 def check_fails(source: str, error_code: str) -> list[Diagnostic]:
-    """Parse and check source, asserting the given error code appears."""
-    module = parse(source, "<test>")
-    checker = Checker()
-    checker.check(module)
-    matching = [d for d in checker.diagnostics if d.code == error_code]
-    assert matching, (
-        f"Expected error {error_code} but got: "
-        f"{[f'{d.code}: {d.message}' for d in checker.diagnostics] or 'no diagnostics'}"
-    )
-    return matching
+    """Parse and check source, asserting the given error code appears.
+
+    Lint passes only add warnings and info notes, so they are skipped when
+    looking for an error code, and the checker stops at its first instance.
+    """
+    if error_code.startswith("E"):
+        result = _pipeline(source, lint=False, stop_on=error_code)
+    else:
+        result = _pipeline(source)
+    return _expect_code(result, error_code, "error")
 
 
 def check_warns(source: str, warning_code: str) -> list[Diagnostic]:
     """Parse and check source, asserting the given warning code appears."""
-    module = parse(source, "<test>")
-    checker = Checker()
-    checker.check(module)
-    matching = [d for d in checker.diagnostics if d.code == warning_code]
-    assert matching, (
-        f"Expected warning {warning_code} but got: "
-        f"{[f'{d.code}: {d.message}' for d in checker.diagnostics] or 'no diagnostics'}"
-    )
-    return matching
+    return _expect_code(_pipeline(source), warning_code, "warning")
 
 
 def check_info(source: str, info_code: str) -> list[Diagnostic]:
     """Parse and check source, asserting the given info-level diagnostic appears."""
-    module = parse(source, "<test>")
-    checker = Checker()
-    checker.check(module)
-    matching = [d for d in checker.diagnostics if d.code == info_code]
-    assert matching, (
-        f"Expected info {info_code} but got: "
-        f"{[f'{d.code}: {d.message}' for d in checker.diagnostics] or 'no diagnostics'}"
-    )
-    return matching
+    return _expect_code(_pipeline(source), info_code, "info")
 
 
 def check_all(source: str) -> list[Diagnostic]:
     """Parse and check source, return all diagnostics."""
-    module = parse(source, "<test>")
-    checker = Checker()
-    checker.check(module)
-    return list(checker.diagnostics)
+    return list(_pipeline(source).diagnostics)
 
 
 def check_coherence_warns(source: str, warning_code: str) -> list[Diagnostic]:
     """Parse and check source with coherence enabled, asserting the given warning appears."""
-    module = parse(source, "<test>")
-    checker = Checker()
-    checker._coherence = True
-    checker.check(module)
-    matching = [d for d in checker.diagnostics if d.code == warning_code]
-    assert matching, (
-        f"Expected coherence warning {warning_code} but got: "
-        f"{[f'{d.code}: {d.message}' for d in checker.diagnostics] or 'no diagnostics'}"
-    )
-    return matching
+    return _expect_code(_pipeline(source, coherence=True), warning_code, "coherence warning")
 
 
 def check_coherence_ok(source: str) -> None:
     """Parse and check source with coherence enabled, asserting no errors."""
-    module = parse(source, "<test>")
-    checker = Checker()
-    checker._coherence = True
-    checker.check(module)
-    errors = [d for d in checker.diagnostics if d.severity.value == "error"]
+    errors = _pipeline(source, coherence=True).errors
     assert not errors, f"Unexpected errors: {[f'{d.code}: {d.message}' for d in errors]}"
 
 
@@ -103,10 +226,8 @@ def check_and_format(source: str) -> str:
     """Parse, check, and format with diagnostics for auto-fixes."""
     from prove.formatter import ProveFormatter
 
-    module = parse(source, "<test>")
-    checker = Checker()
-    checker.check(module)
+    result = _pipeline(source)
     return ProveFormatter(
-        symbols=checker.symbols,
-        diagnostics=checker.diagnostics,
-    ).format(module)
+        symbols=result.symbols,
+        diagnostics=list(result.diagnostics),
+    ).format(result.module)
@@ -2,50 +2,111 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 from pathlib import Path
 
-from prove.c_compiler import find_c_compiler
+from prove.c_compiler import find_c_compiler, find_ccache
 
+# Exclude external-dep libs — they require vendored/system libraries
+_EXTERNAL_C = frozenset({"prove_gui.c", "prove_prove.c", "prove_sqlite.c"})
 
-def compile_and_run(
+_WARNING_FLAGS = ("-Wall", "-Wextra", "-Wno-unused-parameter")
+
+# Throwaway test builds: no temp files between stages, no debug or unwind info.
+_FAST_BUILD_FLAGS = ("-pipe", "-g0", "-fno-asynchronous-unwind-tables")
+
+# (runtime dir, compiler) -> runtime object files, built once per process.
+_RUNTIME_OBJECTS: dict[tuple[Path, str], list[Path]] = {}
+
+
+def runtime_objects(runtime_dir: Path, cc: str) -> list[Path]:
+    """Compile the core runtime once and return its object files.
+
+    The runtime directory is shared for the whole session, so every test
+    program links these objects instead of recompiling each runtime source.
+    """
+    key = (runtime_dir, cc)
+    objects = _RUNTIME_OBJECTS.get(key)
+    if objects is not None:
+        return objects
+    runtime_c = sorted(f for f in runtime_dir.glob("*.c") if f.name not in _EXTERNAL_C)
+    obj_dir = runtime_dir / "_objects"
+    obj_dir.mkdir(exist_ok=True)
+    flags = ["-c", "-O0", *_FAST_BUILD_FLAGS, *_WARNING_FLAGS, "-I", str(runtime_dir)]
+    if find_ccache() is None:
+        commands = [[cc, *flags, *map(str, runtime_c)]]
+        env = None
+    else:
+        # ccache only caches single-source compiles. CCACHE_BASEDIR rewrites the
+        # per-run temp paths as relative ones so later sessions hit the cache.
+        commands = [["ccache", cc, *flags, str(f)] for f in runtime_c]
+        env = {**os.environ, "CCACHE_BASEDIR": str(runtime_dir)}
+    for cmd in commands:
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=120,
+            cwd=obj_dir,
+            env=env,
+        )
+        assert result.returncode == 0, f"Runtime compile failed:\n{result.stderr.decode()}"
+    objects = [obj_dir / f"{f.stem}.o" for f in runtime_c]
+    _RUNTIME_OBJECTS[key] = objects
+    return objects
+
+
+def compile_program(
     runtime_dir: Path,
     tmp_path: Path,
     c_code: str,
     *,
     name: str = "test",
     extra_flags: list[str] | None = None,
-    args: list[str] | None = None,
     compiler: str | None = None,
-) -> subprocess.CompletedProcess[str]:
-    """Compile a C test program against the runtime and run it."""
+) -> Path:
+    """Compile a C test program against the runtime and return the binary."""
     src = tmp_path / f"{name}.c"
     src.write_text(c_code)
     binary = tmp_path / name
     cc = compiler or find_c_compiler()
     assert cc is not None
 
-    # Exclude external-dep libs — they require vendored/system libraries
-    _EXTERNAL_C = frozenset({"prove_gui.c", "prove_prove.c", "prove_sqlite.c"})
-    runtime_c = sorted(f for f in runtime_dir.glob("*.c") if f.name not in _EXTERNAL_C)
     cmd = [
         cc,
         "-O0",
-        "-Wall",
-        "-Wextra",
-        "-Wno-unused-parameter",
+        *_FAST_BUILD_FLAGS,
+        *_WARNING_FLAGS,
         "-I",
         str(runtime_dir),
         str(src),
-        *[str(f) for f in runtime_c],
+        *[str(f) for f in runtime_objects(runtime_dir, cc)],
         "-o",
         str(binary),
         "-lm",
     ]
     if extra_flags:
         cmd.extend(extra_flags)
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-    assert result.returncode == 0, f"Compile failed:\n{result.stderr}"
+    # The compiler's output only matters on failure: skip stdout, decode stderr lazily.
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=30)
+    assert result.returncode == 0, f"Compile failed:\n{result.stderr.decode()}"
+    return binary
 
+
+def compile_and_run(
+    runtime_dir: Path,
+    tmp_path: Path,
+    c_code: str,
+    *,
+    name: str = "test",
+    extra_flags: list[str] | None = None,
+    args: list[str] | None = None,
+    compiler: str | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Compile a C test program against the runtime and run it."""
+    binary = compile_program(
+        runtime_dir, tmp_path, c_code, name=name, extra_flags=extra_flags, compiler=compiler
+    )
     run_cmd = [str(binary)] + (args or [])
     return subprocess.run(run_cmd, capture_output=True, text=True, timeout=10)
@@ -7,17 +7,12 @@ from prove.domains import get_domain_profile
 from prove.errors import Diagnostic
 from prove.lexer import Lexer
 from prove.parser import Parser
-from tests.helpers import check_warns
+from tests.helpers import _pipeline, check_warns
 
 
 def _check_with_coherence(source: str) -> list[Diagnostic]:
     """Parse and check source with coherence enabled, return all diagnostics."""
-    tokens = Lexer(source, "<test>").lex()
-    module = Parser(tokens, "<test>").parse()
-    checker = Checker()
-    checker._coherence = True
-    checker.check(module)
-    return checker.diagnostics
+    return list(_pipeline(source, legacy_parser=True, coherence=True).diagnostics)
 
 
 class TestDomainProfiles:
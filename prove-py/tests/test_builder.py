@@ -8,35 +8,43 @@ import pytest
 from prove.builder import build_project
 from prove.config import load_config
 
-_EXAMPLES_DIR = Path(__file__).resolve().parent.parent.parent / "examples"
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def hello_project():
-    return _EXAMPLES_DIR / "hello"
+    return Path(__file__).resolve().parents[2] / "examples" / "hello"
+
+
+@pytest.fixture(scope="session")
+def hello_build(hello_project, _cc):
+    """Build examples/hello once; the tests below only inspect or run the result.
+
+    The build writes into the shared examples/hello/build directory, so its
+    users are pinned to one xdist worker via the ``examples_hello`` group.
+    """
+    if _cc is None:
+        pytest.skip("no C compiler available")
+    return build_project(hello_project, load_config(hello_project / "prove.toml"))
 
 
+@pytest.mark.xdist_group("examples_hello")
 class TestBuildHello:
-    def test_build_produces_binary(self, hello_project, needs_cc):
-        config = load_config(hello_project / "prove.toml")
-        result = build_project(hello_project, config)
+    def test_build_produces_binary(self, hello_build):
+        result = hello_build
         assert result.ok, f"Build failed: {result.c_error or result.diagnostics}"
         assert result.binary is not None
         assert result.binary.exists()
 
-    def test_binary_runs_hello(self, hello_project, needs_cc):
-        config = load_config(hello_project / "prove.toml")
-        result = build_project(hello_project, config)
+    def test_binary_runs_hello(self, hello_build):
+        result = hello_build
         assert result.ok, f"Build failed: {result.c_error or result.diagnostics}"
 
         proc = subprocess.run(
             [str(result.binary)],
             capture_output=True,
-            text=True,
             timeout=5,
         )
         assert proc.returncode == 0
-        assert "Hello from Prove!" in proc.stdout
+        assert b"Hello from Prove!" in proc.stdout
 
 
 class TestBuildErrors:
@@ -45,3 +53,18 @@ class TestBuildErrors:
 
         result = build_project(tmp_path, ProveConfig())
         assert not result.ok
+
+
+class TestPureStdlibCache:
+    def test_pure_stdlib_module_is_reused(self):
+        from prove.builder import _compile_pure_stdlib
+        from prove.parse import parse
+
+        module = parse("module Main\n  Log detached info\n", "<test>")
+        first: list = [(module, None)]
+        second: list = [(module, None)]
+        _compile_pure_stdlib(first, [])
+        _compile_pure_stdlib(second, [])
+        assert len(first) == 2
+        assert second[1][0] is first[1][0]
+        assert second[1][1] is first[1][1]
@@ -1,48 +1,84 @@
 """Tests for c_emitter — C source generation from Prove AST."""
 
-from prove.c_emitter import CEmitter
-from prove.checker import Checker
-from prove.lexer import Lexer
-from prove.parser import Parser
-
-
-def _emit(source: str) -> str:
-    """Parse, check, and emit C for a Prove source string."""
-    tokens = Lexer(source, "<test>").lex()
-    module = Parser(tokens, "<test>").parse()
-    checker = Checker()
-    symbols = checker.check(module)
-    assert not checker.has_errors(), [d.message for d in checker.diagnostics]
-    emitter = CEmitter(module, symbols)
-    return emitter.emit()
+import textwrap
+
+import pytest
+
+from tests.helpers import assert_c_contract, assert_contains_all
+from tests.helpers import emit_c as _emit
+
+_FAIL_PROP_SOURCE = textwrap.dedent("""\
+    inputs risky() Result<Integer, Error>!
+        from
+            42
+
+    inputs caller() Result<Integer, Error>!
+        from
+            risky()!
+""")
+
+_TOML_REQUIRES_SOURCE = textwrap.dedent("""\
+    module Main
+      Parse types Toml
+      Parse creates toml, validates toml
+
+    transforms config(data Result<String, Error>) Value<Toml>
+        requires valid toml(data)
+        from
+            toml(data)
+""")
+
+_NONZERO_SOURCE = textwrap.dedent("""\
+    module M
+      type NonZero is Integer where != 0
+    transforms use_nz(n Integer) Integer
+        from
+            nz as NonZero = n
+            nz
+""")
+
+_DIVIDE_SOURCE = textwrap.dedent("""\
+    transforms divide(a Integer, b Integer) Integer
+        from
+            a / b
+""")
+
+_RECURSIVE_EXPR_SOURCE = textwrap.dedent("""\
+    module M
+      type Expr is
+          Literal(value Integer)
+          Add(left Expr, right Expr)
+""")
+
+
+_HELLO_SOURCE = textwrap.dedent("""\
+    module Main
+      System outputs console
+    main() Result<Unit, Error>!
+        from
+            console("Hello from Prove!")
+""")
+
+
+@pytest.fixture(scope="module")
+def hello_c():
+    return _emit(_HELLO_SOURCE)
 
 
 class TestHelloWorld:
-    def test_hello_world_emits(self):
-        source = (
-            "module Main\n"
-            "  System outputs console\n"
-            "main() Result<Unit, Error>!\n"
-            "    from\n"
-            '        console("Hello from Prove!")\n'
-        )
-        c_code = _emit(source)
-        assert "int main(" in c_code
-        assert "prove_println" in c_code
-        assert "Hello from Prove!" in c_code
-        assert "return 0;" in c_code
-
-    def test_includes_runtime_headers(self):
-        source = (
-            "module Main\n"
-            "  System outputs console\n"
-            "main() Result<Unit, Error>!\n"
-            "    from\n"
-            '        console("test")\n'
-        )
-        c_code = _emit(source)
-        assert '#include "prove_runtime.h"' in c_code
-        assert '#include "prove_string.h"' in c_code
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            "int main(",
+            "prove_println",
+            "Hello from Prove!",
+            "return 0;",
+            '#include "prove_runtime.h"',
+            '#include "prove_string.h"',
+        ],
+    )
+    def test_hello_world_contains(self, hello_c, needle):
+        assert needle in hello_c
 
 
 class TestVarDecl:
@@ -99,9 +135,7 @@ class TestFunctionDef:
             "        console(string(add(1, 2)))\n"
         )
         c_code = _emit(source)
-        assert "prv_transforms_add_Integer_Integer" in c_code
-        assert "int64_t a" in c_code
-        assert "int64_t b" in c_code
+        assert_contains_all(c_code, "prv_transforms_add_Integer_Integer", "int64_t a", "int64_t b")
 
 
 class TestStringInterp:
@@ -141,51 +175,48 @@ class TestRetainRelease:
         assert "prove_release(s)" in c_code
 
 
-class TestBuiltinDispatch:
-    def test_string_integer(self):
-        source = (
-            "module T\n  Types reads string\n"
-            "transforms show(x Integer) String\n    from\n        string(x)\n"
-        )
-        c_code = _emit(source)
-        assert "prove_convert_string_int" in c_code
+# string(x) on a parameter of the formatted-in type
+_STRING_OF = (
+    "module T\n  Types reads string\ntransforms show(x {}) String\n    from\n        string(x)\n"
+)
 
-    def test_string_boolean(self):
-        source = (
-            "module T\n  Types reads string\n"
-            "transforms show(x Boolean) String\n    from\n        string(x)\n"
-        )
-        c_code = _emit(source)
-        assert "prove_convert_string_bool" in c_code
 
-    def test_string_decimal(self):
-        source = (
-            "module T\n  Types reads string\n"
-            "transforms show(x Decimal) String\n    from\n        string(x)\n"
-        )
-        c_code = _emit(source)
-        assert "prove_convert_string_float" in c_code
-
-    def test_len_list(self):
-        source = "transforms count() Integer\n    from\n        len([1, 2, 3])\n"
-        c_code = _emit(source)
-        assert "prove_list_len" in c_code
-
-    def test_readln_emits(self):
-        source = (
-            "module Main\n"
-            "  System inputs console\n"
-            "inputs get_name() String\n"
-            "    from\n"
-            "        console()\n"
-        )
-        c_code = _emit(source)
-        assert "prove_readln" in c_code
-
-    def test_clamp_emits(self):
-        source = "transforms safe(x Integer) Integer\n    from\n        clamp(x, 0, 100)\n"
-        c_code = _emit(source)
-        assert "prove_clamp" in c_code
+class TestBuiltinDispatch:
+    @pytest.mark.parametrize(
+        ("source", "needle"),
+        [
+            pytest.param(
+                _STRING_OF.format("Integer"), "prove_convert_string_int", id="string_integer"
+            ),
+            pytest.param(
+                _STRING_OF.format("Boolean"), "prove_convert_string_bool", id="string_boolean"
+            ),
+            pytest.param(
+                _STRING_OF.format("Decimal"), "prove_convert_string_float", id="string_decimal"
+            ),
+            pytest.param(
+                "transforms count() Integer\n    from\n        len([1, 2, 3])\n",
+                "prove_list_len",
+                id="len_list",
+            ),
+            pytest.param(
+                "module Main\n"
+                "  System inputs console\n"
+                "inputs get_name() String\n"
+                "    from\n"
+                "        console()\n",
+                "prove_readln",
+                id="readln",
+            ),
+            pytest.param(
+                "transforms safe(x Integer) Integer\n    from\n        clamp(x, 0, 100)\n",
+                "prove_clamp",
+                id="clamp",
+            ),
+        ],
+    )
+    def test_builtin_emits_runtime_call(self, source, needle):
+        assert needle in _emit(source)
 
 
 class TestMatchExpression:
@@ -205,10 +236,13 @@ class TestMatchExpression:
             '            Blue => "blue"\n'
         )
         c_code = _emit(source)
-        assert "switch" in c_code
-        assert "Prove_Color_TAG_RED" in c_code
-        assert "Prove_Color_TAG_GREEN" in c_code
-        assert "Prove_Color_TAG_BLUE" in c_code
+        assert_contains_all(
+            c_code,
+            "switch",
+            "Prove_Color_TAG_RED",
+            "Prove_Color_TAG_GREEN",
+            "Prove_Color_TAG_BLUE",
+        )
 
     def test_match_with_binding(self):
         source = (
@@ -224,14 +258,13 @@ class TestMatchExpression:
             "            Square(s) => s * s\n"
         )
         c_code = _emit(source)
-        assert "switch" in c_code
-        assert "Prove_Shape_TAG_CIRCLE" in c_code
-        assert "Prove_Shape_TAG_SQUARE" in c_code
-        # Bindings should be declared inside case blocks
-        assert "int64_t r =" in c_code
-        # Match arm bindings should NOT leak to function-level releases
-        assert "prove_release(r)" not in c_code
-        assert "prove_release(s)" not in c_code
+        assert_c_contract(
+            c_code,
+            # Bindings should be declared inside case blocks
+            requires=("switch", "Prove_Shape_TAG_CIRCLE", "Prove_Shape_TAG_SQUARE", "int64_t r ="),
+            # Match arm bindings should NOT leak to function-level releases
+            forbids=("prove_release(r)", "prove_release(s)"),
+        )
 
     def test_match_string_binding_no_leak(self):
         source = (
@@ -247,9 +280,8 @@ class TestMatchExpression:
             '            Post(path) => "POST " + path\n'
         )
         c_code = _emit(source)
-        assert "switch" in c_code
         # path is declared inside case blocks, should not be released at function scope
-        assert "prove_release(path)" not in c_code
+        assert_c_contract(c_code, requires=("switch",), forbids=("prove_release(path)",))
 
 
 class TestAlgebraicConstructors:
@@ -282,9 +314,12 @@ class TestAlgebraicConstructors:
             "        0\n"
         )
         c_code = _emit(source)
-        assert "static inline Prove_Expr Prove_Expr_Num(int64_t val)" in c_code
-        assert "static inline Prove_Expr Prove_Expr_Add(int64_t left, int64_t right)" in c_code
-        assert "_v.tag = Prove_Expr_TAG_NUM;" in c_code
+        assert_contains_all(
+            c_code,
+            "static inline Prove_Expr Prove_Expr_Num(int64_t val)",
+            "static inline Prove_Expr Prove_Expr_Add(int64_t left, int64_t right)",
+            "_v.tag = Prove_Expr_TAG_NUM;",
+        )
 
 
 class TestRecordFieldAccess:
@@ -307,9 +342,7 @@ class TestListLiteralAndIndex:
     def test_list_literal(self):
         source = "transforms nums() List<Integer>\n    from\n        [10, 20, 30]\n"
         c_code = _emit(source)
-        assert "prove_list_new" in c_code
-        assert "prove_list_push" in c_code
-        assert "10L" in c_code
+        assert_contains_all(c_code, "prove_list_new", "prove_list_push", "10L")
 
     def test_list_index(self):
         source = (
@@ -351,29 +384,13 @@ class TestPipeExpression:
 
 class TestFailPropagation:
     def test_fail_prop_emits_result_check(self):
-        source = (
-            "inputs risky() Result<Integer, Error>!\n"
-            "    from\n"
-            "        42\n"
-            "\n"
-            "inputs caller() Result<Integer, Error>!\n"
-            "    from\n"
-            "        risky()!\n"
-        )
+        source = _FAIL_PROP_SOURCE
         c_code = _emit(source)
         assert "Prove_Result" in c_code
         assert "prove_result_is_err" in c_code
 
     def test_fail_prop_unwraps_int(self):
-        source = (
-            "inputs risky() Result<Integer, Error>!\n"
-            "    from\n"
-            "        42\n"
-            "\n"
-            "inputs caller() Result<Integer, Error>!\n"
-            "    from\n"
-            "        risky()!\n"
-        )
+        source = _FAIL_PROP_SOURCE
         c_code = _emit(source)
         assert "prove_result_unwrap_int" in c_code
 
@@ -416,9 +433,7 @@ class TestHigherOrderFunctions:
     def test_map_integer_list(self):
         source = "transforms doubled() List<Integer>\n    from\n        map([1, 2, 3], |x| x * 2)\n"
         c_code = _emit(source)
-        assert "prove_list_map" in c_code
-        assert "_lambda_" in c_code
-        assert '#include "prove_hof.h"' in c_code
+        assert_contains_all(c_code, "prove_list_map", "_lambda_", '#include "prove_hof.h"')
 
     def test_filter_integer_list(self):
         source = (
@@ -434,9 +449,7 @@ class TestHigherOrderFunctions:
         )
         c_code = _emit(source)
         # Lambda reduce is inlined as a for-loop with direct array access
-        assert "for (int64_t" in c_code
-        assert "->data[" in c_code
-        assert "acc" in c_code
+        assert_contains_all(c_code, "for (int64_t", "->data[", "acc")
 
 
 class TestExplainBranching:
@@ -452,12 +465,15 @@ class TestExplainBranching:
             "        0 - n\n"
         )
         c_code = _emit(source)
-        assert "if ((" in c_code
-        assert "n >= 0L" in c_code
-        assert "return n;" in c_code
-        assert "else if ((" in c_code
-        assert "n < 0L" in c_code
-        assert "return (0L - n);" in c_code
+        assert_contains_all(
+            c_code,
+            "if ((",
+            "n >= 0L",
+            "return n;",
+            "else if ((",
+            "n < 0L",
+            "return (0L - n);",
+        )
 
     def test_no_condition_fallback(self):
         """Explain block without when conditions falls through to regular body."""
@@ -561,16 +577,7 @@ class TestRequiresValidRuntimeGuard:
 
     def test_requires_valid_result_param_narrowing(self):
         """requires valid toml(data) should narrow Result<String,Error> to String for overload."""
-        source = (
-            "module Main\n"
-            "  Parse types Toml\n"
-            "  Parse creates toml, validates toml\n"
-            "\n"
-            "transforms config(data Result<String, Error>) Value<Toml>\n"
-            "    requires valid toml(data)\n"
-            "    from\n"
-            "        toml(data)\n"
-        )
+        source = _TOML_REQUIRES_SOURCE
         c_code = _emit(source)
         # Should resolve to creates toml (prove_parse_toml) not tag toml (prove_tag_toml)
         assert "prove_parse_toml" in c_code
@@ -578,16 +585,7 @@ class TestRequiresValidRuntimeGuard:
 
     def test_requires_valid_result_return_unwrap(self):
         """requires valid toml(data) should unwrap Result return to inner type."""
-        source = (
-            "module Main\n"
-            "  Parse types Toml\n"
-            "  Parse creates toml, validates toml\n"
-            "\n"
-            "transforms config(data Result<String, Error>) Value<Toml>\n"
-            "    requires valid toml(data)\n"
-            "    from\n"
-            "        toml(data)\n"
-        )
+        source = _TOML_REQUIRES_SOURCE
         c_code = _emit(source)
         # Result should be unwrapped via prove_result_unwrap_*
         assert "prove_result_unwrap_ptr" in c_code
@@ -785,14 +783,7 @@ class TestRefinementTypeValidation:
 
     def test_not_equal_constraint(self):
         """Comparison constraint like Integer where != 0."""
-        source = (
-            "module M\n"
-            "  type NonZero is Integer where != 0\n"
-            "transforms use_nz(n Integer) Integer\n"
-            "    from\n"
-            "        nz as NonZero = n\n"
-            "        nz\n"
-        )
+        source = _NONZERO_SOURCE
         c_code = _emit(source)
         assert "prove_panic" in c_code
         assert "!=" in c_code
@@ -817,7 +808,7 @@ class TestDivisionGuards:
 
     def test_variable_divisor_gets_guard(self):
         """Division by a variable emits a panic guard."""
-        source = "transforms divide(a Integer, b Integer) Integer\n    from\n        a / b\n"
+        source = _DIVIDE_SOURCE
         c_code = _emit(source)
         assert 'prove_panic("division by zero' in c_code
 
@@ -840,7 +831,7 @@ class TestDivisionGuards:
 
     def test_division_guard_behind_prove_release(self):
         """Variable divisor guard is wrapped in #ifndef PROVE_RELEASE."""
-        source = "transforms divide(a Integer, b Integer) Integer\n    from\n        a / b\n"
+        source = _DIVIDE_SOURCE
         c_code = _emit(source)
         assert "#ifndef PROVE_RELEASE" in c_code
 
@@ -850,14 +841,7 @@ class TestRefinementProveRelease:
 
     def test_pure_refinement_behind_release(self):
         """Pure function refinement guard is wrapped in #ifndef PROVE_RELEASE."""
-        source = (
-            "module M\n"
-            "  type NonZero is Integer where != 0\n"
-            "transforms use_nz(n Integer) Integer\n"
-            "    from\n"
-            "        nz as NonZero = n\n"
-            "        nz\n"
-        )
+        source = _NONZERO_SOURCE
         c_code = _emit(source)
         assert "#ifndef PROVE_RELEASE" in c_code
         assert "prove_panic" in c_code
@@ -920,12 +904,7 @@ class TestRecursiveVariantEmission:
     """Test C emission for recursive variant types."""
 
     def test_recursive_struct_has_pointer_fields(self):
-        source = (
-            "module M\n"
-            "  type Expr is\n"
-            "      Literal(value Integer)\n"
-            "      Add(left Expr, right Expr)\n"
-        )
+        source = _RECURSIVE_EXPR_SOURCE
         c_code = _emit(source)
         # Recursive fields should be pointers
         assert "Prove_Expr *left;" in c_code
@@ -934,12 +913,7 @@ class TestRecursiveVariantEmission:
         assert "int64_t value;" in c_code
 
     def test_recursive_constructor_takes_pointer_params(self):
-        source = (
-            "module M\n"
-            "  type Expr is\n"
-            "      Literal(value Integer)\n"
-            "      Add(left Expr, right Expr)\n"
-        )
+        source = _RECURSIVE_EXPR_SOURCE
         c_code = _emit(source)
         # Add constructor should take pointer params
         assert "Prove_Expr *left, Prove_Expr *right" in c_code
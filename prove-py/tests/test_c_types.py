@@ -24,6 +24,10 @@ class TestMapType:
         assert ct.decl == "int64_t"
         assert ct.is_pointer is False
 
+    def test_repeat_lookup_is_memoized(self):
+        assert map_type(INTEGER) is map_type(INTEGER)
+        assert map_type(STRING) is map_type(STRING)
+
     def test_integer_32_unsigned(self):
         ty = PrimitiveType("Integer", ((None, "32"), (None, "Unsigned")))
         ct = map_type(ty)
@@ -133,6 +137,18 @@ class TestMangling:
         result = mangle_name("inputs", "main")
         assert result == "prv_inputs_main"
 
+    def test_mangle_name_is_memoized_per_signature(self):
+        first = mangle_name("transforms", "add", [INTEGER, INTEGER], module="math")
+        assert first == "prv_math_transforms_add_Integer_Integer"
+        assert mangle_name("transforms", "add", [INTEGER, INTEGER], module="math") is first
+        assert mangle_name("transforms", "add", [INTEGER, STRING]) == (
+            "prv_transforms_add_Integer_String"
+        )
+
     def test_mangle_type_name(self):
         assert mangle_type_name("Point") == "Prove_Point"
         assert mangle_type_name("Shape") == "Prove_Shape"
+
+    def test_mangle_type_name_sanitizes_generic_spelling(self):
+        assert mangle_type_name("Option<Integer>") == "Prove_Option_Integer_"
+        assert mangle_type_name("Table<String, Value>") == "Prove_Table_String_Value_"
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import pickle
+
+import pytest
+
 from prove.source import Span
 from prove.symbols import FunctionSignature, SymbolTable
 from prove.types import (
@@ -31,6 +35,35 @@ class TestNameResolution:
             "E310",
         )
 
+    def test_stop_on_ends_check_at_first_matching_error(self):
+        from prove.checker import Checker
+        from prove.parse import parse
+
+        source = (
+            "transforms a() Integer\n    from\n        first_missing\n"
+            "transforms b() Integer\n    from\n        second_missing\n"
+        )
+        checker = Checker()
+        checker.check(parse(source, "<test>"), stop_on="E310")
+        assert [d.code for d in checker.diagnostics if d.code == "E310"] == ["E310"]
+        assert "first_missing" in checker.diagnostics[-1].message
+
+    def test_stop_on_waits_for_speculative_diagnostics_to_be_kept(self):
+        from prove.checker import Checker, _StopChecking
+
+        checker = Checker()
+        checker._stop_on = "E310"
+        checker._speculative = 1
+        # Emitted during speculative inference: must not end the check yet
+        checker._error("E310", "undefined name 'later'", Span("<test>", 1, 1, 1, 1))
+        checker._speculative = 0
+        # Kept once the speculative section commits
+        with pytest.raises(_StopChecking):
+            checker._commit_speculative(0)
+        # Rolled back instead: nothing left to stop on
+        del checker.diagnostics[:]
+        checker._commit_speculative(0)
+
     def test_forward_reference_function(self):
         """Functions registered in pass 1 can be called from other functions."""
         check(
@@ -123,6 +156,13 @@ class TestCallChecking:
     def test_builtin_len(self):
         check("transforms count() Integer\n    from\n        len([1, 2, 3])\n")
 
+    def test_shared_builtin_extra_types_are_read_only(self):
+        from prove.checker import _builtin_tables
+
+        extra_types = _builtin_tables()[2]
+        with pytest.raises(TypeError):
+            extra_types[("len", 0)] = frozenset()  # type: ignore[index]
+
 
 class TestFieldAccess:
     """Test field access on records."""
@@ -376,6 +416,21 @@ class TestUnusedType:
             "        Point(0, 0)\n",
         )
 
+    def test_lint_false_skips_unused_type(self):
+        """check(lint=False) drops lint notes but keeps the symbol table."""
+        from prove.checker import Checker
+        from prove.parse import parse
+
+        module = parse(
+            "module M\n  type Unused is\n    x Integer\n\ntransforms one() Integer\n"
+            "    from\n        1\n",
+            "<test>",
+        )
+        checker = Checker()
+        symbols = checker.check(module, lint=False)
+        assert not [d for d in checker.diagnostics if d.code == "I303"]
+        assert symbols.resolve_function("transforms", "one", 0) is not None
+
 
 class TestLookupTable:
     """Tests for [Lookup] type modifier checking (E375, E376, E377, E378)."""
@@ -550,6 +605,63 @@ class TestFunctionResolutionArity:
         result = st.resolve_function("transforms", "process", 1)
         assert result is sig2
 
+    def test_arity_is_precomputed(self):
+        sig = FunctionSignature(
+            verb=None,
+            name="pair",
+            param_names=["a", "b"],
+            param_types=[INTEGER, STRING],
+            return_type=INTEGER,
+            can_fail=False,
+            span=Span("<test>", 0, 0, 1, 1),
+        )
+        assert sig.arity == 2
+        assert "arity" not in repr(sig)
+
+    def test_builtin_signatures_are_shared(self):
+        from prove.checker import Checker
+
+        first, second = Checker(), Checker()
+        first._register_builtins()
+        second._register_builtins()
+        sig = first.symbols.resolve_function(None, "map", 2)
+        assert sig is not None
+        assert second.symbols.resolve_function(None, "map", 2) is sig
+        assert first.symbols.resolve_type("List") is second.symbols.resolve_type("List")
+
+    def test_all_functions_is_read_only_live_view(self):
+        st = SymbolTable()
+        view = st.all_functions()
+        sig = FunctionSignature(
+            verb=None,
+            name="later",
+            param_names=[],
+            param_types=[],
+            return_type=INTEGER,
+            can_fail=False,
+            span=Span("<test>", 0, 0, 1, 1),
+        )
+        st.define_function(sig)
+        assert view[(None, "later")] == [sig]
+        with pytest.raises(TypeError):
+            view[(None, "other")] = []  # type: ignore[index]
+
+    def test_all_types_is_read_only_live_view(self):
+        st = SymbolTable()
+        view = st.all_types()
+        st.define_type("Later", INTEGER)
+        assert view["Later"] is INTEGER
+        with pytest.raises(TypeError):
+            view["Other"] = INTEGER  # type: ignore[index]
+
+    def test_symbol_table_survives_pickle(self):
+        st = check("transforms double(x Integer) Integer\n    from\n        x * 2\n")
+        restored = pickle.loads(pickle.dumps(st))
+        assert restored.lookup("double") is not None
+        assert restored.resolve_function("transforms", "double", 1) is not None
+        assert ("transforms", "double") in restored.all_functions()
+        assert "Integer" in restored.all_types()
+
 
 # ── Fix: arity mismatch falls through to resolve_function_any ────────
 
@@ -257,19 +257,6 @@ class TestMatchRestriction:
             "I367",
         )
 
-    def test_match_in_matches_ok(self):
-        """match in matches body is allowed (no I367)."""
-        check(
-            "module M\n"
-            "  type Color is Red | Green | Blue\n"
-            "matches name(c Color) String\n"
-            "    from\n"
-            "        match c\n"
-            '            Red => "red"\n'
-            '            Green => "green"\n'
-            '            Blue => "blue"\n'
-        )
-
     def test_match_in_validates_info(self):
         """I367: match in validates body produces info (4+ arms)."""
         check_info(
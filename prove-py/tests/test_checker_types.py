@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+import typing
+
 from prove.types import (
     BOOLEAN,
     DECIMAL,
+    ERROR_TY,
+    FLOAT,
     INTEGER,
     STRING,
+    UNIT,
     AlgebraicType,
     EffectType,
+    ErrorType,
+    FunctionType,
     GenericInstance,
+    ListType,
     PrimitiveType,
     RecordType,
     RefinementType,
+    StructType,
+    Type,
+    UnitType,
+    VariantInfo,
+    clear_compat_cache,
     get_scale,
+    numeric_widen,
     type_name,
     types_compatible,
 )
@@ -189,6 +205,23 @@ class TestModifiedTypeCompat:
         prim = PrimitiveType("Shape", ((None, "Mutable"),))
         assert types_compatible(alg, prim)
 
+    def test_algebraic_variant_names_are_precomputed(self):
+        alg = AlgebraicType("Shape", [VariantInfo("Circle", {}), VariantInfo("Square", {})])
+        assert alg.variant_names == frozenset({"Circle", "Square"})
+        assert "variant_names" not in repr(alg)
+        assert alg == AlgebraicType("Shape", (VariantInfo("Circle", {}), VariantInfo("Square", {})))
+        assert pickle.loads(pickle.dumps(alg)).variant_names == alg.variant_names
+
+    def test_algebraic_variant_bits_follow_declaration_order(self):
+        alg = AlgebraicType("Shape", [VariantInfo("Circle", {}), VariantInfo("Square", {})])
+        assert alg.variant_bits == {"Circle": 1, "Square": 2}
+
+    def test_algebraic_variant_by_name(self):
+        circle = VariantInfo("Circle", {"radius": INTEGER})
+        alg = AlgebraicType("Shape", [circle, VariantInfo("Square", {})])
+        assert alg.variant_by_name["Circle"] is circle
+        assert alg.variant_by_name.get("Triangle") is None
+
     def test_name_mismatch_still_fails(self):
         rec = RecordType("User", {"name": STRING})
         prim = PrimitiveType("Admin", ((None, "Mutable"),))
@@ -202,6 +235,121 @@ class TestModifiedTypeCompat:
         assert types_compatible(rec, prim)
 
 
+class TestHashConsing:
+    """Structurally identical types share a single object."""
+
+    def test_primitive_is_builtin_singleton(self):
+        assert PrimitiveType("Integer") is INTEGER
+
+    def test_nested_types_are_shared(self):
+        assert ListType(GenericInstance("Option", [STRING])) is ListType(
+            GenericInstance("Option", [STRING])
+        )
+
+    def test_modifiers_are_distinguished(self):
+        assert PrimitiveType("Decimal", (("Scale", "2"),)) is not DECIMAL
+
+    def test_primitive_equality_is_identity(self):
+        scaled = PrimitiveType("Decimal", [("Scale", "2")])
+        assert scaled is PrimitiveType("Decimal", (("Scale", "2"),))
+        assert pickle.loads(pickle.dumps(scaled)) is scaled
+        assert PrimitiveType.__eq__ is object.__eq__
+
+    def test_stateless_types_are_singletons(self):
+        assert ErrorType() is ERROR_TY
+        assert UnitType() is UNIT
+        assert copy.deepcopy(ERROR_TY) is ERROR_TY
+        assert pickle.loads(pickle.dumps(UNIT)) is UNIT
+
+    def test_kind_tags_index_the_type_union(self):
+        kinds = sorted(cls.kind for cls in typing.get_args(Type))
+        assert kinds == list(range(len(kinds)))
+
+    def test_instances_are_slotted(self):
+        assert not hasattr(INTEGER, "__dict__")
+        assert not hasattr(GenericInstance("Option", [STRING]), "__dict__")
+
+    def test_sequence_fields_are_stored_as_tuples(self):
+        gi = GenericInstance("List", [INTEGER])
+        assert gi.args == (INTEGER,)
+        assert gi is GenericInstance("List", (INTEGER,))
+
+
+class TestCompatCache:
+    """types_compatible memoizes results by operand identity."""
+
+    def test_repeated_query_is_stable(self):
+        option_int = GenericInstance("Option", [INTEGER])
+        assert types_compatible(option_int, INTEGER) is True
+        assert types_compatible(option_int, INTEGER) is True
+        assert types_compatible(option_int, STRING) is False
+        assert types_compatible(option_int, STRING) is False
+
+    def test_covariance_is_part_of_key(self):
+        option_int = GenericInstance("Option", [INTEGER])
+        assert types_compatible(option_int, INTEGER) is True
+        assert types_compatible(option_int, INTEGER, covariant=False) is False
+
+    def test_clear_forgets_results(self):
+        rec = RecordType("User", {"name": STRING})
+        assert types_compatible(rec, INTEGER) is False
+        clear_compat_cache()
+        assert types_compatible(rec, INTEGER) is False
+
+    def test_type_name_is_memoized(self):
+        fn = FunctionType((ListType(INTEGER),), GenericInstance("Option", [STRING]))
+        first = type_name(fn)
+        assert first == "(List<Integer>) -> Option<String>"
+        assert type_name(fn) is first
+
+    def test_deep_nesting_does_not_recurse(self):
+        expected: ListType | PrimitiveType = INTEGER
+        actual: ListType | PrimitiveType | RefinementType = RefinementType("Pos", INTEGER)
+        for _ in range(400):
+            expected, actual = ListType(expected), ListType(actual)
+        assert types_compatible(expected, actual)
+        assert not types_compatible(expected, ListType(actual))
+
+
+class TestNumericWiden:
+    """numeric_widen picks the wider numeric operand."""
+
+    def test_builtins_widen(self):
+        assert numeric_widen(INTEGER, DECIMAL) is DECIMAL
+        assert numeric_widen(FLOAT, INTEGER) is FLOAT
+
+    def test_modified_primitive_widens_by_name(self):
+        scaled = PrimitiveType("Decimal", (("Scale", "2"),))
+        assert numeric_widen(INTEGER, scaled) is scaled
+
+    def test_refinement_unwraps_to_base(self):
+        price = RefinementType("Price", DECIMAL)
+        assert numeric_widen(price, INTEGER) is price
+
+    def test_chained_refinement_unwraps_to_root(self):
+        small = RefinementType("SmallPrice", RefinementType("Price", DECIMAL))
+        assert numeric_widen(FLOAT, small) is FLOAT
+        assert numeric_widen(small, INTEGER) is small
+
+    def test_non_numeric_is_none(self):
+        assert numeric_widen(INTEGER, STRING) is None
+        assert numeric_widen(RecordType("Integer", {}), INTEGER) is None
+
+    def test_unhashable_struct_is_none(self):
+        entity = StructType({"age": INTEGER})
+        assert numeric_widen(entity, INTEGER) is None
+        assert numeric_widen(INTEGER, entity) is None
+
+    def test_struct_arithmetic_is_type_mismatch(self):
+        check_fails(
+            "transforms bump(entity Struct, n Integer) Integer\n"
+            "    with entity.age Integer\n"
+            "    from\n"
+            "        entity + n\n",
+            "E320",
+        )
+
+
 # ── Fix: Option<Refinement(Value)> compatibility ─────────────────────────
 
 
@@ -18,14 +18,16 @@ from prove.errors import (
 from prove.source import SourceFile, Span
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner():
+    """One CliRunner for the module; it holds no per-invocation state."""
     return CliRunner()
 
 
-@pytest.fixture
-def tmp_project(tmp_path):
-    """Create a minimal prove project in a temp dir."""
+@pytest.fixture(scope="module")
+def tmp_project(tmp_path_factory):
+    """Create a minimal prove project once per module; tests must not modify it."""
+    tmp_path = tmp_path_factory.mktemp("project")
     toml = tmp_path / "prove.toml"
     toml.write_text(
         '[package]\nname = "testproj"\nversion = "1.0.0"\n'
@@ -130,6 +132,17 @@ class TestConfig:
         assert config.build.target == "native"
         assert config.test.property_rounds == 1000
 
+    def test_load_config_rereads_after_edit(self, tmp_path):
+        toml = tmp_path / "prove.toml"
+        toml.write_text('[package]\nname = "first"\n')
+        first = load_config(toml)
+        first.package.authors.append("mutated")
+        toml.write_text('[package]\nname = "renamed"\nauthors = ["a"]\n')
+        second = load_config(toml)
+        assert second.package.name == "renamed"
+        assert second.package.authors == ["a"]
+        assert load_config(toml) is not second
+
     def test_find_config(self, tmp_project):
         # find_config from a subdirectory should find prove.toml in parent
         sub = tmp_project / "src"
@@ -239,6 +252,14 @@ class TestDiagnosticNotes:
         assert any("E310" in r for r in rendered)
         assert any("did you mean" in r for r in rendered)
 
+    def test_fuzzy_match_picks_closest_within_distance(self):
+        from prove.checker import Checker
+
+        candidates = {"counter", "count", "amount", "x"}
+        assert Checker._fuzzy_match("coutn", candidates) == "count"
+        assert Checker._fuzzy_match("countxr", candidates) == "counter"
+        assert Checker._fuzzy_match("zzzzzz", candidates) is None
+
     def test_wrong_arg_count_shows_signature(self):
         from prove.checker import Checker
         from prove.lexer import Lexer
@@ -1,5 +1,10 @@
 """Tests for the foreign block (C FFI) feature."""
 
+import subprocess
+from functools import lru_cache
+
+import pytest
+
 from prove.ast_nodes import ForeignBlock, ModuleDecl
 from prove.c_emitter import CEmitter
 from prove.checker import Checker
@@ -29,6 +34,36 @@ def _emit(source: str) -> str:
     return emitter.emit()
 
 
+_emit_cached = lru_cache(maxsize=None)(_emit)
+
+
+_SQRT_SRC = (
+    "module Math\n"
+    '  foreign "libm"\n'
+    "    sqrt(x Float) Float\n"
+    "\n"
+    "transforms root(x Float) Float\n"
+    "    from\n"
+    "        sqrt(x)\n"
+)
+
+_MULTI_LIB_SRC = (
+    "module Sys\n"
+    '  foreign "libm"\n'
+    "    sqrt(x Float) Float\n"
+    '  foreign "libpthread"\n'
+    "    pthread_self() Integer\n"
+)
+
+
+@pytest.fixture(scope="module")
+def sqrt_pipeline() -> dict:
+    """Check and emit the canonical libm ``sqrt`` module once per module."""
+    module, symbols, checker = _check(_SQRT_SRC)
+    c_code = CEmitter(module, symbols).emit() if not checker.has_errors() else ""
+    return {"module": module, "symbols": symbols, "checker": checker, "c_code": c_code}
+
+
 # ── Parser tests ──────────────────────────────────────────────────
 
 
@@ -88,63 +123,49 @@ class TestForeignParser:
 
 
 class TestForeignChecker:
-    def test_foreign_functions_registered(self):
-        source = 'module Math\n  foreign "libm"\n    sqrt(x Float) Float\n'
-        _module, symbols, checker = _check(source)
-        assert not checker.has_errors()
-        sig = symbols.resolve_function(None, "sqrt", 1)
+    def test_foreign_functions_registered(self, sqrt_pipeline):
+        assert not sqrt_pipeline["checker"].has_errors()
+        sig = sqrt_pipeline["symbols"].resolve_function(None, "sqrt", 1)
         assert sig is not None
         assert sig.name == "sqrt"
 
-    def test_foreign_callable_from_function(self):
-        source = (
-            "module Math\n"
-            '  foreign "libm"\n'
-            "    sqrt(x Float) Float\n"
-            "\n"
-            "transforms root(x Float) Float\n"
-            "    from\n"
-            "        sqrt(x)\n"
-        )
-        _module, _symbols, checker = _check(source)
-        assert not checker.has_errors()
+    def test_foreign_callable_from_function(self, sqrt_pipeline):
+        checker = sqrt_pipeline["checker"]
+        assert not checker.has_errors(), [d.message for d in checker.diagnostics]
 
 
 # ── Emitter tests ─────────────────────────────────────────────────
 
 
 class TestForeignEmitter:
-    def test_direct_call_no_mangling(self):
-        source = (
-            "module Math\n"
-            '  foreign "libm"\n'
-            "    sqrt(x Float) Float\n"
-            "\n"
-            "transforms root(x Float) Float\n"
-            "    from\n"
-            "        sqrt(x)\n"
-        )
-        c_code = _emit(source)
+    def test_direct_call_no_mangling(self, sqrt_pipeline):
+        c_code = sqrt_pipeline["c_code"]
         # sqrt should appear as a direct C call, not prv_sqrt or prv_None_sqrt
         assert "sqrt(x)" in c_code
         assert "prv_" not in c_code or "prv_transforms_root" in c_code
 
-    def test_math_header_included(self):
-        source = 'module Math\n  foreign "libm"\n    sqrt(x Float) Float\n'
-        c_code = _emit(source)
-        assert "#include <math.h>" in c_code
-
-    def test_multiple_libs_headers(self):
-        source = (
-            "module Sys\n"
-            '  foreign "libm"\n'
-            "    sqrt(x Float) Float\n"
-            '  foreign "libpthread"\n'
-            "    pthread_self() Integer\n"
-        )
-        c_code = _emit(source)
-        assert "#include <math.h>" in c_code
-        assert "#include <pthread.h>" in c_code
+    def test_math_header_included(self, sqrt_pipeline):
+        assert "#include <math.h>" in sqrt_pipeline["c_code"]
+
+    @pytest.mark.parametrize(
+        ("source", "header"),
+        [
+            pytest.param(_MULTI_LIB_SRC, "#include <math.h>", id="multi-libm"),
+            pytest.param(_MULTI_LIB_SRC, "#include <pthread.h>", id="multi-pthread"),
+            pytest.param(
+                'module PyBind\n  foreign "libpython3"\n    pyinit() Integer\n',
+                "#include <Python.h>",
+                id="python3",
+            ),
+            pytest.param(
+                'module JvmBind\n  foreign "libjvm"\n    createvm() Integer\n',
+                "#include <jni.h>",
+                id="jvm",
+            ),
+        ],
+    )
+    def test_library_header_included(self, source: str, header: str):
+        assert header in _emit_cached(source)
 
 
 # ── Formatter tests ───────────────────────────────────────────────
@@ -234,66 +255,60 @@ class TestForeignConfig:
         assert config.build.link_flags == []
 
 
-# ── Header emission tests ────────────────────────────────────────
+# ── pkg-config resolution tests ──────────────────────────────────
 
 
-class TestForeignHeaders:
-    def test_python3_header_included(self):
-        source = 'module PyBind\n  foreign "libpython3"\n    pyinit() Integer\n'
-        c_code = _emit(source)
-        assert "#include <Python.h>" in c_code
+class _FakeRun:
+    """Stand-in for subprocess.run that records calls and returns a canned result."""
 
-    def test_jvm_header_included(self):
-        source = 'module JvmBind\n  foreign "libjvm"\n    createvm() Integer\n'
-        c_code = _emit(source)
-        assert "#include <jni.h>" in c_code
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], dict[str, object]]] = []
+        self.returncode = 0
+        self.stdout = ""
+        self.error: type[BaseException] | None = None
 
+    def __call__(self, args: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        self.calls.append((args, kwargs))
+        if self.error is not None:
+            raise self.error
+        return subprocess.CompletedProcess(args, self.returncode, stdout=self.stdout)
 
-# ── pkg-config resolution tests ──────────────────────────────────
 
+@pytest.fixture
+def fake_run(monkeypatch: pytest.MonkeyPatch) -> _FakeRun:
+    fake = _FakeRun()
+    monkeypatch.setattr(subprocess, "run", fake)
+    return fake
 
-class TestResolveForeignFlags:
-    def test_pkg_config_success(self):
-        from unittest.mock import MagicMock, patch
 
+class TestResolveForeignFlags:
+    def test_pkg_config_success(self, fake_run):
         from prove.builder import _resolve_foreign_flags
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "-I/usr/include/python3.12 -lpython3.12\n"
-
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            c_flags, l_flags = _resolve_foreign_flags("libpython3")
-            mock_run.assert_called_once_with(
+        fake_run.stdout = "-I/usr/include/python3.12 -lpython3.12\n"
+        c_flags, l_flags = _resolve_foreign_flags("libpython3")
+        assert fake_run.calls == [
+            (
                 ["pkg-config", "--cflags", "--libs", "python3-embed"],
-                capture_output=True,
-                text=True,
-                timeout=5,
+                {"capture_output": True, "text": True, "timeout": 5},
             )
+        ]
         assert c_flags == ["-I/usr/include/python3.12"]
         assert l_flags == ["-lpython3.12"]
 
-    def test_pkg_config_failure_falls_back(self):
-        from unittest.mock import MagicMock, patch
-
+    def test_pkg_config_failure_falls_back(self, fake_run):
         from prove.builder import _resolve_foreign_flags
 
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            c_flags, l_flags = _resolve_foreign_flags("libpython3")
+        fake_run.returncode = 1
+        c_flags, l_flags = _resolve_foreign_flags("libpython3")
         assert c_flags == []
         assert l_flags == ["-lpython3"]
 
-    def test_pkg_config_not_found_falls_back(self):
-        from unittest.mock import patch
-
+    def test_pkg_config_not_found_falls_back(self, fake_run):
         from prove.builder import _resolve_foreign_flags
 
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            c_flags, l_flags = _resolve_foreign_flags("libjvm")
+        fake_run.error = FileNotFoundError
+        c_flags, l_flags = _resolve_foreign_flags("libjvm")
         assert c_flags == []
         assert l_flags == ["-ljvm"]
 
@@ -350,20 +365,14 @@ class TestResolveForeignFlags:
         assert c_flags == ["-I/usr/lib/jvm/include"]
         assert l_flags == ["-L/usr/lib/jvm/lib", "-ljvm"]
 
-    def test_empty_env_vars_fall_through(self, monkeypatch):
+    def test_empty_env_vars_fall_through(self, monkeypatch, fake_run):
         """Empty env vars should not short-circuit — fall through to pkg-config."""
-        from unittest.mock import MagicMock, patch
-
         from prove.builder import _resolve_foreign_flags
 
         monkeypatch.setenv("PROVE_PYTHON_CFLAGS", "")
         monkeypatch.setenv("PROVE_PYTHON_LDFLAGS", "")
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "-I/usr/include/python3.12 -lpython3.12\n"
-
-        with patch("subprocess.run", return_value=mock_result):
-            c_flags, l_flags = _resolve_foreign_flags("libpython3")
+        fake_run.stdout = "-I/usr/include/python3.12 -lpython3.12\n"
+        c_flags, l_flags = _resolve_foreign_flags("libpython3")
         assert c_flags == ["-I/usr/include/python3.12"]
         assert l_flags == ["-lpython3.12"]
@@ -2,20 +2,83 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+import pytest
+
+from prove.errors import CompileError
 from prove.lexer import Lexer
-from prove.tokens import TokenKind
+from prove.tokens import NEWLINE_SUPPRESSED_AFTER, NEWLINE_SUPPRESSED_MASK, Token, TokenKind
+
+# Reserved words that each lex to a single token.
+_KEYWORDS = (
+    "transforms",
+    "inputs",
+    "outputs",
+    "validates",
+    "main",
+    "from",
+    "type",
+    "is",
+    "as",
+    "with",
+    "use",
+    "where",
+    "match",
+    "comptime",
+    "valid",
+    "module",
+    "domain",
+    "ensures",
+    "requires",
+    "when",
+)
+
+# Reasoning and intent keywords.
+_AI_RESISTANCE_KEYWORDS = (
+    "why_not",
+    "chosen",
+    "near_miss",
+    "know",
+    "assume",
+    "believe",
+    "intent",
+    "narrative",
+    "temporal",
+    "satisfies",
+    "invariant_network",
+)
+
+# Binary operators after which a line break does not end the statement.
+_SUPPRESSING_OPS = ("+", "-", "*", "/", "==", "!=", "&&", "||")
+_OP_KINDS = frozenset(
+    {
+        TokenKind.PLUS,
+        TokenKind.MINUS,
+        TokenKind.STAR,
+        TokenKind.SLASH,
+        TokenKind.EQUAL,
+        TokenKind.NOT_EQUAL,
+        TokenKind.AND,
+        TokenKind.OR,
+    }
+)
+
+
+@lru_cache(maxsize=512)
+def _lex_cached(source: str) -> tuple[Token, ...]:
+    """Lex source once; tests share the immutable token tuple."""
+    return tuple(Lexer(source).lex())
 
 
 def lex(source: str) -> list[tuple[TokenKind, str]]:
     """Helper: lex source and return (kind, value) pairs, excluding EOF."""
-    tokens = Lexer(source).lex()
-    return [(t.kind, t.value) for t in tokens if t.kind != TokenKind.EOF]
+    return [(t.kind, t.value) for t in _lex_cached(source) if t.kind != TokenKind.EOF]
 
 
 def kinds(source: str) -> list[TokenKind]:
     """Helper: lex source and return just the token kinds, excluding EOF."""
-    tokens = Lexer(source).lex()
-    return [t.kind for t in tokens if t.kind != TokenKind.EOF]
+    return [t.kind for t in _lex_cached(source) if t.kind != TokenKind.EOF]
 
 
 class TestLexerBasic:
@@ -36,32 +99,17 @@ class TestLexerBasic:
         result = lex("my_var_123")
         assert result == [(TokenKind.IDENTIFIER, "my_var_123")]
 
-    def test_keywords(self):
-        for kw in [
-            "transforms",
-            "inputs",
-            "outputs",
-            "validates",
-            "main",
-            "from",
-            "type",
-            "is",
-            "as",
-            "with",
-            "use",
-            "where",
-            "match",
-            "comptime",
-            "valid",
-            "module",
-            "domain",
-            "ensures",
-            "requires",
-            "when",
-        ]:
-            result = lex(kw)
-            assert len(result) == 1, f"keyword {kw} should lex to one token"
-            assert result[0][1] == kw
+    def test_identifier_span_columns(self):
+        tokens = Lexer("ab  Type_1 main").lex()
+        spans = [(t.value, t.span.start_col, t.span.end_col) for t in tokens[:3]]
+        assert spans == [("ab", 1, 2), ("Type_1", 5, 10), ("main", 12, 15)]
+        assert tokens[2].kind == TokenKind.MAIN
+
+    @pytest.mark.parametrize("kw", _KEYWORDS)
+    def test_keywords(self, kw):
+        result = lex(kw)
+        assert len(result) == 1
+        assert result[0][1] == kw
 
     def test_when_keyword(self):
         result = lex("when")
@@ -87,22 +135,10 @@ class TestLexerBasic:
         result = lex("HTTP2")
         assert result == [(TokenKind.CONSTANT_IDENTIFIER, "HTTP2")]
 
-    def test_ai_resistance_keywords(self):
-        for kw in [
-            "why_not",
-            "chosen",
-            "near_miss",
-            "know",
-            "assume",
-            "believe",
-            "intent",
-            "narrative",
-            "temporal",
-            "satisfies",
-            "invariant_network",
-        ]:
-            result = lex(kw)
-            assert len(result) == 1, f"keyword {kw} should lex to one token"
+    @pytest.mark.parametrize("kw", _AI_RESISTANCE_KEYWORDS)
+    def test_ai_resistance_keywords(self, kw):
+        result = lex(kw)
+        assert len(result) == 1
 
 
 class TestLexerLiterals:
@@ -178,19 +214,19 @@ class TestLexerLiterals:
         assert kinds[0] == TokenKind.IDENTIFIER
 
     def test_unknown_escape_error(self):
-        import pytest
-
-        from prove.errors import CompileError
-
         with pytest.raises(CompileError):
-            from prove.lexer import Lexer
-
             Lexer(r'"\d"').lex()
 
     def test_triple_string(self):
         result = lex('"""hello\nworld"""')
         assert result == [(TokenKind.TRIPLE_STRING_LIT, "hello\nworld")]
 
+    def test_triple_string_span_tracks_lines(self):
+        tokens = _lex_cached('x """a\nbc""" y // note\nz')
+        spans = [(t.value, t.span.start_line, t.span.start_col) for t in tokens[:4]]
+        assert spans == [("x", 1, 1), ("a\nbc", 1, 3), ("y", 2, 7), ("note", 2, 9)]
+        assert tokens[-2].span.start_line == 3
+
     def test_char_literal(self):
         result = lex("'A'")
         assert result == [(TokenKind.CHAR_LIT, "A")]
@@ -228,8 +264,9 @@ class TestLexerLiterals:
 
 
 class TestLexerOperators:
-    def test_single_char_operators(self):
-        ops = [
+    @pytest.mark.parametrize(
+        ("text", "expected_kind"),
+        [
             ("+", TokenKind.PLUS),
             ("-", TokenKind.MINUS),
             ("*", TokenKind.STAR),
@@ -239,13 +276,15 @@ class TestLexerOperators:
             ("!", TokenKind.BANG),
             ("=", TokenKind.ASSIGN),
             (".", TokenKind.DOT),
-        ]
-        for text, expected_kind in ops:
-            result = lex(text)
-            assert result[0][0] == expected_kind, f"operator {text}"
-
-    def test_two_char_operators(self):
-        ops = [
+        ],
+    )
+    def test_single_char_operators(self, text, expected_kind):
+        result = lex(text)
+        assert result[0][0] == expected_kind, f"operator {text}"
+
+    @pytest.mark.parametrize(
+        ("text", "expected_kind"),
+        [
             ("==", TokenKind.EQUAL),
             ("!=", TokenKind.NOT_EQUAL),
             ("<=", TokenKind.LESS_EQUAL),
@@ -256,13 +295,15 @@ class TestLexerOperators:
             ("=>", TokenKind.FAT_ARROW),
             ("..", TokenKind.DOT_DOT),
             ("->", TokenKind.ARROW),
-        ]
-        for text, expected_kind in ops:
-            result = lex(text)
-            assert result[0][0] == expected_kind, f"operator {text}"
-
-    def test_punctuation(self):
-        ops = [
+        ],
+    )
+    def test_two_char_operators(self, text, expected_kind):
+        result = lex(text)
+        assert result[0][0] == expected_kind, f"operator {text}"
+
+    @pytest.mark.parametrize(
+        ("text", "expected_kind"),
+        [
             ("(", TokenKind.LPAREN),
             (")", TokenKind.RPAREN),
             ("[", TokenKind.LBRACKET),
@@ -270,10 +311,11 @@ class TestLexerOperators:
             (",", TokenKind.COMMA),
             (":", TokenKind.COLON),
             ("|", TokenKind.PIPE),
-        ]
-        for text, expected_kind in ops:
-            result = lex(text)
-            assert result[0][0] == expected_kind, f"punctuation {text}"
+        ],
+    )
+    def test_punctuation(self, text, expected_kind):
+        result = lex(text)
+        assert result[0][0] == expected_kind, f"punctuation {text}"
 
     def test_bang_vs_not_equal(self):
         result = lex("!=")
@@ -327,23 +369,14 @@ class TestLexerNewlines:
         assert newline_absent or newline_after_id
 
     def test_suppressed_after_operator(self):
-        for op in ["+", "-", "*", "/", "==", "!=", "&&", "||"]:
+        for op in _SUPPRESSING_OPS:
             source = f"a {op}\nb\n"
             k = kinds(source)
             # There should be no NEWLINE between the operator and b
             # (the newline after 'b' is fine)
             op_idx = None
             for i, kind in enumerate(k):
-                if kind in (
-                    TokenKind.PLUS,
-                    TokenKind.MINUS,
-                    TokenKind.STAR,
-                    TokenKind.SLASH,
-                    TokenKind.EQUAL,
-                    TokenKind.NOT_EQUAL,
-                    TokenKind.AND,
-                    TokenKind.OR,
-                ):
+                if kind in _OP_KINDS:
                     op_idx = i
                     break
             if op_idx is not None:
@@ -371,6 +404,11 @@ class TestLexerNewlines:
         pa_idx = k.index(TokenKind.PIPE_ARROW)
         assert k[pa_idx + 1] != TokenKind.NEWLINE
 
+    def test_suppression_mask_matches_set(self):
+        for kind in TokenKind:
+            in_mask = bool((NEWLINE_SUPPRESSED_MASK >> kind) & 1)
+            assert in_mask == (kind in NEWLINE_SUPPRESSED_AFTER), kind.name
+
 
 class TestLexerComments:
     def test_doc_comment_preserved(self):
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
+import pytest
 from lsprotocol import types as lsp
 
+import prove.lsp as lsp_mod
 from prove.errors import Severity
 from prove.lsp import (
     _SEVERITY_MAP,
@@ -23,11 +26,22 @@ from prove.lsp import (
     _ProjectIndexer,
     _types_display,
     completion,
+    inlay_hint,
     span_to_range,
 )
 from prove.source import Span
-from prove.stdlib_loader import ImportSuggestion, build_import_index
+from prove.stdlib_loader import ImportSuggestion
 from prove.symbols import FunctionSignature
+from prove.types import INTEGER, STRING
+
+
+@pytest.fixture(autouse=True)
+def lsp_state(monkeypatch: pytest.MonkeyPatch) -> dict[str, DocumentState]:
+    """Give each test its own LSP document caches, so no test cleans up after itself."""
+    state: dict[str, DocumentState] = {}
+    monkeypatch.setattr(lsp_mod, "_state", state)
+    monkeypatch.setattr(lsp_mod, "_intent_state", {})
+    return state
 
 
 class TestSpanConversion:
@@ -92,8 +106,6 @@ class TestGetWordAt:
 
 class TestTypesDisplay:
     def test_simple_function(self):
-        from prove.types import INTEGER
-
         dummy = Span("<test>", 0, 0, 0, 0)
         sig = FunctionSignature(
             verb="transforms",
@@ -110,8 +122,6 @@ class TestTypesDisplay:
         assert "Integer" in result
 
     def test_failable_function(self):
-        from prove.types import STRING
-
         dummy = Span("<test>", 0, 0, 0, 0)
         sig = FunctionSignature(
             verb="inputs",
@@ -126,8 +136,24 @@ class TestTypesDisplay:
         assert result.endswith("!")
 
 
+_ADD_SRC = "module Main\ntransforms add(a Integer, b Integer) Integer\nfrom\n    a + b\n"
+
+
+@pytest.fixture(scope="module")
+def base_add_ds(analyze) -> DocumentState:
+    """The valid single-function module shared by the import-edit tests.
+
+    Module scope sets this up before the per-test ``lsp_state`` patch, so the
+    LSP caches are swapped out here too and the real ones stay untouched.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(lsp_mod, "_state", {})
+        mp.setattr(lsp_mod, "_intent_state", {})
+        return analyze("file:///base_add.prv", _ADD_SRC)
+
+
 class TestAnalyze:
-    def test_analyze_valid_source(self):
+    def test_analyze_valid_source(self, analyze):
         source = (
             "module Main\n"
             '  narrative: """Transforms numbers via add operations"""\n'
@@ -136,33 +162,29 @@ class TestAnalyze:
             "from\n"
             "    a + b\n"
         )
-        ds = _analyze("file:///test.prv", source)
+        ds = analyze("file:///test.prv", source)
         assert ds.module is not None
         assert ds.symbols is not None
         # No errors (info/warning coherence hints are acceptable)
         assert not any(d.severity == lsp.DiagnosticSeverity.Error for d in ds.diagnostics)
 
-    def test_analyze_with_errors(self):
+    def test_analyze_with_errors(self, analyze):
         source = "transforms add(a Integer, b Integer) Integer\nfrom\n    unknown_var\n"
-        ds = _analyze("file:///test.prv", source)
+        ds = analyze("file:///test.prv", source)
         assert ds.module is not None
         assert len(ds.diagnostics) > 0
         assert any("E310" in d.message for d in ds.diagnostics)
 
-    def test_analyze_lex_error(self):
+    def test_analyze_lex_error(self, analyze):
         source = "@@@ invalid tokens\n"
-        ds = _analyze("file:///test.prv", source)
+        ds = analyze("file:///test.prv", source)
         assert len(ds.diagnostics) > 0
 
-    def test_analyze_caches_state(self):
-        from prove.lsp import _state
-
+    def test_analyze_caches_state(self, lsp_state):
         source = 'module Main\n  System outputs console\nmain()\nfrom\n    console("hi")\n'
         uri = "file:///cache_test.prv"
         ds = _analyze(uri, source)
-        assert _state.get(uri) is ds
-        # Clean up
-        _state.pop(uri, None)
+        assert lsp_state.get(uri) is ds
 
 
 class TestDocumentState:
@@ -176,24 +198,21 @@ class TestDocumentState:
 
 
 class TestBuildImportIndex:
-    def test_index_contains_console(self):
-        index = build_import_index()
-        assert "console" in index
-        suggestions = index["console"]
+    def test_index_contains_console(self, import_index):
+        assert "console" in import_index
+        suggestions = import_index["console"]
         assert any(s.module == "System" and s.verb == "outputs" for s in suggestions)
 
-    def test_index_contains_file(self):
-        index = build_import_index()
-        assert "file" in index
-        suggestions = index["file"]
+    def test_index_contains_file(self, import_index):
+        assert "file" in import_index
+        suggestions = import_index["file"]
         assert any(s.module == "System" and s.verb == "inputs" for s in suggestions)
 
-    def test_index_no_duplicates_from_aliases(self):
-        index = build_import_index()
+    def test_index_no_duplicates_from_aliases(self, import_index):
         # file has inputs + outputs verbs = 2 entries, but no duplicates from aliases
-        if "file" in index:
+        if "file" in import_index:
             # Each entry should have a unique (module, verb) pair
-            pairs = [(s.module, s.verb) for s in index["file"]]
+            pairs = [(s.module, s.verb) for s in import_index["file"]]
             assert len(pairs) == len(set(pairs))
 
 
@@ -234,24 +253,21 @@ class TestExtractUndefinedName:
 
 
 class TestBuildImportEdit:
-    def _make_ds(self, source: str) -> DocumentState:
-        return _analyze("file:///test_import.prv", source)
+    _URI = "file:///test_import.prv"
 
-    def test_new_import_in_module(self):
-        source = "module Main\ntransforms add(a Integer, b Integer) Integer\nfrom\n    a + b\n"
-        ds = self._make_ds(source)
+    def test_new_import_in_module(self, base_add_ds):
         suggestion = ImportSuggestion(module="System", verb="outputs", name="console")
-        edit = _build_import_edit(ds, suggestion)
+        edit = _build_import_edit(base_add_ds, suggestion)
         assert edit is not None
         assert "System outputs console" in edit.new_text
         # Should insert after the module line
         assert edit.range.start.line == 1
 
-    def test_extend_existing_import(self):
+    def test_extend_existing_import(self, analyze):
         source = (
             'module Main\n  System outputs console\noutputs run() Unit\nfrom\n    console("hi")\n'
         )
-        ds = self._make_ds(source)
+        ds = analyze(self._URI, source)
         suggestion = ImportSuggestion(module="System", verb="outputs", name="file")
         edit = _build_import_edit(ds, suggestion)
         assert edit is not None
@@ -259,11 +275,11 @@ class TestBuildImportEdit:
         # Should replace line 1 (the existing import line)
         assert edit.range.start.line == 1
 
-    def test_already_imported_returns_none(self):
+    def test_already_imported_returns_none(self, analyze):
         source = (
             'module Main\n  System outputs console\noutputs run() Unit\nfrom\n    console("hi")\n'
         )
-        ds = self._make_ds(source)
+        ds = analyze(self._URI, source)
         suggestion = ImportSuggestion(module="System", verb="outputs", name="console")
         edit = _build_import_edit(ds, suggestion)
         assert edit is None
@@ -297,11 +313,11 @@ class TestBuildImportEdit:
         assert "Pattern derives string" in edit.new_text
         assert edit.range.start.line == 4
 
-    def test_extend_existing_import_different_verb(self):
+    def test_extend_existing_import_different_verb(self, analyze):
         source = (
             'module Main\n  System outputs console\noutputs run() Unit\nfrom\n    console("hi")\n'
         )
-        ds = self._make_ds(source)
+        ds = analyze(self._URI, source)
         suggestion = ImportSuggestion(module="System", verb="inputs", name="file")
         edit = _build_import_edit(ds, suggestion)
         assert edit is not None
@@ -634,8 +650,6 @@ class TestProjectIndexerCacheValidity:
 
     def test_stale_after_file_change(self, tmp_path: Path):
         """is_cache_valid returns False after a tracked file changes."""
-        import time
-
         prv = tmp_path / "main.prv"
         (tmp_path / "prove.toml").write_text("[package]\nname = 'test'\n")
         prv.write_text("module Main\n")
@@ -706,8 +720,6 @@ class TestProjectIndexerLoad:
 
     def test_warm_start_skips_reindex(self, tmp_path: Path):
         """_ensure_project_indexed uses load() when cache is valid."""
-        import prove.lsp as lsp_mod
-
         (tmp_path / "prove.toml").write_text("[package]\nname = 'test'\n")
         (tmp_path / "main.prv").write_text("module Main\n")
         # Build cache
@@ -858,8 +870,6 @@ class TestInlayHint:
         )
 
     def test_inlay_hint_untyped_var(self):
-        from prove.lsp import inlay_hint
-
         source = (
             "module Main\n"
             '  narrative: """Test"""\n'
@@ -880,8 +890,6 @@ class TestInlayHint:
         assert hint.position.character == 10  # 4 spaces indent + len("result")
 
     def test_inlay_hint_typed_var_suppressed(self):
-        from prove.lsp import inlay_hint
-
         source = (
             "module Main\n"
             '  narrative: """Test"""\n'
@@ -898,16 +906,11 @@ class TestInlayHint:
         assert hints is None or not any(h.label == " Integer" for h in hints)
 
     def test_inlay_hint_no_module(self):
-        from prove.lsp import _state, inlay_hint
-
         uri = "file:///nonexistent.prv"
-        _state.pop(uri, None)
         hints = inlay_hint(self._make_params(uri))
         assert hints is None
 
     def test_inlay_hint_kind_is_type(self):
-        from prove.lsp import inlay_hint
-
         source = (
             "module Main\n"
             '  narrative: """Test"""\n'
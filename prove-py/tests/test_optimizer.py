@@ -31,6 +31,8 @@ from prove.source import Span
 from prove.symbols import SymbolTable
 
 _SPAN = Span(file="<test>", start_line=1, start_col=1, end_line=1, end_col=1)
+# SimpleType is frozen, so every helper-built function and param can share it
+_INTEGER_TYPE = SimpleType("Integer", _SPAN)
 
 
 def _make_func(
@@ -45,7 +47,7 @@ def _make_func(
         verb=verb,
         name=name,
         params=params or [],
-        return_type=SimpleType("Integer", _SPAN),
+        return_type=_INTEGER_TYPE,
         can_fail=False,
         ensures=[],
         requires=[],
@@ -76,7 +78,7 @@ def _make_module(*decls) -> Module:
 
 
 def _make_param(name: str) -> Param:
-    return Param(name=name, type_expr=SimpleType("Integer", _SPAN), constraint=None, span=_SPAN)
+    return Param(name=name, type_expr=_INTEGER_TYPE, constraint=None, span=_SPAN)
 
 
 # ── TCO tests ─────────────────────────────────────────────────────
@@ -156,6 +158,18 @@ class TestTCO:
         assert len(new_fd.body) == 1
         assert isinstance(new_fd.body[0], ExprStmt)  # unchanged
 
+    def test_untouched_module_is_returned_as_is(self):
+        """Passes that change nothing hand back the input nodes, not copies."""
+        body = [ExprStmt(IntegerLit("42", _SPAN), _SPAN)]
+        # outputs is not a pure verb, so the inliner has no candidates either
+        fd = _make_func("answer", verb="outputs", body=body)
+        module = _make_module(fd)
+
+        result = Optimizer(module, SymbolTable()).optimize()
+
+        assert result is module
+        assert result.declarations[0] is fd
+
     def test_no_terminates_unchanged(self):
         """A recursive function without `terminates` should not be optimized."""
         recursive_call = CallExpr(
@@ -178,6 +192,24 @@ class TestTCO:
         assert isinstance(new_fd, FunctionDef)
         assert not any(isinstance(s, TailLoop) for s in new_fd.body)
 
+    def test_non_tail_recursion_unchanged(self):
+        """A self-call that is not in tail position leaves the function alone."""
+        n = IdentifierExpr("n", _SPAN)
+        recursive_call = CallExpr(func=IdentifierExpr("sum", _SPAN), args=[n], span=_SPAN)
+        # sum(n) + n: the call's result is still used after it returns
+        fd = _make_func(
+            "sum",
+            params=[_make_param("n")],
+            body=[ExprStmt(BinaryExpr(recursive_call, "+", n, _SPAN), _SPAN)],
+            terminates=n,
+        )
+
+        result = Optimizer(_make_module(fd), SymbolTable()).optimize()
+
+        new_fd = result.declarations[0]
+        assert isinstance(new_fd, FunctionDef)
+        assert new_fd.body == fd.body
+
 
 class TestTCOIntegration:
     """Integration test: compile and run a TCO-optimized program."""
@@ -226,11 +258,10 @@ class TestTCOIntegration:
         proc = subprocess.run(
             [str(result.binary)],
             capture_output=True,
-            text=True,
             timeout=10,
         )
         assert proc.returncode == 0
-        assert "100000" in proc.stdout
+        assert b"100000" in proc.stdout
 
     def test_factorial_c_has_while(self, tmp_path, needs_cc):
         """Verify the C output contains 'while (1)' for a TCO'd function."""
@@ -422,6 +453,44 @@ class TestInlining:
         # Should still be a CallExpr (not CT-evaluated because recursive)
         assert isinstance(stmt.expr, CallExpr)
 
+    def test_caller_of_candidate_not_inlined(self):
+        """A candidate that calls another candidate is not inlined itself."""
+        x = IdentifierExpr("x", _SPAN)
+        inc_fd = _make_func(
+            "inc",
+            params=[_make_param("x")],
+            body=[ExprStmt(BinaryExpr(x, "+", IntegerLit("1", _SPAN), _SPAN), _SPAN)],
+        )
+        inc_call = CallExpr(func=IdentifierExpr("inc", _SPAN), args=[x], span=_SPAN)
+        twice_fd = _make_func(
+            "twice",
+            params=[_make_param("x")],
+            body=[ExprStmt(BinaryExpr(inc_call, "*", IntegerLit("2", _SPAN), _SPAN), _SPAN)],
+        )
+        call = CallExpr(
+            func=IdentifierExpr("twice", _SPAN),
+            args=[IdentifierExpr("y", _SPAN)],
+            span=_SPAN,
+        )
+        main = MainDef(
+            return_type=None,
+            can_fail=False,
+            body=[ExprStmt(call, _SPAN)],
+            doc_comment=None,
+            span=_SPAN,
+        )
+
+        result = Optimizer(_make_module(inc_fd, twice_fd, main), SymbolTable()).optimize()
+
+        decls = {getattr(d, "name", "main"): d for d in result.declarations}
+        # inc is inlined into twice, but twice stays a call from main
+        twice_expr = decls["twice"].body[0].expr
+        assert isinstance(twice_expr, BinaryExpr)
+        assert not isinstance(twice_expr.left, CallExpr)
+        main_stmt = decls["main"].body[0]
+        assert isinstance(main_stmt.expr, CallExpr)
+        assert main_stmt.expr.func.name == "twice"
+
 
 # ── Match Compilation tests ───────────────────────────────────────
 
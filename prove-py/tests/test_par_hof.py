@@ -225,18 +225,6 @@ class TestParEachChecker:
         """par_each with lambda callback passes type check."""
         check("outputs caller(xs List<Integer>) Unit\n    from\n        par_each(xs, |n| n)\n")
 
-    def test_par_each_infers_unit_return(self):
-        """par_each returns Unit regardless of callback return type."""
-        check(
-            "outputs log_item(n Integer) Integer\n"
-            "    from\n"
-            "        n\n"
-            "\n"
-            "outputs caller(xs List<Integer>) Unit\n"
-            "    from\n"
-            "        par_each(xs, log_item)\n"
-        )
-
     def test_par_each_rejects_async_detached_callback(self):
         """par_each with detached verb callback emits E369."""
         check_fails(
@@ -96,11 +96,15 @@ def _compile_and_run_prove(
     return subprocess.run([str(binary)], capture_output=True, text=True, timeout=10)
 
 
-@pytest.fixture
-def _vendor_tree_sitter(runtime_dir: Path) -> None:
-    """Copy prove_prove + vendored tree-sitter-prove files into the runtime_dir fixture."""
+@pytest.fixture(scope="module")
+def _vendor_tree_sitter(_runtime_dir_session: Path | None) -> None:
+    """Copy prove_prove + vendored tree-sitter-prove files into the shared runtime once."""
     import shutil
 
+    runtime_dir = _runtime_dir_session
+    if runtime_dir is None:
+        return  # no compiler; the runtime_dir fixture skips each test
+
     rt_src = Path(__file__).parent.parent / "src" / "prove" / "runtime"
     vendor_src = rt_src / "vendor"
     ts_prove_src = vendor_src / "tree_sitter_prove"
@@ -13,10 +13,9 @@ from prove.c_runtime import copy_runtime
 
 
 @pytest.fixture(scope="session")
-def sqlite_runtime_dir(tmp_path_factory: pytest.TempPathFactory) -> Path | None:
+def sqlite_runtime_dir(tmp_path_factory: pytest.TempPathFactory, _cc: str | None) -> Path | None:
     """Copy runtime + vendor sqlite files for SQLite testing."""
-    cc = find_c_compiler()
-    if cc is None:
+    if _cc is None:
         return None
     tmp = tmp_path_factory.mktemp("sqlite_runtime")
     copy_runtime(tmp, stdlib_libs={"prove_sqlite"})
@@ -13,9 +13,13 @@ from prove.stdlib_loader import (
     _MODULE_DISPLAY_NAMES,
     _STDLIB_MODULES,
     _parse_stdlib_module,
+    _read_precompiled,
+    build_import_index,
     load_stdlib,
     load_stdlib_constants,
+    write_precompiled_cache,
 )
+from prove.types import BOOLEAN
 
 # Canonical modules (exclude alias keys like "listutils" → "list_utils.prv")
 _CANONICAL = [k for k in _STDLIB_MODULES if k not in _ALIAS_KEYS]
@@ -86,3 +90,39 @@ class TestLoadStdlibConstants:
         """Modules with only functions should return no constants."""
         consts = load_stdlib_constants("math")
         assert consts == []
+
+
+class TestPrecompiledCache:
+    """Test the pickled stdlib sidecar written at build time."""
+
+    def test_round_trip_matches_lazy_load(self, tmp_path):
+        out = write_precompiled_cache(tmp_path / "stdlib.pkl")
+        payload = _read_precompiled(out.read_bytes())
+        assert payload is not None
+        assert payload["signatures"]["math"] == load_stdlib("math")
+        assert payload["import_index"] == build_import_index()
+
+    def test_round_trip_keeps_type_singletons(self, tmp_path):
+        out = write_precompiled_cache(tmp_path / "stdlib.pkl")
+        payload = _read_precompiled(out.read_bytes())
+        assert payload is not None
+        validators = [
+            sig
+            for sigs in payload["signatures"].values()
+            for sig in sigs
+            if sig.verb == "validates" and sig.return_type == BOOLEAN
+        ]
+        assert validators
+        assert all(sig.return_type is BOOLEAN for sig in validators)
+
+    def test_garbage_is_ignored(self):
+        assert _read_precompiled(b"not a pickle") is None
+
+    def test_other_compiler_version_is_stale(self, tmp_path, monkeypatch):
+        out = write_precompiled_cache(tmp_path / "stdlib.pkl")
+        monkeypatch.setattr("prove.__version__", "0.0.0-other")
+        assert _read_precompiled(out.read_bytes()) is None
+
+    def test_write_leaves_no_temp_file(self, tmp_path):
+        write_precompiled_cache(tmp_path / "stdlib.pkl")
+        assert [p.name for p in tmp_path.iterdir()] == ["stdlib.pkl"]